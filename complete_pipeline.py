@@ -6,13 +6,16 @@ Runs the full integration pipeline and generates the final enhanced output with
 
 import pandas as pd
 import sys
+import argparse
 from pathlib import Path
 from datetime import datetime
 
-# Add current directory to path
-sys.path.append('core')
+# Put core/ first on the path so its modules win over the stale copies in the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'core'))
 
-def run_complete_pipeline():
+def run_complete_pipeline(max_workers=None, use_cache=True, incremental=False, compact=False,
+                          gdc_offline=False, gdc_refresh=False, gdc_ttl_hours=24, gdc_fetch='auto',
+                          gdc_snapshot=True):
     """Run the complete pipeline and generate enhanced output"""
     
     print("🚀 COMPLETE PIPELINE WITH ENHANCED OUTPUT GENERATION")
@@ -23,8 +26,8 @@ def run_complete_pipeline():
         print("\n📊 Step 1: Running Fresh Integration with Contractor Standardization")
         from universal_data_integration import DataIntegrationEngine
         
-        engine = DataIntegrationEngine()
-        df = engine.integrate_all_sources()
+        engine = DataIntegrationEngine(max_workers=max_workers, use_cache=use_cache, compact=compact)
+        df = engine.integrate_all_sources(incremental=incremental)
         print(f"   ✅ Integrated {len(df)} records, {len(df.columns)} columns")
         print(f"   � Fresh integration with latest standardizations")
         
@@ -32,7 +35,9 @@ def run_complete_pipeline():
         print(f"\n🎯 Step 2: Running GDC Enhancement with Well Data")
         from gdc_enhancement import enhance_with_gdc
         
-        enhanced_df, stats = enhance_with_gdc(df, Path('core'))
+        enhanced_df, stats = enhance_with_gdc(df, Path('core'), offline=gdc_offline, refresh=gdc_refresh,
+                                              snapshot_ttl_hours=gdc_ttl_hours, fetch_mode=gdc_fetch,
+                                              use_snapshot=gdc_snapshot)
         
         print(f"\n📈 GDC Enhancement Results:")
         print(f"   🔢 Total records processed: {stats.get('total_records', 0)}")
@@ -60,13 +65,12 @@ def run_complete_pipeline():
         
         # Ensure key identifier fields are properly formatted as strings
         print(f"   🔧 Ensuring key fields are exported as strings...")
+        from vector_ops import normalize_identifiers
         string_fields = ['license_number', 'bit_serial_number', 'uwi_number', 'uwi_formatted', 'well_name']
         for field in string_fields:
             if field in enhanced_df.columns:
-                # Convert to string, handling NaN values appropriately
-                enhanced_df[field] = enhanced_df[field].astype('object').fillna('').astype(str)
-                # Replace 'nan' strings with actual NaN for clean output
-                enhanced_df[field] = enhanced_df[field].replace('nan', pd.NA)
+                # Nullable strings: no '.0' on numeric ids, leading zeros kept, blanks -> NA
+                enhanced_df[field] = normalize_identifiers(enhanced_df[field])
                 print(f"      ✅ {field}: converted to string format")
         
         # Create output filename with timestamp
@@ -78,8 +82,9 @@ def run_complete_pipeline():
         # to preserve their string nature and prevent scientific notation
         print(f"   🔧 Preparing CSV export with string preservation...")
         
-        # Create a copy for CSV export with explicit string formatting
-        csv_df = enhanced_df.copy()
+        # Create a copy for CSV export with explicit string formatting, with the
+        # source file provenance joined back on from the engine's file metadata
+        csv_df = engine.with_file_metadata(enhanced_df)
         
         # For critical numeric strings like bit_serial_number, add leading zeros or quotes if needed
         # to ensure they're treated as strings in CSV readers
@@ -154,7 +159,34 @@ def run_complete_pipeline():
         return False
 
 if __name__ == "__main__":
-    success = run_complete_pipeline()
+    parser = argparse.ArgumentParser(description="Run the complete integration and GDC enhancement pipeline")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Worker processes for parallel workbook ingestion (default: CPU count)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Re-parse every input workbook instead of using the parse cache")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Only integrate new or changed input files, reusing earlier partitions")
+    parser.add_argument('--compact', action='store_true',
+                        help="Downcast numeric fields (float32/Int16) per the configured precision policies")
+    parser.add_argument('--gdc-offline', action='store_true',
+                        help="Enhance from the local GDC snapshot only, without connecting to the database")
+    parser.add_argument('--gdc-refresh', action='store_true',
+                        help="Force a full GDC fetch instead of reusing or incrementally refreshing the snapshot")
+    parser.add_argument('--gdc-ttl', type=float, default=24,
+                        help="Hours a GDC snapshot is used before it is refreshed from the database (default: 24)")
+    parser.add_argument('--gdc-fetch', choices=['auto', 'full', 'targeted'], default='auto',
+                        help="Pull all AB/BC wells, only the wells of the data's licenses, or choose by license "
+                             "count; with a snapshot (the default) auto always pulls all wells to keep it complete, "
+                             "so auto picks targeted only with --no-gdc-snapshot")
+    parser.add_argument('--no-gdc-snapshot', action='store_true',
+                        help="Query GDC every run without keeping a local snapshot")
+    args = parser.parse_args()
+    
+    success = run_complete_pipeline(max_workers=args.workers, use_cache=not args.no_cache,
+                                    incremental=args.incremental, compact=args.compact,
+                                    gdc_offline=args.gdc_offline, gdc_refresh=args.gdc_refresh,
+                                    gdc_ttl_hours=args.gdc_ttl, gdc_fetch=args.gdc_fetch,
+                                    gdc_snapshot=not args.no_gdc_snapshot)
     if success:
         print(f"\n🚀 PIPELINE COMPLETED SUCCESSFULLY!")
     else:
@@ -10,6 +10,7 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional, Any
 import pandas as pd
 from pathlib import Path
+from excel_readers import DEFAULT_READER_ENGINE
 
 @dataclass
 class FieldMapping:
@@ -18,7 +19,17 @@ class FieldMapping:
     description: str
     data_type: str  # 'string', 'numeric', 'date', 'boolean'
     required: bool = False
+    storage: Optional[str] = None  # pandas dtype the integrated frame stores it as ('category', 'string', 'int64', ...); None keeps the inferred dtype
+    unit: Optional[str] = None  # unit the integrated frame stores a measurement in (see unit_conversion.UNITS)
     
+@dataclass
+class UnitRule:
+    """Rows of a field whose value lies below/above a threshold are in another unit (mixed files)"""
+    field: str  # standard field name
+    unit: str  # unit of the matching rows
+    below: Optional[float] = None  # rows with value < below match
+    above: Optional[float] = None  # rows with value > above match
+
 @dataclass
 class SourceConfig:
     """Configuration for a specific data source"""
@@ -29,34 +40,61 @@ class SourceConfig:
     sheet_name: Optional[str] = None  # None means use first sheet or detect
     skip_rows: int = 0
     column_mappings: Optional[Dict[str, str]] = None  # standard_name -> source_column_name
+    extra_columns: Optional[List[str]] = None  # unmapped source columns to keep when reads are projected
+    reader_engine: Optional[str] = None  # Excel backend ('calamine', 'openpyxl'); None uses the global default
+    transform_steps: Optional[List[str]] = None  # registered standardization steps run in order (standardization_steps)
+    field_units: Optional[Dict[str, str]] = None  # standard_name -> unit the source delivers it in; omitted fields are already standard
+    unit_rules: Optional[List[UnitRule]] = None  # per-row unit detection for mixed files, checked in order
+    date_formats: Optional[Dict[str, str]] = None  # standard_name -> strftime format or 'excel_serial'; omitted fields infer the format
+
+@dataclass
+class BitSizeBand:
+    """A bit size range (mm) and the category/class assigned to sizes inside it"""
+    label: str
+    bit_class: str  # 'Common' or 'Other'
+    lower: Optional[float] = None  # None means unbounded below
+    upper: Optional[float] = None  # None means unbounded above
+    closed: str = 'both'  # which bounds are inclusive: 'both', 'left', 'right', 'neither'
+    
+@dataclass
+class PrecisionPolicy:
+    """Compact-mode dtype of a numeric field and the value range it is declared valid for"""
+    dtype: str  # 'float32' or a nullable integer dtype ('Int16', 'Int32', ...)
+    lower: Optional[float] = None  # None means unbounded below
+    upper: Optional[float] = None  # None means unbounded above
     
 class DataMappingConfig:
     """Central configuration for data source mapping and integration"""
     
     def __init__(self):
+        # Excel backend for sources that don't set SourceConfig.reader_engine;
+        # falls back to openpyxl when calamine is not installed
+        self.default_reader_engine = DEFAULT_READER_ENGINE
         self.standard_fields = self._define_standard_fields()
         self.data_sources = self._define_data_sources()
         self.data_categories = self._define_data_categories()
+        self.bit_size_bands = self._define_bit_size_bands()
+        self.precision_policies = self._define_precision_policies()
     
     def _define_standard_fields(self) -> Dict[str, FieldMapping]:
         """Define the standardized field schema"""
         return {
             # === WELL IDENTIFICATION ===
-            'well_name': FieldMapping('well_name', 'Well name or identifier', 'string', required=True),
+            'well_name': FieldMapping('well_name', 'Well name or identifier', 'string', required=True, storage='string'),
             'well_number': FieldMapping('well_number', 'Well number', 'string'),
-            'uwi_number': FieldMapping('uwi_number', 'Unique Well Identifier (UWI) - unformatted', 'string'),
-            'uwi_formatted': FieldMapping('uwi_formatted', 'Unique Well Identifier (UWI) - formatted with slashes/dashes', 'string'),
-            'license_number': FieldMapping('license_number', 'Drilling license number', 'string'),
-            'operator': FieldMapping('operator', 'Operating company', 'string', required=True),
-            'contractor': FieldMapping('contractor', 'Drilling contractor', 'string'),
+            'uwi_number': FieldMapping('uwi_number', 'Unique Well Identifier (UWI) - unformatted', 'string', storage='string'),
+            'uwi_formatted': FieldMapping('uwi_formatted', 'Unique Well Identifier (UWI) - formatted with slashes/dashes', 'string', storage='string'),
+            'license_number': FieldMapping('license_number', 'Drilling license number', 'string', storage='string'),
+            'operator': FieldMapping('operator', 'Operating company', 'string', required=True, storage='category'),
+            'contractor': FieldMapping('contractor', 'Drilling contractor', 'string', storage='category'),
             'rig_name': FieldMapping('rig_name', 'Rig name or number', 'string'),
             'reporting_rig_name': FieldMapping('reporting_rig_name', 'Combined contractor and rig name', 'string'),
             
             # === LOCATION INFORMATION ===
             'field': FieldMapping('field', 'Field name', 'string'),
             'county': FieldMapping('county', 'County or area', 'string'),
-            'state_province': FieldMapping('state_province', 'State or province', 'string'),
-            'country': FieldMapping('country', 'Country', 'string'),
+            'state_province': FieldMapping('state_province', 'State or province', 'string', storage='category'),
+            'country': FieldMapping('country', 'Country', 'string', storage='category'),
             'latitude': FieldMapping('latitude', 'Latitude coordinate', 'numeric'),
             'longitude': FieldMapping('longitude', 'Longitude coordinate', 'numeric'),
             'lsd': FieldMapping('lsd', 'Legal subdivision', 'string'),
@@ -65,55 +103,55 @@ class DataMappingConfig:
             'range': FieldMapping('range', 'Range', 'string'),
             
             # === BIT INFORMATION ===
-            'bit_manufacturer': FieldMapping('bit_manufacturer', 'Bit manufacturer', 'string', required=True),
-            'bit_serial_number': FieldMapping('bit_serial_number', 'Bit serial number', 'string'),
-            'bit_size_mm': FieldMapping('bit_size_mm', 'Bit size in millimeters', 'numeric', required=True),
-            'bit_size_category': FieldMapping('bit_size_category', 'Bit size category', 'string'),
-            'bit_class': FieldMapping('bit_class', 'Bit class (Common/Other)', 'string'),
+            'bit_manufacturer': FieldMapping('bit_manufacturer', 'Bit manufacturer', 'string', required=True, storage='category'),
+            'bit_serial_number': FieldMapping('bit_serial_number', 'Bit serial number', 'string', storage='string'),
+            'bit_size_mm': FieldMapping('bit_size_mm', 'Bit size in millimeters', 'numeric', required=True, unit='mm'),
+            'bit_size_category': FieldMapping('bit_size_category', 'Bit size category', 'string', storage='category'),
+            'bit_class': FieldMapping('bit_class', 'Bit class (Common/Other)', 'string', storage='category'),
             'bit_type': FieldMapping('bit_type', 'Bit type or model', 'string', required=True),
             'iadc_code': FieldMapping('iadc_code', 'IADC classification code', 'string'),
             'bit_style': FieldMapping('bit_style', 'Bit style description', 'string'),
             'blade_count': FieldMapping('blade_count', 'Number of blades', 'numeric'),
             'cutter_size': FieldMapping('cutter_size', 'Cutter size', 'string'),
-            'tfa': FieldMapping('tfa', 'Total flow area', 'numeric'),
+            'tfa': FieldMapping('tfa', 'Total flow area', 'numeric', unit='mm2'),
             
             # === RUN INFORMATION ===
             'run_number': FieldMapping('run_number', 'Run sequence number', 'numeric'),
             'run_date': FieldMapping('run_date', 'Run start date', 'date'),
             'spud_date': FieldMapping('spud_date', 'Well spud date', 'date'),
             'td_date': FieldMapping('td_date', 'Total depth date', 'date'),
-            'depth_in_m': FieldMapping('depth_in_m', 'Depth in (meters)', 'numeric', required=True),
-            'depth_out_m': FieldMapping('depth_out_m', 'Depth out (meters)', 'numeric', required=True),
-            'distance_drilled_m': FieldMapping('distance_drilled_m', 'Distance drilled (meters)', 'numeric'),
-            'total_depth_m': FieldMapping('total_depth_m', 'Total well depth (meters)', 'numeric'),
+            'depth_in_m': FieldMapping('depth_in_m', 'Depth in (meters)', 'numeric', required=True, unit='m'),
+            'depth_out_m': FieldMapping('depth_out_m', 'Depth out (meters)', 'numeric', required=True, unit='m'),
+            'distance_drilled_m': FieldMapping('distance_drilled_m', 'Distance drilled (meters)', 'numeric', unit='m'),
+            'total_depth_m': FieldMapping('total_depth_m', 'Total well depth (meters)', 'numeric', unit='m'),
             
             # === PERFORMANCE METRICS ===
             'drilling_hours': FieldMapping('drilling_hours', 'Total drilling hours', 'numeric'),
             'on_bottom_hours': FieldMapping('on_bottom_hours', 'On bottom hours', 'numeric'),
-            'rop_mhr': FieldMapping('rop_mhr', 'Rate of penetration (m/hr)', 'numeric'),
-            'on_bottom_rop_mhr': FieldMapping('on_bottom_rop_mhr', 'On bottom ROP (m/hr)', 'numeric'),
-            'rotating_rop_mhr': FieldMapping('rotating_rop_mhr', 'Rotating ROP (m/hr)', 'numeric'),
-            'sliding_rop_mhr': FieldMapping('sliding_rop_mhr', 'Sliding ROP (m/hr)', 'numeric'),
+            'rop_mhr': FieldMapping('rop_mhr', 'Rate of penetration (m/hr)', 'numeric', unit='m/hr'),
+            'on_bottom_rop_mhr': FieldMapping('on_bottom_rop_mhr', 'On bottom ROP (m/hr)', 'numeric', unit='m/hr'),
+            'rotating_rop_mhr': FieldMapping('rotating_rop_mhr', 'Rotating ROP (m/hr)', 'numeric', unit='m/hr'),
+            'sliding_rop_mhr': FieldMapping('sliding_rop_mhr', 'Sliding ROP (m/hr)', 'numeric', unit='m/hr'),
             'sliding_percent': FieldMapping('sliding_percent', 'Sliding percentage', 'numeric'),
             
             # === DRILLING PARAMETERS ===
-            'wob_low_dan': FieldMapping('wob_low_dan', 'Weight on bit low (daN)', 'numeric'),
-            'wob_high_dan': FieldMapping('wob_high_dan', 'Weight on bit high (daN)', 'numeric'),
-            'torque_low_ftlb': FieldMapping('torque_low_ftlb', 'Torque low (ft-lb)', 'numeric'),
-            'torque_high_ftlb': FieldMapping('torque_high_ftlb', 'Torque high (ft-lb)', 'numeric'),
+            'wob_low_dan': FieldMapping('wob_low_dan', 'Weight on bit low (daN)', 'numeric', unit='daN'),
+            'wob_high_dan': FieldMapping('wob_high_dan', 'Weight on bit high (daN)', 'numeric', unit='daN'),
+            'torque_low_ftlb': FieldMapping('torque_low_ftlb', 'Torque low (ft-lb)', 'numeric', unit='ft-lb'),
+            'torque_high_ftlb': FieldMapping('torque_high_ftlb', 'Torque high (ft-lb)', 'numeric', unit='ft-lb'),
             'rpm_low': FieldMapping('rpm_low', 'RPM low', 'numeric'),
             'rpm_high': FieldMapping('rpm_high', 'RPM high', 'numeric'),
-            'flow_low_gpm': FieldMapping('flow_low_gpm', 'Flow rate low (gpm)', 'numeric'),
-            'flow_high_gpm': FieldMapping('flow_high_gpm', 'Flow rate high (gpm)', 'numeric'),
+            'flow_low_gpm': FieldMapping('flow_low_gpm', 'Flow rate low (gpm)', 'numeric', unit='gpm'),
+            'flow_high_gpm': FieldMapping('flow_high_gpm', 'Flow rate high (gpm)', 'numeric', unit='gpm'),
             
             # === DULL GRADING (IADC) ===
-            'dull_inner_row': FieldMapping('dull_inner_row', 'Dull grade inner row', 'string'),
-            'dull_outer_row': FieldMapping('dull_outer_row', 'Dull grade outer row', 'string'),
-            'dull_location': FieldMapping('dull_location', 'Dull location code', 'string'),
-            'dull_bearing_seals': FieldMapping('dull_bearing_seals', 'Bearing/seals condition', 'string'),
-            'dull_gauge': FieldMapping('dull_gauge', 'Gauge condition', 'string'),
-            'dull_reason': FieldMapping('dull_reason', 'Reason for pulling bit', 'string'),
-            'dull_characteristics': FieldMapping('dull_characteristics', 'Dull characteristics', 'string'),
+            'dull_inner_row': FieldMapping('dull_inner_row', 'Dull grade inner row', 'string', storage='category'),
+            'dull_outer_row': FieldMapping('dull_outer_row', 'Dull grade outer row', 'string', storage='category'),
+            'dull_location': FieldMapping('dull_location', 'Dull location code', 'string', storage='category'),
+            'dull_bearing_seals': FieldMapping('dull_bearing_seals', 'Bearing/seals condition', 'string', storage='category'),
+            'dull_gauge': FieldMapping('dull_gauge', 'Gauge condition', 'string', storage='category'),
+            'dull_reason': FieldMapping('dull_reason', 'Reason for pulling bit', 'string', storage='category'),
+            'dull_characteristics': FieldMapping('dull_characteristics', 'Dull characteristics', 'string', storage='category'),
             
             # === FORMATION ===
             'formation': FieldMapping('formation', 'Formation drilled', 'string'),
@@ -127,17 +165,17 @@ class DataMappingConfig:
             'gdc_final_td': FieldMapping('gdc_final_td', 'GDC Final total depth', 'numeric'),
             'gdc_gsl_days_on': FieldMapping('gdc_gsl_days_on', 'GDC GSL days on location', 'numeric'),
             'gdc_max_tvd': FieldMapping('gdc_max_tvd', 'GDC Maximum true vertical depth', 'numeric'),
-            'gdc_profile_type': FieldMapping('gdc_profile_type', 'GDC Profile type', 'string'),
+            'gdc_profile_type': FieldMapping('gdc_profile_type', 'GDC Profile type', 'string', storage='category'),
             'gdc_rig_release_date': FieldMapping('gdc_rig_release_date', 'GDC Rig release date', 'date'),
             'gdc_spud_date': FieldMapping('gdc_spud_date', 'GDC Spud date', 'date'),
             'gdc_surface_latitude': FieldMapping('gdc_surface_latitude', 'GDC Surface latitude', 'numeric'),
             'gdc_surface_longitude': FieldMapping('gdc_surface_longitude', 'GDC Surface longitude', 'numeric'),
             
             # === METADATA ===
-            'data_source': FieldMapping('data_source', 'Source of the data', 'string', required=True),
+            'data_source': FieldMapping('data_source', 'Source of the data', 'string', required=True, storage='category'),
             'source_file': FieldMapping('source_file', 'Source file name', 'string'),
             'file_modified_date': FieldMapping('file_modified_date', 'File modification date', 'date'),
-            'record_id': FieldMapping('record_id', 'Unique record identifier', 'string'),
+            'record_id': FieldMapping('record_id', 'Unique record identifier (file id << 32 | row ordinal)', 'numeric', storage='int64'),
         }
     
     def _define_data_sources(self) -> Dict[str, SourceConfig]:
@@ -202,7 +240,9 @@ class DataMappingConfig:
                     # Note: DullGrade_DullChar not available, using 'Dull' instead
                     'dull_characteristics': 'Dull',     # Updated mapping
                     'td_formation': 'TDFormation',
-                }
+                },
+                # Metric units; dull grades already in standard format
+                transform_steps=['standardize_bit_manufacturers', 'standardize_contractors'],
             ),
             
             'reed': SourceConfig(
@@ -226,27 +266,117 @@ class DataMappingConfig:
                     'range': 'RNG',
                     'bit_manufacturer': 'Bit Mfg',
                     'bit_serial_number': 'Bit Serial Number',
-                    'bit_size_mm': 'Bit Size',  # Note: may need conversion from inches
+                    'bit_size_mm': 'Bit Size',
                     'bit_type': 'Bit Type',
                     'tfa': 'Bit TFA',
                     'run_number': 'Run Seq #',
                     'spud_date': 'Spud',
                     'td_date': 'TD Date',
-                    'depth_in_m': 'Depth In',  # Note: may need conversion from feet
-                    'depth_out_m': 'Depth Out',  # Note: may need conversion from feet
-                    'distance_drilled_m': 'Distance',  # Note: may need conversion from feet
+                    'depth_in_m': 'Depth In',
+                    'depth_out_m': 'Depth Out',
+                    'distance_drilled_m': 'Distance',
                     'drilling_hours': 'Hrs',
-                    'rop_mhr': 'ROP',  # Note: may need conversion from ft/hr
+                    'rop_mhr': 'ROP',
                     'dull_inner_row': 'I',
                     'dull_outer_row': 'O',
                     'dull_location': 'LOC',
                     'dull_bearing_seals': 'B',
                     'dull_gauge': 'G',
                     'dull_reason': 'RP',
-                }
+                },
+                # Assumed metric; set a unit here (e.g. 'ft', 'ft/hr') for exports that are not
+                field_units={
+                    'bit_size_mm': 'mm',
+                    'depth_in_m': 'm',
+                    'depth_out_m': 'm',
+                    'distance_drilled_m': 'm',
+                    'rop_mhr': 'm/hr',
+                },
+                # Exports mixing inch bit sizes (8.75 rather than 222.25) can opt in to per-row
+                # detection with unit_rules=[UnitRule('bit_size_mm', 'in', below=30)]
+                # Reed's dull gauge 'I' is mapped to Ulterra's 'IN'
+                transform_steps=['convert_units', 'standardize_dull_grades', 'standardize_bit_manufacturers',
+                                 'standardize_contractors'],
             ),
         }
     
+    def _define_bit_size_bands(self) -> List[BitSizeBand]:
+        """
+        Define bit size categories. Bands are checked in order and the first match wins,
+        so the overlapping mid-range 215mm band only catches sizes the 200mm/222mm groups miss.
+        Sizes matching no band are 'Other'; missing sizes are 'Unknown'.
+        """
+        return [
+            # Primary categories (Common bit sizes)
+            BitSizeBand('158mm', 'Common', 153, 162),  # 6.125" bit group
+            BitSizeBand('171mm', 'Common', 167, 177),  # 6.75" bit group
+            BitSizeBand('200mm', 'Common', 197, 207),  # 8" bit group
+            BitSizeBand('222mm', 'Common', 217, 227),  # 8.75" bit group
+            BitSizeBand('251mm', 'Common', 247, 257),  # 10" bit group
+            BitSizeBand('279mm', 'Common', 275, 285),  # 11" bit group
+            BitSizeBand('311mm', 'Common', 307, 317),  # 12.25" bit group
+            BitSizeBand('349mm', 'Common', 345, 355),  # 14" bit group
+            BitSizeBand('215mm', 'Common', 205, 220),  # Mid-range common size
+            
+            # Secondary categories (Other sizes)
+            BitSizeBand('<150mm', 'Other', upper=150, closed='neither'),
+            BitSizeBand('160-170mm', 'Other', 160, 170),
+            BitSizeBand('175-200mm', 'Other', 175, 200),
+            BitSizeBand('225-250mm', 'Other', 225, 250),
+            BitSizeBand('255-275mm', 'Other', 255, 275),
+            BitSizeBand('285-310mm', 'Other', 285, 310),
+            BitSizeBand('315-345mm', 'Other', 315, 345),
+            BitSizeBand('>355mm', 'Other', lower=355, closed='neither'),
+        ]
+    
+    def _define_precision_policies(self) -> Dict[str, PrecisionPolicy]:
+        """
+        Define the dtypes numeric fields are stored as in compact mode.
+        
+        float32 keeps ~7 significant digits: millimetre resolution on depths up to
+        15,000 m and better on rates, hours and surface parameters. Counts, years
+        and surface RPMs become nullable integers. A field is only downcast when every value lies in
+        its declared range (and is whole, for integer dtypes); otherwise it keeps
+        full precision. Fields without a policy are never downcast: bit_size_mm is
+        matched against band boundaries, latitude/longitude would lose ~1 m at
+        float32 and record_id packs a file id into the high bits.
+        """
+        return {
+            # === DEPTHS (m) ===
+            'depth_in_m': PrecisionPolicy('float32', -1_000, 15_000),
+            'depth_out_m': PrecisionPolicy('float32', -1_000, 15_000),
+            'distance_drilled_m': PrecisionPolicy('float32', -15_000, 15_000),
+            'total_depth_m': PrecisionPolicy('float32', -1_000, 15_000),
+            
+            # === TIME AND RATES ===
+            'drilling_hours': PrecisionPolicy('float32', -10_000, 10_000),
+            'on_bottom_hours': PrecisionPolicy('float32', -10_000, 10_000),
+            'rop_mhr': PrecisionPolicy('float32', -10_000, 10_000),
+            'on_bottom_rop_mhr': PrecisionPolicy('float32', -10_000, 10_000),
+            'rotating_rop_mhr': PrecisionPolicy('float32', -10_000, 10_000),
+            'sliding_rop_mhr': PrecisionPolicy('float32', -10_000, 10_000),
+            'sliding_percent': PrecisionPolicy('float32', -1_000, 1_000),
+            'total_penetration': PrecisionPolicy('float32', -1_000_000, 1_000_000),
+            
+            # === DRILLING PARAMETERS ===
+            'wob_low_dan': PrecisionPolicy('float32', -1_000_000, 1_000_000),
+            'wob_high_dan': PrecisionPolicy('float32', -1_000_000, 1_000_000),
+            'torque_low_ftlb': PrecisionPolicy('float32', -1_000_000, 1_000_000),
+            'torque_high_ftlb': PrecisionPolicy('float32', -1_000_000, 1_000_000),
+            'rpm_low': PrecisionPolicy('Int16', 0, 1_000),
+            'rpm_high': PrecisionPolicy('Int16', 0, 1_000),
+            'flow_low_gpm': PrecisionPolicy('float32', -100_000, 100_000),
+            'flow_high_gpm': PrecisionPolicy('float32', -100_000, 100_000),
+            'tfa': PrecisionPolicy('float32', 0, 1_000),
+            
+            # === COUNTS AND YEARS ===
+            'run_number': PrecisionPolicy('Int16', 0, 10_000),
+            'blade_count': PrecisionPolicy('Int16', 0, 1_000),
+            'spud_year': PrecisionPolicy('Int16', 1900, 2200),
+            'run_year': PrecisionPolicy('Int16', 1900, 2200),
+            'td_year': PrecisionPolicy('Int16', 1900, 2200),
+        }
+    
     def _define_data_categories(self) -> Dict[str, List[str]]:
         """Define logical groupings of fields for analysis and reporting"""
         return {
@@ -326,6 +456,14 @@ class DataMappingConfig:
         """Get list of all available categories"""
         return list(self.data_categories.keys())
     
+    def get_storage_types(self) -> Dict[str, str]:
+        """Get the storage dtype declared for each field that sets one"""
+        return {name: field.storage for name, field in self.standard_fields.items() if field.storage}
+    
+    def get_field_units(self) -> Dict[str, str]:
+        """Get the standard unit of each measurement field"""
+        return {name: field.unit for name, field in self.standard_fields.items() if field.unit}
+    
     def get_required_fields(self) -> List[str]:
         """Get list of required fields"""
         return [name for name, field in self.standard_fields.items() if field.required]
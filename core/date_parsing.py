@@ -0,0 +1,125 @@
+"""
+Date Parsing
+Parses source date columns once per distinct value, using declared or cached formats.
+
+SourceConfig.date_formats declares a strftime format per date field, or
+EXCEL_SERIAL for columns of Excel day serials. Columns the reader already
+typed as datetime pass through untouched. Object columns (mixed text, date
+cells and serials) are factorized and only the distinct values are parsed:
+date cells directly, text with the declared format or - when none is
+declared - a format inferred from the first value (cached by the caller),
+with remaining text parsed per distinct value. Numbers count as Excel serials
+only where EXCEL_SERIAL is declared. Values that still fail become NaT and
+are counted, so callers can report them.
+"""
+
+import datetime
+import re
+import warnings
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:  # pandas < 2.2
+    from pandas._libs.tslibs.parsing import guess_datetime_format
+
+# format='mixed' (per-value inference) needs pandas 2.0; older pandas already infers per value
+PANDAS_2 = int(re.match(r'(\d+)', pd.__version__).group(1)) >= 2
+MIXED_FORMAT = {'format': 'mixed'} if PANDAS_2 else {}
+
+# date_formats value for columns holding Excel day serials (44197 = 2021-01-01)
+EXCEL_SERIAL = 'excel_serial'
+# Day 0 of the serial scale; serials before March 1900 are off by Excel's 1900 leap-year bug
+EXCEL_EPOCH = pd.Timestamp('1899-12-30')
+# Serial of 9999-12-31, the last date Excel represents
+MAX_EXCEL_SERIAL = 2958465
+
+
+def excel_serials_to_datetime(serials: np.ndarray) -> np.ndarray:
+    """Convert Excel day serials (fractions are times of day) to datetime64[ns]; out-of-range serials become NaT"""
+    serials = np.asarray(serials, dtype=np.float64)
+    valid = (serials >= 0) & (serials <= MAX_EXCEL_SERIAL)
+    converted = np.full(len(serials), np.datetime64('NaT'), dtype='datetime64[ns]')
+    converted[valid] = (EXCEL_EPOCH + pd.to_timedelta(serials[valid], unit='D')).to_numpy()
+    return converted
+
+
+def _parse_text(text: np.ndarray, date_format: Optional[str],
+                inferred_format: Optional[str]) -> Tuple[np.ndarray, Optional[str]]:
+    """Parse distinct date strings; returns datetime64[ns] values and the format inferred for them"""
+    if date_format is not None and date_format != EXCEL_SERIAL:
+        return pd.to_datetime(text, format=date_format, errors='coerce').to_numpy(), inferred_format
+
+    parsed = np.full(len(text), np.datetime64('NaT'), dtype='datetime64[ns]')
+    if date_format == EXCEL_SERIAL:
+        serials = pd.to_numeric(text, errors='coerce')
+        numeric = ~np.isnan(serials)
+        parsed[numeric] = excel_serials_to_datetime(serials[numeric])
+        text = np.where(numeric, None, text)
+
+    remaining = np.array([value is not None for value in text], dtype=bool)
+    if inferred_format is None and remaining.any():
+        inferred_format = guess_datetime_format(text[remaining][0])
+    if inferred_format is not None and remaining.any():
+        parsed[remaining] = pd.to_datetime(text[remaining], format=inferred_format, errors='coerce').to_numpy()
+        remaining &= np.isnat(parsed)
+    if remaining.any():
+        # Text in other layouts than the inferred one; few distinct values reach this
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', UserWarning)
+            parsed[remaining] = pd.to_datetime(text[remaining], errors='coerce', **MIXED_FORMAT).to_numpy()
+    return parsed, inferred_format
+
+
+def parse_dates(values: pd.Series, date_format: Optional[str] = None,
+                inferred_format: Optional[str] = None) -> Tuple[pd.Series, int, Optional[str]]:
+    """
+    Parse a date column to datetime64[ns].
+
+    date_format is the declared strftime format or EXCEL_SERIAL; inferred_format
+    a format inferred for this column earlier (skips inference). Returns the
+    parsed series, the number of non-blank values that could not be parsed,
+    and the format inferred for text values (to cache for the next call).
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values, 0, inferred_format
+
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        serials = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        present = ~np.isnan(serials)
+        parsed = np.full(len(values), np.datetime64('NaT'), dtype='datetime64[ns]')
+        if date_format == EXCEL_SERIAL:
+            parsed[present] = excel_serials_to_datetime(serials[present])
+        unparseable = int((present & np.isnat(parsed)).sum())
+        return pd.Series(parsed, index=values.index), unparseable, inferred_format
+
+    codes, uniques = pd.factorize(values)
+    uniques = uniques.to_numpy(dtype=object)
+    parsed = np.full(len(uniques), np.datetime64('NaT'), dtype='datetime64[ns]')
+    blank = np.zeros(len(uniques), dtype=bool)
+
+    is_date = np.array([isinstance(value, (datetime.date, np.datetime64)) for value in uniques], dtype=bool)
+    is_text = np.array([isinstance(value, str) for value in uniques], dtype=bool)
+    is_number = np.array([isinstance(value, (int, float, np.number)) and not isinstance(value, (bool, np.bool_))
+                          for value in uniques], dtype=bool)
+
+    if is_date.any():
+        parsed[is_date] = pd.to_datetime(uniques[is_date], errors='coerce').to_numpy()
+    if is_number.any() and date_format == EXCEL_SERIAL:
+        parsed[is_number] = excel_serials_to_datetime(uniques[is_number].astype(np.float64))
+    if is_text.any():
+        text = np.array([value.strip() for value in uniques[is_text]], dtype=object)
+        blank[is_text] = text == ''
+        text_parsed, inferred_format = _parse_text(text[text != ''], date_format, inferred_format)
+        text_values = np.full(len(text), np.datetime64('NaT'), dtype='datetime64[ns]')
+        text_values[text != ''] = text_parsed
+        parsed[is_text] = text_values
+
+    # Missing values have code -1, which picks the trailing NaT
+    row_values = np.append(parsed, np.datetime64('NaT'))[codes]
+    failed_uniques = np.isnat(parsed) & ~blank
+    unparseable = int(np.bincount(codes[codes >= 0], minlength=len(uniques))[failed_uniques].sum())
+    return pd.Series(row_values, index=values.index, dtype='datetime64[ns]'), unparseable, inferred_format
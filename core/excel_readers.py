@@ -0,0 +1,78 @@
+"""
+Excel Reader Backends
+Selects the engine used to parse workbooks, preferring a fast backend when installed.
+
+calamine (Rust, via python-calamine) parses .xlsx several times faster than
+openpyxl and yields the same dtypes and date handling through pandas. When it
+is not installed - or pandas is too old to know the engine - reads fall back
+to openpyxl transparently. scripts/benchmarks/bench_excel_readers.py checks
+that both engines produce identical frames and times them.
+"""
+
+import importlib.util
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import pandas as pd
+
+# Engine used when neither the caller nor the SourceConfig asks for one
+DEFAULT_READER_ENGINE = 'calamine'
+FALLBACK_READER_ENGINE = 'openpyxl'
+
+# Engine name -> module that must be importable for it to work
+READER_ENGINES = {
+    'calamine': 'python_calamine',
+    'openpyxl': 'openpyxl',
+}
+
+_availability: Dict[str, bool] = {}
+_fallback_reported = set()
+
+
+def engine_available(engine: str) -> bool:
+    """Check whether a reader engine can be used in this environment"""
+    if engine not in _availability:
+        module = READER_ENGINES.get(engine)
+        available = module is not None and importlib.util.find_spec(module) is not None
+        if engine == 'calamine':
+            # pandas learned the calamine engine in 2.2
+            major, minor = (int(part) for part in re.match(r'(\d+)\.(\d+)', pd.__version__).groups())
+            available = available and (major, minor) >= (2, 2)
+        _availability[engine] = available
+    return _availability[engine]
+
+
+def resolve_reader_engine(engine: Optional[str] = None) -> str:
+    """Resolve a requested engine to one that is usable, falling back to openpyxl"""
+    requested = engine or DEFAULT_READER_ENGINE
+    if requested not in READER_ENGINES:
+        raise ValueError(f"Unknown reader engine: {requested} (expected one of {list(READER_ENGINES)})")
+
+    if engine_available(requested):
+        return requested
+
+    if requested not in _fallback_reported:
+        print(f"⚠️  Excel reader '{requested}' not available - using {FALLBACK_READER_ENGINE}")
+        _fallback_reported.add(requested)
+    return FALLBACK_READER_ENGINE
+
+
+def list_sheet_names(file_path: Union[str, Path], engine: Optional[str] = None) -> List[str]:
+    """List the sheet names of a workbook"""
+    with pd.ExcelFile(file_path, engine=resolve_reader_engine(engine)) as excel_file:
+        return list(excel_file.sheet_names)
+
+
+def read_excel_sheet(file_path: Union[str, Path], sheet_name: Union[str, int, None] = 0,
+                     engine: Optional[str] = None, **kwargs: Any) -> pd.DataFrame:
+    """
+    Read one sheet with the resolved reader engine.
+
+    Accepts the usual pd.read_excel keyword arguments (skiprows, usecols, nrows, ...).
+    A sheet_name of None means the first sheet, matching SourceConfig semantics.
+    """
+    if sheet_name is None:
+        sheet_name = 0
+
+    return pd.read_excel(file_path, sheet_name=sheet_name, engine=resolve_reader_engine(engine), **kwargs)
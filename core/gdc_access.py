@@ -0,0 +1,244 @@
+"""
+GDC Access Layer
+Shared GDC session pool and batched fetching of query results into pandas.
+
+Connection settings default to the GDC production service and can be
+overridden by a JSON file named in GDC_CONFIG and then by GDC_* environment
+variables (GDC_HOST, GDC_PORT, GDC_SERVICE, GDC_USER, GDC_PASSWORD,
+GDC_POOL_MIN, GDC_POOL_MAX, GDC_STMT_CACHE_SIZE, GDC_CONNECT_RETRIES,
+GDC_RETRY_BACKOFF). shared_pool() returns one oracledb session pool per
+process, created on first use; each consumer checks out its own session, so
+concurrent lookups do not serialize on one connection. Pool creation and
+session checkout are retried with exponential backoff.
+
+python-oracledb 2.4+ connections (with pyarrow installed) fetch straight into
+Arrow buffers via fetch_df_all / fetch_df_batches, so no per-row Python tuples
+are built; the Arrow table is converted to pandas once. Other DB-API
+connections (older drivers, the SQLite stand-in the benchmarks use) run a
+cursor with arraysize/prefetchrows set to the batch size and turn each
+fetchmany batch into a DataFrame as it arrives, so only one batch of row
+tuples is alive at a time. batch_size is the rows per round trip either way.
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import pandas as pd
+
+try:
+    import oracledb
+except ImportError:  # offline runs from a GDC snapshot need no Oracle driver
+    oracledb = None
+
+try:
+    import pyarrow as pa
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 10_000
+
+
+@dataclass
+class GDCConnectionSettings:
+    """GDC connection and session pool settings"""
+    host: str = 'WC-CGY-ORAP01'
+    port: int = 1521
+    service: str = 'PRD1'
+    user: str = 'synergyro'
+    password: str = 'synergyro'
+    schema: str = 'GDC'
+    pool_min: int = 1
+    pool_max: int = 4
+    stmt_cache_size: int = 40
+    connect_retries: int = 3
+    retry_backoff: float = 1.0  # seconds before the first retry, doubled after each
+
+    @property
+    def dsn(self) -> str:
+        return f"{self.host}:{self.port}/{self.service}"
+
+    @classmethod
+    def from_environment(cls) -> 'GDCConnectionSettings':
+        """Defaults, overridden by the JSON file in GDC_CONFIG, then by GDC_<FIELD> variables"""
+        values = {}
+        config_path = os.environ.get('GDC_CONFIG')
+        if config_path:
+            with open(Path(config_path)) as f:
+                values.update(json.load(f))
+
+        for setting in fields(cls):
+            env_value = os.environ.get(f"GDC_{setting.name.upper()}")
+            if env_value is not None:
+                values[setting.name] = env_value
+
+        unknown = set(values) - {setting.name for setting in fields(cls)}
+        if unknown:
+            raise ValueError(f"Unknown GDC connection settings: {sorted(unknown)}")
+        # Environment values are strings; convert them to the defaults' types
+        defaults = cls()
+        return cls(**{name: type(getattr(defaults, name))(value) for name, value in values.items()})
+
+
+class GDCPool:
+    """oracledb session pool created on first checkout, with retry and backoff"""
+
+    def __init__(self, settings: Optional[GDCConnectionSettings] = None):
+        self.settings = settings or GDCConnectionSettings.from_environment()
+        self.pool = None
+        self.lock = threading.Lock()
+
+    def _retry(self, action, description: str):
+        """Run action, retrying failures up to connect_retries times with exponential backoff"""
+        for attempt in range(self.settings.connect_retries + 1):
+            try:
+                return action()
+            except oracledb.Error as e:
+                if attempt == self.settings.connect_retries:
+                    raise
+                delay = self.settings.retry_backoff * 2 ** attempt
+                logger.warning(f"⚠️  {description} failed ({e}) - retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+    def _get_pool(self):
+        with self.lock:
+            if self.pool is None:
+                if oracledb is None:
+                    raise RuntimeError("oracledb is not installed - cannot connect to GDC")
+                self.pool = self._retry(lambda: oracledb.create_pool(
+                    user=self.settings.user,
+                    password=self.settings.password,
+                    dsn=self.settings.dsn,
+                    min=self.settings.pool_min,
+                    max=self.settings.pool_max,
+                    increment=1,
+                    stmtcachesize=self.settings.stmt_cache_size,
+                    getmode=oracledb.POOL_GETMODE_WAIT,
+                ), "Creating GDC session pool")
+                logger.info(f"✅ GDC session pool ready ({self.settings.dsn}, "
+                            f"{self.settings.pool_min}-{self.settings.pool_max} sessions)")
+            return self.pool
+
+    def acquire(self):
+        """Check out a session (waits while all pool_max sessions are in use)"""
+        pool = self._get_pool()
+        return self._retry(pool.acquire, "Checking out a GDC session")
+
+    def release(self, connection):
+        """Return a session to the pool"""
+        if self.pool is not None and connection is not None:
+            self.pool.release(connection)
+
+    @contextmanager
+    def session(self):
+        """Context manager checking a session out and back in"""
+        connection = self.acquire()
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    def close(self):
+        """Close the pool and its sessions"""
+        with self.lock:
+            if self.pool is not None:
+                self.pool.close(force=True)
+                self.pool = None
+
+
+_shared_pool: Optional[GDCPool] = None
+_shared_pool_lock = threading.Lock()
+
+
+def shared_pool() -> GDCPool:
+    """The process-wide GDC pool, configured from the environment"""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = GDCPool()
+            atexit.register(_shared_pool.close)
+        return _shared_pool
+
+
+def arrow_fetch_supported(connection) -> bool:
+    """Whether the connection can fetch query results as Arrow data"""
+    return ARROW_AVAILABLE and hasattr(connection, 'fetch_df_all') and hasattr(connection, 'fetch_df_batches')
+
+
+def _arrow_frame(oracle_df) -> pd.DataFrame:
+    """Convert an oracledb DataFrame (Arrow columns) to pandas"""
+    table = pa.Table.from_arrays(oracle_df.column_arrays(), names=oracle_df.column_names())
+    return table.to_pandas()
+
+
+def _cursor_batches(connection, query: str, params: Optional[Dict], batch_size: int,
+                    columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+    """fetchmany batches of a DB-API cursor as DataFrames; columns (if given) receives the column names"""
+    cursor = connection.cursor()
+    try:
+        cursor.arraysize = batch_size
+        if hasattr(cursor, 'prefetchrows'):
+            # The first batch comes back with the execute round trip
+            cursor.prefetchrows = batch_size
+        cursor.execute(query, params or {})
+        names = [description[0] for description in cursor.description]
+        if columns is not None:
+            columns.extend(names)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield pd.DataFrame.from_records(rows, columns=names, coerce_float=True)
+    finally:
+        cursor.close()
+
+
+def _concat_batches(batches: List[pd.DataFrame], columns: List[str]) -> pd.DataFrame:
+    """
+    Concatenate batch frames with the dtypes a single read would infer
+    A column can come out differently per batch (e.g. all missing in one batch);
+    such columns are joined as objects and inferred again over all rows
+    """
+    if not batches:
+        return pd.DataFrame(columns=columns)
+    if len(batches) == 1:
+        return batches[0]
+
+    mixed = [column for column in columns if len({str(batch[column].dtype) for batch in batches}) > 1]
+    if mixed:
+        batches = [batch.astype({column: object for column in mixed}) for batch in batches]
+    frame = pd.concat(batches, ignore_index=True)
+    if mixed:
+        frame[mixed] = frame[mixed].infer_objects()
+    return frame
+
+
+def fetch_batches(connection, query: str, params: Optional[Dict] = None,
+                  batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[pd.DataFrame]:
+    """Run a query and yield its result as DataFrames of up to batch_size rows"""
+    if arrow_fetch_supported(connection):
+        for oracle_df in connection.fetch_df_batches(statement=query, parameters=params, size=batch_size):
+            yield _arrow_frame(oracle_df)
+    else:
+        yield from _cursor_batches(connection, query, params, batch_size)
+
+
+def fetch_frame(connection, query: str, params: Optional[Dict] = None,
+                batch_size: int = DEFAULT_BATCH_SIZE) -> pd.DataFrame:
+    """Run a query and return its full result as one DataFrame (drop-in for pd.read_sql)"""
+    if arrow_fetch_supported(connection):
+        return _arrow_frame(connection.fetch_df_all(statement=query, parameters=params, arraysize=batch_size))
+
+    columns: List[str] = []
+    batches = list(_cursor_batches(connection, query, params, batch_size, columns))
+    return _concat_batches(batches, columns)
@@ -10,82 +10,141 @@ This module processes ALL records, matching on trimmed license numbers and updat
 This replaces the old safe/standard lookup approaches with a comprehensive solution.
 """
 
+import hashlib
 import pandas as pd
 import numpy as np
 from pathlib import Path
-import oracledb
 from typing import Dict, List, Tuple, Optional
 import logging
 from datetime import datetime
 
+from data_mapping_config import DataMappingConfig
+from gdc_access import DEFAULT_BATCH_SIZE, GDCPool, fetch_frame, shared_pool
+from gdc_snapshot import GDCSnapshot
+from vector_ops import (apply_storage_types, integer_join_keys, release_storage_types,
+                        trim_license_number, trim_license_numbers)
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# GDC.WELL columns the lookup uses
+GDC_WELL_COLUMNS = [
+    'WELL_NUM', 'UWI', 'GSL_UWID', 'WELL_NAME', 'PROVINCE_STATE',
+    'SURFACE_LATITUDE', 'SURFACE_LONGITUDE', 'BOTTOM_HOLE_LATITUDE', 'BOTTOM_HOLE_LONGITUDE',
+    'DRILL_TD', 'FINAL_DRILL_DATE', 'FINAL_TD', 'GSL_DAYS_ON', 'MAX_TVD',
+    'PROFILE_TYPE', 'RIG_RELEASE_DATE', 'SPUD_DATE',
+]
+GDC_PROVINCES = ('AB', 'BC')
+
+# Primary key and PPDM audit columns used for incremental snapshot refreshes
+GDC_WELL_KEY = 'UWI'
+GDC_CHANGE_COLUMNS = ['ROW_CHANGED_DATE', 'ROW_CREATED_DATE']
+
+# Oracle accepts at most 1000 expressions in an IN list
+TARGETED_BATCH_SIZE = 1000
+# Widths of the zero-padded WELL_NUM values GDC stores (answered from the WELL_NUM index);
+# targeted fetches bind each license as is and padded to these widths, so WELL_NUM is
+# compared bare and its index can be used
+STORED_WIDTHS_QUERY = "SELECT DISTINCT LENGTH(WELL_NUM) AS WIDTH FROM GDC.WELL WHERE WELL_NUM LIKE '0%'"
+# Auto fetch mode pulls only the bit data's licenses up to this many distinct keys (one query per batch)
+TARGETED_MAX_KEYS = 20_000
+FETCH_MODES = ('auto', 'full', 'targeted')
+
+# Bump when trimming/deduplication changes; snapshot lookups built by another version are re-derived
+LOOKUP_VERSION = 2
+
+DEFAULT_SNAPSHOT_DIR = Path(__file__).parent / '.gdc_snapshot'
+
+
+def uwi_priority(uwis: pd.Series) -> np.ndarray:
+    """
+    Preference of GDC UWIs for a license shared by several wells (lower wins)
+    1-3: modern BC 200/201/202, 4: other 16-character 20x BC, 5: old BC format (1BC, 2BC, ...),
+    6: 16-character Alberta UWIs starting with 1, 7: anything else, 9999: missing UWI
+    """
+    text = uwis.astype(object).astype(str)
+    length = text.str.len()
+    conditions = [
+        uwis.isna(),
+        text.str.startswith('200'),
+        text.str.startswith('201'),
+        text.str.startswith('202'),
+        text.str.startswith('20') & (length == 16),
+        text.str.contains('BC', regex=False),
+        text.str.startswith('1') & (length == 16),
+    ]
+    return np.select([condition.to_numpy(dtype=bool) for condition in conditions],
+                     [9999, 1, 2, 3, 4, 5, 6], default=7)
+
 class GDCEnhancer:
     """
     Comprehensive GDC database enhancement for drilling data
     Processes all records to standardize license numbers and enhance UWI data
+    
+    The GDC lookup comes from a local snapshot (gdc_snapshot.py) while it is
+    younger than snapshot_ttl_hours and is refreshed incrementally from the
+    database afterwards. offline=True uses the snapshot only; refresh=True
+    forces a full fetch; use_snapshot=False queries the database every run.
+    
+    Snapshot fetches always pull all AB/BC wells ('full', or 'incremental' for
+    rows changed since the last one). Without snapshots (use_snapshot=False or
+    no pyarrow), fetch_mode='auto' pulls only the GDC rows of the licenses
+    present in the bit data ('targeted', batched bind lists) when there are at
+    most targeted_max_keys of them. Targeted results are not snapshotted.
+    
+    Sessions come from the shared GDC pool (or pool) and queries stream through
+    gdc_access.fetch_frame in batches of fetch_batch_size rows.
+    
+    License numbers are trimmed with vector_ops.trim_license_numbers; with
+    integer_keys=True the merge joins on int64 encodings of the trimmed keys
+    (worthwhile for large bit data; encoding the lookup costs about as much as
+    the string join saves for small inputs).
+    
+    Licenses shared by several GDC wells keep the row with the best uwi_priority;
+    the discarded rows of the enhanced data's licenses are kept in
+    discarded_duplicates and written next to the enhancement report.
     """
     
-    def __init__(self):
-        self.connection_params = {
-            'host': 'WC-CGY-ORAP01',
-            'port': 1521,
-            'service': 'PRD1',
-            'user': 'synergyro',
-            'password': 'synergyro',
-            'schema': 'GDC'
-        }
+    def __init__(self, snapshot_dir: Optional[Path] = None, snapshot_ttl_hours: float = 24,
+                 offline: bool = False, refresh: bool = False, use_snapshot: bool = True,
+                 fetch_mode: str = 'auto', targeted_max_keys: int = TARGETED_MAX_KEYS,
+                 fetch_batch_size: int = DEFAULT_BATCH_SIZE, pool: Optional[GDCPool] = None,
+                 integer_keys: bool = False):
+        if fetch_mode not in FETCH_MODES:
+            raise ValueError(f"Unknown GDC fetch mode: {fetch_mode} (expected one of {FETCH_MODES})")
+        self.pool = pool
         self.connection = None
+        self.snapshot = GDCSnapshot(snapshot_dir or DEFAULT_SNAPSHOT_DIR, snapshot_ttl_hours) if use_snapshot else None
+        self.offline = offline
+        self.refresh = refresh
+        self.fetch_mode = fetch_mode
+        self.targeted_max_keys = targeted_max_keys
+        self.fetch_batch_size = fetch_batch_size
+        self.integer_keys = integer_keys
+        self.fetch_stats: Dict = {}
+        self.discarded_duplicates = pd.DataFrame()  # GDC rows dropped by deduplication, for auditing
         
     def connect(self) -> bool:
-        """Establish connection to Oracle database"""
+        """Check out a GDC session from the pool"""
         try:
-            dsn = f"{self.connection_params['host']}:{self.connection_params['port']}/{self.connection_params['service']}"
-            self.connection = oracledb.connect(
-                user=self.connection_params['user'],
-                password=self.connection_params['password'],
-                dsn=dsn
-            )
+            self.pool = self.pool or shared_pool()
+            self.connection = self.pool.acquire()
             logger.info("✅ Connected to GDC Oracle database for enhancement")
             return True
         except Exception as e:
-            logger.error(f"❌ Failed to connect to GDC database: {e}")
+            logger.error(f"❌ Failed to connect to GDC database: {e} (use a snapshot in offline mode)")
             return False
     
     def disconnect(self):
-        """Close database connection"""
+        """Return the session to the pool"""
         if self.connection:
-            self.connection.close()
+            self.pool.release(self.connection)
+            self.connection = None
             logger.info("🔌 Disconnected from GDC database")
     
     def trim_leading_zeros(self, value) -> Optional[str]:
         """Trim leading zeros from license numbers for consistent matching"""
-        if pd.isna(value) or value is None:
-            return None
-        
-        # Convert to string and clean up
-        str_value = str(value).strip()
-        
-        # If it's empty after stripping, return None
-        if not str_value or str_value.lower() in ['nan', 'none', '']:
-            return None
-        
-        # Remove decimal places if present
-        if '.' in str_value and str_value.replace('.', '').replace('-', '').isdigit():
-            try:
-                float_val = float(str_value)
-                if float_val == int(float_val):  # No fractional part
-                    str_value = str(int(float_val))
-            except (ValueError, OverflowError):
-                pass
-        
-        # Trim leading zeros but preserve the string
-        if str_value.isdigit():
-            trimmed = str_value.lstrip('0')
-            return trimmed if trimmed else '0'
-        
-        return str_value
+        return trim_license_number(value)
     
     def derive_province_from_longitude(self, longitude) -> Optional[str]:
         """
@@ -120,6 +179,183 @@ class GDCEnhancer:
         except (ValueError, TypeError):
             return None
     
+    def well_query(self, changed_since: bool = False, license_binds: int = 0) -> str:
+        """
+        GDC.WELL query for the lookup rows, for all rows changed since :since (incremental
+        refresh), or for the lookup rows of license_binds licenses (:k0 ... targeted fetch)
+        """
+        columns = ',\n               '.join(GDC_WELL_COLUMNS + GDC_CHANGE_COLUMNS)
+        if changed_since:
+            # Unfiltered, so wells that lost their license or province leave the snapshot
+            condition = ' OR '.join(f"{column} > :since" for column in GDC_CHANGE_COLUMNS)
+        else:
+            provinces = ', '.join(f"'{province}'" for province in GDC_PROVINCES)
+            condition = f"WELL_NUM IS NOT NULL\n        AND PROVINCE_STATE IN ({provinces})"
+        if license_binds:
+            # Stored forms of the licenses (see license_forms); exact trimming is re-applied to the fetched rows
+            binds = ', '.join(f":k{i}" for i in range(license_binds))
+            condition += f"\n        AND WELL_NUM IN ({binds})"
+        return f"""
+        SELECT {columns}
+        FROM GDC.WELL 
+        WHERE {condition}
+        """
+    
+    def query_signature(self) -> str:
+        """Signature of the lookup query; snapshots fetched with another query are not reused"""
+        return hashlib.sha1(self.well_query().encode('utf-8')).hexdigest()
+    
+    def _read_sql(self, query: str, params: Optional[Dict] = None) -> pd.DataFrame:
+        """Run a GDC query, counting rows fetched and their in-memory size (the transfer estimate)"""
+        gdc_df = fetch_frame(self.connection, query, params, self.fetch_batch_size)
+        self.fetch_stats['gdc_rows_fetched'] = self.fetch_stats.get('gdc_rows_fetched', 0) + len(gdc_df)
+        self.fetch_stats['gdc_payload_bytes'] = (self.fetch_stats.get('gdc_payload_bytes', 0)
+                                                 + int(gdc_df.memory_usage(deep=True).sum()))
+        return gdc_df
+    
+    def _session_bytes_sent(self) -> Optional[int]:
+        """Bytes the database session has sent to this client (None without access to V$MYSTAT)"""
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                SELECT s.VALUE FROM V$MYSTAT s JOIN V$STATNAME n ON n.STATISTIC# = s.STATISTIC#
+                WHERE n.NAME = 'bytes sent via SQL*Net to client'
+            """)
+            return int(cursor.fetchone()[0])
+        except Exception:
+            return None
+    
+    def fetch_gdc_wells(self, since: Optional[datetime] = None) -> pd.DataFrame:
+        """Fetch the lookup rows of GDC.WELL, or only rows changed since a date"""
+        if since is None:
+            gdc_df = self._read_sql(self.well_query())
+        else:
+            gdc_df = self._read_sql(self.well_query(changed_since=True), params={'since': since})
+        logger.info(f"📊 Retrieved {len(gdc_df)} records from GDC database")
+        return gdc_df
+    
+    def stored_license_widths(self) -> List[int]:
+        """Widths GDC zero-pads WELL_NUM values to"""
+        widths = fetch_frame(self.connection, STORED_WIDTHS_QUERY, None, self.fetch_batch_size)
+        return sorted(int(width) for width in widths.iloc[:, 0].dropna())
+    
+    @staticmethod
+    def license_forms(license_keys: List[str], widths: List[int]) -> List[str]:
+        """
+        WELL_NUM values the trimmed license_keys can be stored as in GDC
+
+        Every key is bound as is; all-digit keys (the only ones trimming strips zeros
+        from) are also bound zero-padded to widths.
+        """
+        keys = set(license_keys) - {''}
+        digit_keys = {key.lstrip('0') or '0' for key in keys if key.isdigit()}
+        return sorted(keys | digit_keys | {key.rjust(width, '0') for key in digit_keys for width in widths})
+    
+    def fetch_gdc_wells_for_licenses(self, license_keys: List[str]) -> pd.DataFrame:
+        """
+        Fetch the lookup rows of GDC.WELL whose license matches one of license_keys (trimmed)
+        The licenses' stored forms (padded to every width GDC uses; values stored with
+        surrounding blanks are not matched) are bound in batches of TARGETED_BATCH_SIZE;
+        the last batch is padded with its final value so every batch runs the same statement
+        """
+        forms = self.license_forms(license_keys, self.stored_license_widths())
+        if not forms:
+            return pd.DataFrame(columns=GDC_WELL_COLUMNS + GDC_CHANGE_COLUMNS)
+        
+        batch_size = min(TARGETED_BATCH_SIZE, len(forms))
+        query = self.well_query(license_binds=batch_size)
+        batches = []
+        for start in range(0, len(forms), batch_size):
+            batch = forms[start:start + batch_size]
+            batch += [batch[-1]] * (batch_size - len(batch))
+            batches.append(self._read_sql(query, params={f"k{i}": key for i, key in enumerate(batch)}))
+        
+        # Batches without matches would only add all-NA columns to the concatenation
+        gdc_df = pd.concat([batch for batch in batches if not batch.empty] or batches[:1], ignore_index=True)
+        logger.info(f"📊 Retrieved {len(gdc_df)} records from GDC database for {len(license_keys)} licenses "
+                    f"({len(forms)} stored forms, {len(batches)} batches)")
+        return gdc_df
+    
+    @staticmethod
+    def filter_gdc_wells(gdc_df: pd.DataFrame) -> pd.DataFrame:
+        """Rows the lookup query selects (applied locally after incremental refreshes)"""
+        keep = gdc_df['WELL_NUM'].notna() & gdc_df['PROVINCE_STATE'].isin(GDC_PROVINCES)
+        return gdc_df[keep].reset_index(drop=True)
+    
+    def trim_gdc_licenses(self, gdc_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add WELL_NUM_TRIMMED to GDC well rows (in place)
+        Rows that already carry it (snapshot wells) are not trimmed again
+        """
+        if 'WELL_NUM_TRIMMED' not in gdc_df.columns:
+            gdc_df['WELL_NUM_TRIMMED'] = trim_license_numbers(gdc_df['WELL_NUM'])
+        else:
+            untrimmed = gdc_df['WELL_NUM_TRIMMED'].isna()
+            gdc_df.loc[untrimmed, 'WELL_NUM_TRIMMED'] = trim_license_numbers(gdc_df.loc[untrimmed, 'WELL_NUM'])
+        return gdc_df
+    
+    def derive_gdc_lookup(self, gdc_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Derive the license lookup from GDC well rows: trimmed license numbers, deduplicated
+        Returns an empty DataFrame if deduplication fails
+        """
+        lookup_columns = GDC_WELL_COLUMNS + ['WELL_NUM_TRIMMED']
+        gdc_df = self.trim_gdc_licenses(gdc_df).drop(
+            columns=[column for column in gdc_df.columns if column not in lookup_columns])
+        
+        # Remove records where trimmed license is None/empty
+        gdc_df = gdc_df[gdc_df['WELL_NUM_TRIMMED'].notna()].copy()
+        
+        logger.info(f"📊 {len(gdc_df)} records with valid license numbers for matching")
+        
+        # Check for duplicates and deduplicate if necessary
+        duplicated = gdc_df['WELL_NUM_TRIMMED'].duplicated(keep=False).to_numpy()
+        self.discarded_duplicates = gdc_df.iloc[:0].assign(UWI_PRIORITY=pd.Series(dtype=np.int64),
+                                                           KEPT_UWI=pd.Series(dtype=object))
+        if duplicated.any():
+            candidates = gdc_df[duplicated]
+            duplicate_count = len(candidates) - candidates['WELL_NUM_TRIMMED'].nunique()
+            logger.warning(f"⚠️  Found {duplicate_count} duplicate license numbers in GDC - deduplicating...")
+            
+            # Show some examples of duplicates before deduplication
+            dup_examples = candidates['WELL_NUM_TRIMMED'].unique()[:3]
+            logger.warning(f"   Example duplicate licenses: {list(dup_examples)}")
+            
+            # Smart deduplication over the duplicated licenses only: per license keep the
+            # row with the best UWI priority (BC UWIs first), then the lowest UWI, then the
+            # first row - (priority, UWI) is ranked as one integer for groupby idxmin
+            priority = uwi_priority(candidates['UWI'])
+            uwi_codes, uwi_values = pd.factorize(candidates['UWI'], sort=True)
+            uwi_codes = np.where(uwi_codes < 0, len(uwi_values), uwi_codes)  # missing UWIs last
+            rank = pd.Series(priority.astype(np.int64) * (len(uwi_values) + 1) + uwi_codes)
+            winners = rank.groupby(candidates['WELL_NUM_TRIMMED'].to_numpy(), sort=False).idxmin().to_numpy()
+            
+            is_winner = np.zeros(len(candidates), dtype=bool)
+            is_winner[winners] = True
+            kept_uwis = pd.Series(candidates['UWI'].to_numpy()[winners],
+                                  index=candidates['WELL_NUM_TRIMMED'].to_numpy()[winners])
+            self.discarded_duplicates = candidates[~is_winner].assign(
+                UWI_PRIORITY=priority[~is_winner],
+                KEPT_UWI=lambda discarded: discarded['WELL_NUM_TRIMMED'].map(kept_uwis))
+            
+            keep = ~duplicated
+            keep[np.flatnonzero(duplicated)[winners]] = True
+            gdc_df = gdc_df[keep]
+            logger.info(f"📊 After smart deduplication: {len(gdc_df)} unique license numbers "
+                        f"({len(self.discarded_duplicates)} duplicate rows kept for audit)")
+            
+            # Validate deduplication worked
+            remaining_duplicates = gdc_df['WELL_NUM_TRIMMED'].duplicated().sum()
+            if remaining_duplicates > 0:
+                logger.error(f"❌ DEDUPLICATION FAILED: Still have {remaining_duplicates} duplicates!")
+                dup_examples = gdc_df[gdc_df['WELL_NUM_TRIMMED'].duplicated(keep=False)]['WELL_NUM_TRIMMED'].unique()[:3]
+                logger.error(f"   Examples: {list(dup_examples)}")
+                return pd.DataFrame()  # Return empty to prevent merge issues
+            else:
+                logger.info("✅ Deduplication successful - no remaining duplicates")
+        
+        return gdc_df
+    
     def build_gdc_lookup_table(self) -> pd.DataFrame:
         """
         Build a comprehensive lookup table from GDC database
@@ -127,98 +363,113 @@ class GDCEnhancer:
         """
         logger.info("🔄 Building GDC license/UWI lookup table...")
         
-        query = """
-        SELECT WELL_NUM,
-               UWI,
-               GSL_UWID,
-               WELL_NAME,
-               PROVINCE_STATE,
-               SURFACE_LATITUDE,
-               SURFACE_LONGITUDE,
-               BOTTOM_HOLE_LATITUDE,
-               BOTTOM_HOLE_LONGITUDE,
-               DRILL_TD,
-               FINAL_DRILL_DATE,
-               FINAL_TD,
-               GSL_DAYS_ON,
-               MAX_TVD,
-               PROFILE_TYPE,
-               RIG_RELEASE_DATE,
-               SPUD_DATE
-        FROM GDC.WELL 
-        WHERE WELL_NUM IS NOT NULL
-        AND PROVINCE_STATE IN ('AB', 'BC')
+        try:
+            return self.derive_gdc_lookup(self.fetch_gdc_wells())
+        except Exception as e:
+            logger.error(f"❌ Error building GDC lookup table: {e}")
+            return pd.DataFrame()
+    
+    def _snapshot_wells(self) -> pd.DataFrame:
+        """The snapshot's wells, without trimmed licenses if another LOOKUP_VERSION trimmed them"""
+        gdc_wells = self.snapshot.read_wells()
+        if self.snapshot.stamp.lookup_signature != str(LOOKUP_VERSION):
+            gdc_wells = gdc_wells.drop(columns=['WELL_NUM_TRIMMED'], errors='ignore')
+        return gdc_wells
+    
+    def _snapshot_lookup(self) -> pd.DataFrame:
+        """The snapshot's lookup, re-derived from its wells if built by another LOOKUP_VERSION"""
+        logger.info(f"📦 Using {self.snapshot.describe()}")
+        if self.snapshot.stamp.lookup_signature != str(LOOKUP_VERSION):
+            logger.info("🔄 Snapshot lookup built by another derivation - re-deriving from snapshot wells")
+            return self.derive_gdc_lookup(self._snapshot_wells())
+        self.discarded_duplicates = self.snapshot.read_duplicates()
+        return self.snapshot.read_lookup()
+    
+    def load_gdc_lookup(self, license_keys: Optional[List[str]] = None) -> Tuple[pd.DataFrame, Optional[str]]:
+        """
+        GDC lookup table from the snapshot when fresh (or offline), otherwise from the database
+        
+        Database fetches refresh the snapshot: incrementally (rows changed since the
+        snapshot's watermark) when possible, fully otherwise - unless the fetch mode
+        picks a targeted fetch of license_keys (the bit data's trimmed licenses), which
+        auto mode only does without snapshots. refresh=True always fetches fully. If
+        the database is unreachable, a stale snapshot is used. Fetch mode, rows and
+        bytes transferred are recorded in fetch_stats. Returns (lookup, error message or None).
         """
+        self.fetch_stats = {'gdc_fetch_mode': 'snapshot', 'gdc_rows_fetched': 0}
+        snapshot = self.snapshot if self.snapshot is not None and self.snapshot.enabled else None
+        query_signature = self.query_signature()
+        
+        if self.offline:
+            if snapshot is None:
+                return pd.DataFrame(), 'Offline mode needs a GDC snapshot (pyarrow not installed or snapshots disabled)'
+            if not snapshot.exists(query_signature):
+                return pd.DataFrame(), f'No GDC snapshot in {snapshot.snapshot_dir} for offline mode'
+            return self._snapshot_lookup(), None
         
+        usable_snapshot = snapshot is not None and self.fetch_mode != 'targeted' and not self.refresh
+        if usable_snapshot and snapshot.is_fresh(query_signature):
+            return self._snapshot_lookup(), None
+        
+        if not self.connect():
+            if snapshot is not None and snapshot.exists(query_signature):
+                logger.warning("⚠️  GDC database unreachable - using stale snapshot")
+                return self._snapshot_lookup(), None
+            return pd.DataFrame(), 'Failed to connect to GDC database'
+        
+        # Choose how to fetch: snapshots are refreshed incrementally or rebuilt by a full pull
+        # (a targeted fetch would leave them to age), so auto mode fetches only the data's
+        # licenses when there is no snapshot to keep
+        incremental = usable_snapshot and not snapshot.needs_full_refresh(query_signature)
+        key_count = len(license_keys) if license_keys is not None else None
+        if self.refresh:
+            mode = 'full'
+        elif self.fetch_mode == 'targeted' or (
+                self.fetch_mode == 'auto' and snapshot is None and key_count is not None
+                and 0 < key_count <= self.targeted_max_keys):
+            mode = 'targeted'
+        else:
+            mode = 'incremental' if incremental else 'full'
+        logger.info(f"🔄 Building GDC license/UWI lookup table ({mode} fetch"
+                    + (f", {key_count} distinct licenses)..." if key_count is not None else ")..."))
+        
+        self.fetch_stats['gdc_fetch_mode'] = mode
+        bytes_before = self._session_bytes_sent()
         try:
-            gdc_df = pd.read_sql(query, self.connection)
-            logger.info(f"📊 Retrieved {len(gdc_df)} records from GDC database")
-            
-            # Create trimmed license numbers for matching
-            gdc_df['WELL_NUM_TRIMMED'] = gdc_df['WELL_NUM'].apply(self.trim_leading_zeros)
-            
-            # Remove records where trimmed license is None/empty
-            gdc_df = gdc_df[gdc_df['WELL_NUM_TRIMMED'].notna()].copy()
-            
-            logger.info(f"📊 {len(gdc_df)} records with valid license numbers for matching")
-            
-            # Check for duplicates and deduplicate if necessary
-            duplicate_count = gdc_df['WELL_NUM_TRIMMED'].duplicated().sum()
-            if duplicate_count > 0:
-                logger.warning(f"⚠️  Found {duplicate_count} duplicate license numbers in GDC - deduplicating...")
-                
-                # Show some examples of duplicates before deduplication
-                dup_examples = gdc_df[gdc_df['WELL_NUM_TRIMMED'].duplicated(keep=False)]['WELL_NUM_TRIMMED'].unique()[:3]
-                logger.warning(f"   Example duplicate licenses: {list(dup_examples)}")
-                
-                # Smart deduplication: create sorting keys to prefer BC UWIs
-                def get_uwi_priority(uwi):
-                    if pd.isna(uwi):
-                        return 9999  # Lowest priority for null UWIs
-                    uwi_str = str(uwi)
-                    
-                    # Modern BC UWIs (200, 201, 202, etc.) - highest priority
-                    if uwi_str.startswith('200'):
-                        return 1
-                    elif uwi_str.startswith('201'):
-                        return 2  
-                    elif uwi_str.startswith('202'):
-                        return 3
-                    elif uwi_str.startswith('20') and len(uwi_str) == 16:
-                        return 4  # Other 20x BC UWIs
-                    
-                    # Old BC format (1BC, 2BC, etc.) - medium priority
-                    elif 'BC' in uwi_str:
-                        return 5
-                    
-                    # Alberta UWIs starting with 1 - lower priority
-                    elif uwi_str.startswith('1') and len(uwi_str) == 16:
-                        return 6
-                    
-                    # Everything else - lowest priority
-                    else:
-                        return 7
-                
-                gdc_df['uwi_priority'] = gdc_df['UWI'].apply(get_uwi_priority)
-                gdc_df = gdc_df.sort_values(['WELL_NUM_TRIMMED', 'uwi_priority', 'UWI']).drop_duplicates(subset=['WELL_NUM_TRIMMED'], keep='first')
-                gdc_df = gdc_df.drop(columns=['uwi_priority'])
-                logger.info(f"📊 After smart deduplication: {len(gdc_df)} unique license numbers")
-                
-                # Validate deduplication worked
-                remaining_duplicates = gdc_df['WELL_NUM_TRIMMED'].duplicated().sum()
-                if remaining_duplicates > 0:
-                    logger.error(f"❌ DEDUPLICATION FAILED: Still have {remaining_duplicates} duplicates!")
-                    dup_examples = gdc_df[gdc_df['WELL_NUM_TRIMMED'].duplicated(keep=False)]['WELL_NUM_TRIMMED'].unique()[:3]
-                    logger.error(f"   Examples: {list(dup_examples)}")
-                    return pd.DataFrame()  # Return empty to prevent merge issues
-                else:
-                    logger.info("✅ Deduplication successful - no remaining duplicates")
-            
-            return gdc_df
-            
+            if mode == 'targeted':
+                if license_keys is None:
+                    raise ValueError("Targeted GDC fetch needs the bit data's license numbers")
+                gdc_wells = self.fetch_gdc_wells_for_licenses(license_keys)
+            elif mode == 'full':
+                gdc_wells = self.fetch_gdc_wells()
+            else:
+                since = snapshot.refresh_since()
+                changed = self.fetch_gdc_wells(since)
+                logger.info(f"🔄 Incremental GDC refresh: {len(changed)} rows changed since {since:%Y-%m-%d %H:%M}")
+                gdc_wells = self.filter_gdc_wells(GDCSnapshot.upsert(self._snapshot_wells(), changed, GDC_WELL_KEY))
+            gdc_lookup = self.derive_gdc_lookup(gdc_wells)
         except Exception as e:
             logger.error(f"❌ Error building GDC lookup table: {e}")
-            return pd.DataFrame()
+            if snapshot is not None and snapshot.exists(query_signature):
+                logger.warning("⚠️  Using stale GDC snapshot")
+                self.fetch_stats['gdc_fetch_mode'] = 'snapshot'
+                return self._snapshot_lookup(), None
+            return pd.DataFrame(), None
+        finally:
+            bytes_after = self._session_bytes_sent()
+            if bytes_before is not None and bytes_after is not None:
+                self.fetch_stats['gdc_bytes_transferred'] = bytes_after - bytes_before
+                self.fetch_stats['gdc_bytes_measured'] = True
+            else:
+                self.fetch_stats['gdc_bytes_transferred'] = self.fetch_stats.get('gdc_payload_bytes', 0)
+                self.fetch_stats['gdc_bytes_measured'] = False
+            self.fetch_stats.pop('gdc_payload_bytes', None)
+        
+        if (snapshot is not None and mode != 'targeted' and not gdc_lookup.empty
+                and snapshot.write(gdc_wells, gdc_lookup, query_signature, str(LOOKUP_VERSION),
+                                   GDC_CHANGE_COLUMNS, mode == 'full', self.discarded_duplicates)):
+            logger.info(f"💾 Saved {snapshot.describe()}")
+        return gdc_lookup, None
     
     def enhance_data(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
         """
@@ -227,18 +478,10 @@ class GDCEnhancer:
         Returns:
             Tuple of (enhanced_dataframe, enhancement_stats)
         """
-        if not self.connect():
-            return df, {'error': 'Failed to connect to GDC database'}
-        
         try:
-            # Build GDC lookup table
-            gdc_lookup = self.build_gdc_lookup_table()
-            if gdc_lookup.empty:
-                logger.error("❌ No GDC lookup data available")
-                return df, {'error': 'No GDC lookup data available'}
-            
-            # Create enhanced copy of input data
-            enhanced_df = df.copy()
+            # Create enhanced copy of input data; categorical and string fields only accept
+            # known categories / strings, so they are patched as objects and re-typed at the end
+            enhanced_df = release_storage_types(df.copy())
             
             # Track enhancement statistics
             stats = {
@@ -273,7 +516,7 @@ class GDCEnhancer:
                     logger.info(f"   🎯 Derived province for {derived_count} records from longitude")
             
             # Add trimmed license numbers for matching
-            enhanced_df['license_number_trimmed'] = enhanced_df['license_number'].apply(self.trim_leading_zeros)
+            enhanced_df['license_number_trimmed'] = trim_license_numbers(enhanced_df['license_number'])
             
             # Check for duplicates in source data
             source_duplicates = enhanced_df['license_number_trimmed'].duplicated().sum()
@@ -290,6 +533,23 @@ class GDCEnhancer:
             # Count records with license numbers
             stats['records_with_license'] = enhanced_df['license_number_trimmed'].notna().sum()
             
+            # Load GDC lookup table (snapshot, or all / only these licenses from the database)
+            license_keys = enhanced_df['license_number_trimmed'].dropna().unique().tolist()
+            gdc_lookup, lookup_error = self.load_gdc_lookup(license_keys)
+            if lookup_error:
+                logger.error(f"❌ {lookup_error}")
+                return df, {'error': lookup_error}
+            if gdc_lookup.empty:
+                logger.error("❌ No GDC lookup data available")
+                return df, {'error': 'No GDC lookup data available'}
+            stats.update(self.fetch_stats)
+            
+            # Audit only the discarded duplicates of licenses this data joins on
+            if not self.discarded_duplicates.empty:
+                self.discarded_duplicates = self.discarded_duplicates[
+                    self.discarded_duplicates['WELL_NUM_TRIMMED'].isin(license_keys)]
+            stats['gdc_duplicates_discarded'] = len(self.discarded_duplicates)
+            
             logger.info(f"🔄 Enhancing {stats['total_records']} records ({stats['records_with_license']} with license numbers)...")
             
             # Check GDC lookup for duplicates before merge - CRITICAL for preventing Type 2 duplicates
@@ -315,11 +575,18 @@ class GDCEnhancer:
             else:
                 logger.info("✅ GDC lookup table verified - no duplicates that could cause Type 2 duplicate rows")
             
-            # Merge with GDC data on trimmed license numbers
+            # Merge with GDC data on trimmed license numbers (optionally as int64 keys)
+            if self.integer_keys:
+                enhanced_df['license_join_key'], join_keys = integer_join_keys(
+                    enhanced_df['license_number_trimmed'], gdc_lookup['WELL_NUM_TRIMMED'])
+                gdc_lookup = gdc_lookup.assign(license_join_key=join_keys)
+                left_on = right_on = 'license_join_key'
+            else:
+                left_on, right_on = 'license_number_trimmed', 'WELL_NUM_TRIMMED'
             merged_df = enhanced_df.merge(
                 gdc_lookup,
-                left_on='license_number_trimmed',
-                right_on='WELL_NUM_TRIMMED',
+                left_on=left_on,
+                right_on=right_on,
                 how='left',
                 suffixes=('', '_GDC')
             )
@@ -430,7 +697,7 @@ class GDCEnhancer:
             
             # Clean up temporary columns
             columns_to_drop = [
-                'license_number_trimmed', 'WELL_NUM', 'UWI', 'GSL_UWID', 
+                'license_number_trimmed', 'license_join_key', 'WELL_NUM', 'UWI', 'GSL_UWID', 
                 'WELL_NAME_GDC', 'PROVINCE_STATE', 'WELL_NUM_TRIMMED',
                 # Original GDC columns that are now mapped to prefixed versions
                 'BOTTOM_HOLE_LATITUDE', 'BOTTOM_HOLE_LONGITUDE',
@@ -439,6 +706,7 @@ class GDCEnhancer:
                 'SPUD_DATE', 'SURFACE_LATITUDE', 'SURFACE_LONGITUDE'
             ]
             enhanced_df = merged_df.drop(columns=[col for col in columns_to_drop if col in merged_df.columns])
+            enhanced_df = apply_storage_types(enhanced_df, DataMappingConfig().get_storage_types())
             
             # Log enhancement results
             logger.info(f"📊 GDC Enhancement Results:")
@@ -451,6 +719,11 @@ class GDCEnhancer:
             logger.info(f"   🌍 Province/state enhanced: {stats['province_enhanced']}")
             logger.info(f"   🏗️  GDC well data fields enhanced: {stats['gdc_well_fields_enhanced']}")
             logger.info(f"   🎯 Province derived from longitude: {stats['province_derived']}")
+            logger.info(f"   📡 GDC fetch: {stats['gdc_fetch_mode']}, {stats['gdc_rows_fetched']} rows"
+                        + (f", {stats['gdc_bytes_transferred'] / 1024 ** 2:.1f} MB"
+                           f"{'' if stats['gdc_bytes_measured'] else ' (estimated)'}"
+                           if 'gdc_bytes_transferred' in stats else ''))
+            logger.info(f"   🧹 GDC duplicate rows discarded: {stats['gdc_duplicates_discarded']}")
             logger.info(f"   ❓ Unmatched licenses: {len(stats.get('unmatched_licenses', []))}")
             
             return enhanced_df, stats
@@ -492,6 +765,23 @@ class GDCEnhancer:
                 f.write(f"Province/state enhanced from GDC: {stats['province_enhanced']:,}\n")
                 f.write(f"Province derived from longitude: {stats['province_derived']:,}\n\n")
                 
+                f.write("GDC FETCH\n")
+                f.write("-" * 9 + "\n")
+                f.write(f"Fetch mode: {stats.get('gdc_fetch_mode', 'unknown')}\n")
+                f.write(f"Rows fetched: {stats.get('gdc_rows_fetched', 0):,}\n")
+                if 'gdc_bytes_transferred' in stats:
+                    estimated = '' if stats['gdc_bytes_measured'] else ' (estimated from fetched data)'
+                    f.write(f"Bytes transferred: {stats['gdc_bytes_transferred']:,}{estimated}\n")
+                f.write("\n")
+                
+                if not self.discarded_duplicates.empty:
+                    audit_file = output_dir / f"GDC_Discarded_Duplicates_{timestamp}.csv"
+                    self.discarded_duplicates.to_csv(audit_file, index=False)
+                    f.write("GDC DUPLICATE LICENSES\n")
+                    f.write("-" * 22 + "\n")
+                    f.write(f"Duplicate rows discarded: {len(self.discarded_duplicates):,}\n")
+                    f.write(f"Discarded rows with the kept UWI: {audit_file.name}\n\n")
+                
                 if stats['unmatched_licenses']:
                     f.write("UNMATCHED LICENSE NUMBERS (first 20)\n")
                     f.write("-" * 35 + "\n")
@@ -506,18 +796,27 @@ class GDCEnhancer:
             logger.error(f"❌ Error generating enhancement report: {e}")
             return None
 
-def enhance_with_gdc(df: pd.DataFrame, output_dir: Path) -> Tuple[pd.DataFrame, Dict]:
+def enhance_with_gdc(df: pd.DataFrame, output_dir: Path, offline: bool = False, refresh: bool = False,
+                     snapshot_ttl_hours: float = 24, fetch_mode: str = 'auto',
+                     use_snapshot: bool = True) -> Tuple[pd.DataFrame, Dict]:
     """
     Convenience function to enhance dataframe with GDC data
     
     Args:
         df: DataFrame to enhance
         output_dir: Directory for saving reports
+        offline: Use the local GDC snapshot only, never the database
+        refresh: Force a full GDC fetch instead of using/incrementally refreshing the snapshot
+        snapshot_ttl_hours: Age after which the snapshot is refreshed from the database
+        fetch_mode: 'auto', 'full' (all AB/BC wells) or 'targeted' (only the data's licenses);
+            with snapshots on, 'auto' keeps the snapshot complete and always pulls all wells
+        use_snapshot: Keep a local GDC snapshot (False queries the database every run)
         
     Returns:
         Tuple of (enhanced_dataframe, enhancement_stats)
     """
-    enhancer = GDCEnhancer()
+    enhancer = GDCEnhancer(snapshot_ttl_hours=snapshot_ttl_hours, offline=offline, refresh=refresh,
+                           fetch_mode=fetch_mode, use_snapshot=use_snapshot)
     enhanced_df, stats = enhancer.enhance_data(df)
     
     # Generate report if enhancement was successful
@@ -7,11 +7,14 @@ Uses multiple verification criteria and compound keys (license + province).
 import pandas as pd
 import numpy as np
 from pathlib import Path
-import oracledb
 from typing import Dict, List, Tuple, Optional
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import re
+from excel_readers import read_excel_sheet
+from gdc_access import DEFAULT_BATCH_SIZE, GDCPool, fetch_frame, shared_pool
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -20,27 +23,16 @@ logger = logging.getLogger(__name__)
 class SafeGDCLicenseLookup:
     """Conservative GDC Oracle database lookup to avoid false matches"""
     
-    def __init__(self):
-        self.connection_params = {
-            'host': 'WC-CGY-ORAP01',
-            'port': 1521,
-            'service': 'PRD1',
-            'user': 'synergyro',
-            'password': 'synergyro',
-            'schema': 'GDC'
-        }
+    def __init__(self, fetch_batch_size: int = DEFAULT_BATCH_SIZE, pool: Optional[GDCPool] = None):
+        self.pool = pool
         self.connection = None
+        self.fetch_batch_size = fetch_batch_size
         
     def connect(self) -> bool:
-        """Establish connection to Oracle database"""
+        """Check out a GDC session from the pool"""
         try:
-            dsn = f"{self.connection_params['host']}:{self.connection_params['port']}/{self.connection_params['service']}"
-            
-            self.connection = oracledb.connect(
-                user=self.connection_params['user'],
-                password=self.connection_params['password'],
-                dsn=dsn
-            )
+            self.pool = self.pool or shared_pool()
+            self.connection = self.pool.acquire()
             
             logger.info("✅ Successfully connected to Oracle GDC database")
             return True
@@ -50,11 +42,45 @@ class SafeGDCLicenseLookup:
             return False
     
     def disconnect(self):
-        """Close database connection"""
+        """Return the session to the pool"""
         if self.connection:
-            self.connection.close()
+            self.pool.release(self.connection)
+            self.connection = None
             logger.info("🔌 Disconnected from Oracle database")
     
+    def fetch_concurrently(self, query: str, param_sets: List[Dict]) -> List[pd.DataFrame]:
+        """
+        Run query once per parameter set over up to pool_max sessions at once
+        The session held since connect() takes its share of the queries and the other
+        workers check out their own, so the pool is never asked for more than pool_max
+        """
+        self.pool = self.pool or shared_pool()
+        results: List[Optional[pd.DataFrame]] = [None] * len(param_sets)
+        pending = iter(range(len(param_sets)))
+        pending_lock = threading.Lock()
+        
+        def drain(connection):
+            while True:
+                with pending_lock:
+                    index = next(pending, None)
+                if index is None:
+                    return
+                results[index] = fetch_frame(connection, query, param_sets[index], self.fetch_batch_size)
+        
+        def drain_pooled():
+            with self.pool.session() as connection:
+                drain(connection)
+        
+        workers = self.pool.settings.pool_max - (1 if self.connection is not None else 0)
+        workers = min(workers, len(param_sets))
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+            futures = [executor.submit(drain_pooled) for _ in range(workers)]
+            if self.connection is not None:
+                drain(self.connection)
+            for future in futures:
+                future.result()
+        return results
+    
     def infer_province_from_longitude(self, longitude: float) -> str:
         """
         Infer province from longitude using Alberta-BC border at 120°W
@@ -129,37 +155,34 @@ class SafeGDCLicenseLookup:
         safe_matches = []
         tolerance = 0.001  # ~100m tolerance for coordinates
         
+        # Query GDC for wells in same province with similar coordinates
+        query = """
+        SELECT WELL_NUM, WELL_NAME, OPERATOR, PROVINCE_STATE,
+               SURFACE_LATITUDE, SURFACE_LONGITUDE, SPUD_DATE,
+               ASSIGNED_FIELD
+        FROM GDC.WELL 
+        WHERE PROVINCE_STATE = :province
+        AND WELL_NUM IS NOT NULL
+        AND SURFACE_LATITUDE BETWEEN :lat_min AND :lat_max
+        AND SURFACE_LONGITUDE BETWEEN :lon_min AND :lon_max
+        """
+        
         try:
-            # Process each record individually for maximum safety
-            for idx, row in missing_df.iterrows():
-                if pd.isna(row['latitude']) or pd.isna(row['longitude']):
-                    continue
-                
+            # Process each record individually for maximum safety; the candidate
+            # queries run concurrently, matches are verified in record order
+            searchable = [(idx, row) for idx, row in missing_df.iterrows()
+                          if not (pd.isna(row['latitude']) or pd.isna(row['longitude']))
+                          and row['inferred_province'] != 'UNKNOWN']
+            candidate_frames = self.fetch_concurrently(query, [{
+                'province': row['inferred_province'],
+                'lat_min': row['latitude'] - tolerance,
+                'lat_max': row['latitude'] + tolerance,
+                'lon_min': row['longitude'] - tolerance,
+                'lon_max': row['longitude'] + tolerance
+            } for _, row in searchable])
+            
+            for (idx, row), candidates in zip(searchable, candidate_frames):
                 province = row['inferred_province']
-                if province == 'UNKNOWN':
-                    continue
-                
-                # Query GDC for wells in same province with similar coordinates
-                query = """
-                SELECT WELL_NUM, WELL_NAME, OPERATOR, PROVINCE_STATE,
-                       SURFACE_LATITUDE, SURFACE_LONGITUDE, SPUD_DATE,
-                       ASSIGNED_FIELD
-                FROM GDC.WELL 
-                WHERE PROVINCE_STATE = :province
-                AND WELL_NUM IS NOT NULL
-                AND SURFACE_LATITUDE BETWEEN :lat_min AND :lat_max
-                AND SURFACE_LONGITUDE BETWEEN :lon_min AND :lon_max
-                """
-                
-                params = {
-                    'province': province,
-                    'lat_min': row['latitude'] - tolerance,
-                    'lat_max': row['latitude'] + tolerance,
-                    'lon_min': row['longitude'] - tolerance,
-                    'lon_max': row['longitude'] + tolerance
-                }
-                
-                candidates = pd.read_sql(query, self.connection, params=params)
                 
                 if candidates.empty:
                     continue
@@ -288,7 +311,7 @@ class SafeGDCLicenseLookup:
                 for i, well_name in enumerate(unique_wells):
                     params[f'well{i}'] = well_name.upper()
                 
-                exact_matches = pd.read_sql(query, self.connection, params=params)
+                exact_matches = fetch_frame(self.connection, query, params, self.fetch_batch_size)
                 logger.info(f"📊 Found {len(exact_matches)} exact name matches in {province}")
                 
                 # Verify each exact match with additional criteria
@@ -392,7 +415,7 @@ def main():
         latest_file = max(integrated_files, key=lambda x: x.stat().st_mtime)
         logger.info(f"📊 Loading data from: {latest_file.name}")
         
-        df = pd.read_excel(latest_file)
+        df = read_excel_sheet(latest_file)
         missing_df = df[df['license_number'].isna()].copy()
         
         logger.info(f"🔍 Found {len(missing_df)} records missing license numbers")
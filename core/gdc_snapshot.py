@@ -0,0 +1,180 @@
+"""
+GDC Snapshot Store
+Keeps a local Parquet snapshot of the GDC.WELL rows the enhancement uses.
+
+The snapshot holds the raw query result (wells.parquet), the derived,
+deduplicated license lookup (lookup.parquet) and the duplicate rows the
+deduplication discarded (duplicates.parquet, for auditing), plus a JSON stamp with the
+snapshot format version, the query and lookup signatures it was built with,
+when it was last fully and incrementally refreshed, and the change-date high
+watermark. A snapshot younger than its TTL is used as is; an older one is
+refreshed incrementally by fetching only rows whose change-date columns are
+past the watermark and upserting them by key. Deleted rows are only noticed
+by a full refresh, which happens when the last one is older than
+full_refresh_days (or on demand). Offline runs read the snapshot without
+touching the database.
+"""
+
+import json
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Optional
+
+import pandas as pd
+
+from parse_cache import PARQUET_AVAILABLE, read_parquet_frame, write_parquet_frame
+
+SNAPSHOT_VERSION = 2
+
+# Rows changed shortly before the watermark may commit after it was read;
+# incremental fetches start this far back (upserts make the overlap harmless)
+REFRESH_OVERLAP = timedelta(hours=1)
+
+
+@dataclass
+class SnapshotStamp:
+    """Version stamp and refresh state of a snapshot"""
+    version: int
+    query_signature: str  # columns/filter the wells were fetched with
+    lookup_signature: str  # derivation the lookup was built with
+    rows: int
+    lookup_rows: int
+    full_refresh_at: str
+    refreshed_at: str
+    watermark: Optional[str] = None  # latest change date in the snapshot
+    change_columns: List[str] = field(default_factory=list)
+
+
+class GDCSnapshot:
+    """Local snapshot of GDC well rows and the lookup derived from them"""
+
+    def __init__(self, snapshot_dir: Path, ttl_hours: float = 24, full_refresh_days: float = 7):
+        self.snapshot_dir = Path(snapshot_dir)
+        self.wells_path = self.snapshot_dir / 'wells.parquet'
+        self.lookup_path = self.snapshot_dir / 'lookup.parquet'
+        self.duplicates_path = self.snapshot_dir / 'duplicates.parquet'
+        self.stamp_path = self.snapshot_dir / 'snapshot.json'
+        self.ttl = timedelta(hours=ttl_hours)
+        self.full_refresh_interval = timedelta(days=full_refresh_days)
+        self.enabled = PARQUET_AVAILABLE
+        self.stamp: Optional[SnapshotStamp] = None
+        self.load_stamp()
+
+    def load_stamp(self):
+        """Load the snapshot stamp (missing, unreadable or outdated stamps mean no snapshot)"""
+        self.stamp = None
+        if not self.enabled or not self.stamp_path.exists():
+            return
+
+        try:
+            with open(self.stamp_path) as f:
+                stamp = SnapshotStamp(**json.load(f))
+            if stamp.version != SNAPSHOT_VERSION:
+                print("⚠️  GDC snapshot format changed - a full refresh is needed")
+                return
+            if not (self.wells_path.exists() and self.lookup_path.exists()):
+                return
+            self.stamp = stamp
+        except Exception as e:
+            print(f"⚠️  Could not read GDC snapshot stamp ({e}) - a full refresh is needed")
+
+    def exists(self, query_signature: str) -> bool:
+        """Whether a snapshot fetched with this query is on disk"""
+        return self.stamp is not None and self.stamp.query_signature == query_signature
+
+    def age(self) -> timedelta:
+        return datetime.now() - datetime.fromisoformat(self.stamp.refreshed_at)
+
+    def is_fresh(self, query_signature: str) -> bool:
+        """Whether the snapshot can be used without contacting the database"""
+        return self.exists(query_signature) and self.age() < self.ttl
+
+    def needs_full_refresh(self, query_signature: str) -> bool:
+        """Whether an incremental refresh cannot be trusted (no snapshot, no watermark, or the last full refresh is too old)"""
+        if not self.exists(query_signature) or self.stamp.watermark is None:
+            return True
+        full_age = datetime.now() - datetime.fromisoformat(self.stamp.full_refresh_at)
+        return full_age >= self.full_refresh_interval
+
+    def refresh_since(self) -> datetime:
+        """Change-date lower bound for the next incremental fetch"""
+        return datetime.fromisoformat(self.stamp.watermark) - REFRESH_OVERLAP
+
+    def read_wells(self) -> pd.DataFrame:
+        return read_parquet_frame(self.wells_path)
+
+    def read_lookup(self) -> pd.DataFrame:
+        return read_parquet_frame(self.lookup_path)
+
+    def read_duplicates(self) -> pd.DataFrame:
+        """Duplicate rows discarded when the lookup was derived (empty if none were stored)"""
+        if not self.duplicates_path.exists():
+            return pd.DataFrame()
+        return read_parquet_frame(self.duplicates_path)
+
+    @staticmethod
+    def upsert(wells: pd.DataFrame, changed: pd.DataFrame, key: str) -> pd.DataFrame:
+        """
+        Replace rows of wells whose key appears in changed and append new keys.
+
+        Null keys identify no row, so stored null-key wells are kept unless an
+        identical row comes in again (refreshes overlap the previous fetch), and
+        changed null-key rows are appended as they are.
+        """
+        kept = wells[~wells[key].isin(changed[key].dropna())]
+        stored_null = kept[kept[key].isna()]
+        changed_null = changed[changed[key].isna()]
+        if not stored_null.empty and not changed_null.empty:
+            # merge matches missing values with each other, so whole rows compare as equal
+            refetched = stored_null.reset_index().merge(changed_null.drop_duplicates(), on=list(changed.columns))
+            kept = kept.drop(refetched['index'])
+        return pd.concat([kept, changed], ignore_index=True)
+
+    def write(self, wells: pd.DataFrame, lookup: pd.DataFrame, query_signature: str,
+              lookup_signature: str, change_columns: List[str], full_refresh: bool,
+              duplicates: Optional[pd.DataFrame] = None) -> bool:
+        """Store wells, lookup and discarded duplicates and stamp them; returns False when Parquet is unavailable"""
+        if not self.enabled:
+            return False
+
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        if not (write_parquet_frame(wells, self.wells_path) and write_parquet_frame(lookup, self.lookup_path)):
+            return False
+        if duplicates is not None and not duplicates.empty:
+            if not write_parquet_frame(duplicates, self.duplicates_path):
+                return False
+        elif self.duplicates_path.exists():
+            self.duplicates_path.unlink()
+
+        present = [column for column in change_columns if column in wells.columns]
+        watermark = None
+        if present:
+            latest = pd.Series([pd.to_datetime(wells[column], errors='coerce').max() for column in present]).max()
+            watermark = latest.isoformat() if pd.notna(latest) else None
+
+        now = datetime.now().isoformat(timespec='seconds')
+        self.stamp = SnapshotStamp(
+            version=SNAPSHOT_VERSION,
+            query_signature=query_signature,
+            lookup_signature=lookup_signature,
+            rows=len(wells),
+            lookup_rows=len(lookup),
+            full_refresh_at=now if full_refresh or self.stamp is None else self.stamp.full_refresh_at,
+            refreshed_at=now,
+            watermark=watermark,
+            change_columns=present,
+        )
+        tmp_path = self.stamp_path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(asdict(self.stamp), f, indent=2)
+        tmp_path.replace(self.stamp_path)
+        return True
+
+    def describe(self) -> str:
+        """One-line summary for logs"""
+        if self.stamp is None:
+            return "no GDC snapshot"
+        hours = self.age().total_seconds() / 3600
+        return (f"GDC snapshot v{self.stamp.version}: {self.stamp.rows:,} wells, "
+                f"{self.stamp.lookup_rows:,} lookup rows, refreshed {hours:.1f}h ago")
@@ -0,0 +1,152 @@
+"""
+Manufacturer Normalizer
+Normalizes bit manufacturer names with alias rules loaded from a versioned rule file.
+
+manufacturer_rules.json holds named rule sets (the integration step's
+'standard' names, the analysis scripts' 'cleanup' and 'consolidation'
+groupings). Each set maps aliases to canonical names by exact match, then by
+prefix, then by regular expression, first matching rule in file order.
+Rules are compiled once per rule file version and applied to the distinct
+names of a column only (factorize), then broadcast back to every row, with
+a change log of what was mapped and how many rows it affected.
+"""
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+import numpy as np
+import pandas as pd
+
+RULES_PATH = Path(__file__).with_name('manufacturer_rules.json')
+
+CHANGE_LOG_COLUMNS = ['original', 'normalized', 'rule', 'pattern', 'rows']
+
+
+@dataclass
+class ManufacturerRuleSet:
+    """Compiled alias rules of one rule set"""
+    name: str
+    description: str = ''
+    strip: bool = False  # strip whitespace (and stringify non-text values) before matching
+    missing: Optional[str] = None  # name for missing values; None leaves them missing
+    exact: Dict[str, str] = field(default_factory=dict)
+    prefix: List[Tuple[str, str]] = field(default_factory=list)
+    regex: List[Tuple[Pattern, str]] = field(default_factory=list)
+
+    def resolve(self, value: Any) -> Tuple[Any, Optional[str], Optional[str]]:
+        """Canonical name of one distinct value, with the rule kind and pattern that produced it"""
+        if not isinstance(value, str):
+            if not self.strip:
+                return value, None, None
+            value = str(value)
+        key = value.strip() if self.strip else value
+
+        if key in self.exact:
+            return self.exact[key], 'exact', key
+        for prefix, canonical in self.prefix:
+            if key.startswith(prefix):
+                return canonical, 'prefix', prefix
+        for pattern, canonical in self.regex:
+            if pattern.search(key):
+                return canonical, 'regex', pattern.pattern
+        return key, ('strip' if key != value else None), None
+
+    def to_frame(self) -> pd.DataFrame:
+        """The rules as a table (rule kind, pattern, canonical name) in matching order"""
+        rows = [('exact', alias, canonical) for alias, canonical in self.exact.items()]
+        rows += [('prefix', prefix, canonical) for prefix, canonical in self.prefix]
+        rows += [('regex', pattern.pattern, canonical) for pattern, canonical in self.regex]
+        return pd.DataFrame(rows, columns=['rule', 'pattern', 'canonical'])
+
+
+@dataclass
+class ManufacturerRules:
+    """A loaded rule file"""
+    version: int
+    checksum: str  # content hash; changes whenever any rule changes
+    rule_sets: Dict[str, ManufacturerRuleSet]
+
+
+@lru_cache(maxsize=8)
+def _load_rules(path: str, modified_ns: int) -> ManufacturerRules:
+    """Parse and compile a rule file (cached per path and modification time)"""
+    raw = Path(path).read_bytes()
+    payload = json.loads(raw)
+
+    rule_sets = {}
+    for name, spec in payload['rule_sets'].items():
+        try:
+            regex = [(re.compile(pattern), canonical) for pattern, canonical in spec.get('regex', {}).items()]
+        except re.error as e:
+            raise ValueError(f"Invalid regex in manufacturer rule set '{name}': {e}") from e
+        rule_sets[name] = ManufacturerRuleSet(
+            name=name,
+            description=spec.get('description', ''),
+            strip=spec.get('strip', False),
+            missing=spec.get('missing'),
+            exact=dict(spec.get('exact', {})),
+            prefix=list(spec.get('prefix', {}).items()),
+            regex=regex,
+        )
+
+    return ManufacturerRules(
+        version=payload['version'],
+        checksum=hashlib.sha1(raw).hexdigest(),
+        rule_sets=rule_sets,
+    )
+
+
+def load_manufacturer_rules(rules_path: Optional[Path] = None) -> ManufacturerRules:
+    """Load the manufacturer rule file; recompiled only when the file changes"""
+    path = Path(rules_path or RULES_PATH)
+    return _load_rules(str(path), path.stat().st_mtime_ns)
+
+
+class ManufacturerNormalizer:
+    """Applies one rule set to manufacturer name columns"""
+
+    def __init__(self, rule_set: str = 'standard', rules_path: Optional[Path] = None):
+        self.rules = load_manufacturer_rules(rules_path)
+        if rule_set not in self.rules.rule_sets:
+            raise ValueError(f"Unknown manufacturer rule set: {rule_set} "
+                             f"(available: {sorted(self.rules.rule_sets)})")
+        self.rule_set = self.rules.rule_sets[rule_set]
+
+    def normalize(self, values: pd.Series) -> Tuple[pd.Series, pd.DataFrame]:
+        """
+        Normalize a manufacturer column.
+
+        Returns the normalized column (object dtype, or the input's string
+        dtype) and a change log with one row per distinct value that changed:
+        original, normalized, rule kind, matching pattern and row count,
+        largest first.
+        """
+        codes, uniques = pd.factorize(values)
+        uniques = np.asarray(uniques, dtype=object)
+        row_counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+
+        # Trailing slot is what missing values (code -1) become
+        normalized = np.empty(len(uniques) + 1, dtype=object)
+        changes = []
+        for i, value in enumerate(uniques):
+            normalized[i], rule, pattern = self.rule_set.resolve(value)
+            if str(normalized[i]) != str(value):
+                changes.append((value, normalized[i], rule, pattern, int(row_counts[i])))
+
+        missing = codes == -1
+        normalized[-1] = self.rule_set.missing
+        result = normalized[codes]
+        if self.rule_set.missing is None:
+            result[missing] = values.to_numpy(dtype=object)[missing]
+        elif missing.any():
+            changes.append((None, self.rule_set.missing, 'missing', None, int(missing.sum())))
+
+        dtype = values.dtype if isinstance(values.dtype, pd.StringDtype) else object
+        change_log = pd.DataFrame(changes, columns=CHANGE_LOG_COLUMNS)
+        change_log = change_log.sort_values('rows', ascending=False, kind='stable').reset_index(drop=True)
+        return pd.Series(result, index=values.index, dtype=dtype, name=values.name), change_log
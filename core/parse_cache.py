@@ -0,0 +1,209 @@
+"""
+Columnar Parse Cache
+Persists parsed source sheets as Parquet files so unchanged workbooks are not re-parsed.
+
+Each entry holds one sheet exactly as read from the workbook (after skip_rows,
+before standardization). Entries are keyed by the file fingerprint
+(path + size + mtime, optionally a content hash) together with the read
+options, so any change to the file or to its SourceConfig sheet/skip settings
+produces a new key. The cache is bounded by size and evicts least recently
+used entries.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+PICKLED_COLUMNS_KEY = b'pickled_columns'
+STRING_STORAGE_KEY = b'string_storage'
+NAN_COLUMNS_KEY = b'nan_columns'
+# Bumped when the stored layout changes so older entries miss
+CACHE_FORMAT = 3
+
+
+def file_fingerprint(file_path: Path, content_hash: bool = False, stat: Optional[os.stat_result] = None) -> str:
+    """Fingerprint a file by resolved path, size and mtime (plus content when requested)"""
+    stat = stat or file_path.stat()
+    digest = hashlib.sha1()
+    digest.update(str(file_path.resolve()).encode('utf-8'))
+    digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode('utf-8'))
+
+    if content_hash:
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def _missing_marker(values: pd.Series) -> Optional[str]:
+    """'nan' or 'none' when every missing value is float NaN or None, else None (mixed markers)"""
+    missing = values[values.isna()].to_numpy()
+    if all(value is None for value in missing):
+        return 'none'
+    if all(isinstance(value, float) for value in missing):
+        return 'nan'
+    return None
+
+
+def pickled_object_columns(df: pd.DataFrame) -> List[str]:
+    """Object columns whose values Parquet would not round-trip as the same Python objects"""
+    return [col for col in df.columns
+            if df[col].dtype == object
+            and (pd.api.types.infer_dtype(df[col], skipna=True) not in ('string', 'empty')
+                 or _missing_marker(df[col]) is None)]
+
+
+def nan_object_columns(df: pd.DataFrame, pickled: List[str]) -> List[str]:
+    """Stored object columns whose missing values are NaN (Parquet reads them back as None)"""
+    return [col for col in df.columns
+            if df[col].dtype == object and col not in pickled
+            and df[col].hasnans and _missing_marker(df[col]) == 'nan']
+
+
+def write_parquet_frame(df: pd.DataFrame, path: Path) -> bool:
+    """
+    Write a frame to Parquet, preserving the mixed-type object columns Excel produces.
+
+    Object columns that are not plain strings (e.g. license numbers stored as a mix
+    of ints and strings) are stored as pickled values and listed in the schema
+    metadata, as are the storage of string columns and the string columns whose
+    blanks are NaN, so read_parquet_frame returns the same values, dtypes, Python
+    types and missing markers.
+    Returns False when the frame cannot be stored (e.g. non-string column names).
+    """
+    if not PARQUET_AVAILABLE:
+        return False
+    if not all(isinstance(col, str) for col in df.columns) or df.columns.has_duplicates:
+        return False
+
+    pickled = pickled_object_columns(df)
+    nan_columns = nan_object_columns(df, pickled)
+    if pickled:
+        df = df.assign(**{col: [pickle.dumps(value) for value in df[col]] for col in pickled})
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    string_storage = {col: df[col].dtype.storage for col in df.columns if isinstance(df[col].dtype, pd.StringDtype)}
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                           PICKLED_COLUMNS_KEY: json.dumps(pickled).encode('utf-8'),
+                                           STRING_STORAGE_KEY: json.dumps(string_storage).encode('utf-8'),
+                                           NAN_COLUMNS_KEY: json.dumps(nan_columns).encode('utf-8')})
+
+    tmp_path = path.with_suffix('.tmp')
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, path)
+    return True
+
+
+def read_parquet_frame(path: Path) -> pd.DataFrame:
+    """Read a frame written by write_parquet_frame, restoring its pickled columns, string storage and NaN blanks"""
+    table = pq.read_table(path)
+    metadata = table.schema.metadata or {}
+    df = table.to_pandas()
+    for col in json.loads(metadata.get(PICKLED_COLUMNS_KEY, b'[]')):
+        df[col] = pd.Series([pickle.loads(value) for value in df[col]], index=df.index, dtype=object)
+    for col, storage in json.loads(metadata.get(STRING_STORAGE_KEY, b'{}')).items():
+        df[col] = df[col].astype(pd.StringDtype(storage))
+    for col in json.loads(metadata.get(NAN_COLUMNS_KEY, b'[]')):
+        df[col] = df[col].where(df[col].notna(), np.nan)
+    return df
+
+
+class ParseCache:
+    """Size-bounded LRU cache of parsed source sheets stored as Parquet"""
+
+    def __init__(self, cache_dir: Path, max_size_mb: float = 2048, content_hash: bool = False):
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.content_hash = content_hash
+        self.enabled = PARQUET_AVAILABLE
+
+        if not self.enabled:
+            print("⚠️  pyarrow not installed - parse cache disabled")
+
+    def cache_key(self, file_path: Path, read_options: Dict[str, Any],
+                  fingerprint: Optional[str] = None) -> str:
+        """Build the cache key for a file and the options it is read with"""
+        payload = {
+            'fingerprint': fingerprint or file_fingerprint(file_path, self.content_hash),
+            'options': read_options,
+            'format': CACHE_FORMAT,
+        }
+        return hashlib.sha1(json.dumps(payload, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.parquet"
+
+    def load(self, key: str) -> Optional[pd.DataFrame]:
+        """Return the cached frame for key, or None on a miss"""
+        if not self.enabled:
+            return None
+
+        path = self._entry_path(key)
+        if not path.exists():
+            return None
+
+        try:
+            df = read_parquet_frame(path)
+        except Exception as e:
+            print(f"   ⚠️  Discarding unreadable cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        # Touch the entry so eviction treats it as recently used
+        os.utime(path)
+        return df
+
+    def store(self, key: str, df: pd.DataFrame) -> bool:
+        """Persist a parsed frame under key and enforce the size bound"""
+        if not self.enabled:
+            return False
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            stored = write_parquet_frame(df, self._entry_path(key))
+        except Exception as e:
+            print(f"   ⚠️  Could not cache parsed sheet: {e}")
+            return False
+
+        if stored:
+            self.evict()
+        return stored
+
+    def evict(self) -> int:
+        """Remove least recently used entries until the cache fits max_size_mb"""
+        if not self.cache_dir.exists():
+            return 0
+
+        entries = [(p, p.stat()) for p in self.cache_dir.glob('*.parquet')]
+        total_size = sum(stat.st_size for _, stat in entries)
+        removed = 0
+
+        for path, stat in sorted(entries, key=lambda entry: entry[1].st_mtime):
+            if total_size <= self.max_size_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total_size -= stat.st_size
+            removed += 1
+
+        return removed
+
+    def clear(self) -> int:
+        """Remove every cache entry"""
+        removed = 0
+        for path in self.cache_dir.glob('*.parquet'):
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
@@ -0,0 +1,172 @@
+"""
+Integration Run Manifest
+Tracks which input files are already folded into the integrated dataset.
+
+Incremental integration stores each input file's standardized rows as its own
+Parquet partition. The manifest records, per file, the fingerprint it was
+processed at, its row count, the partition holding its rows and the source
+configuration signature in force (including the manufacturer rule file when
+the source uses it). A later run reprocesses only files that are new, changed,
+or whose source configuration changed, and drops partitions of files that
+disappeared.
+"""
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from data_mapping_config import DataMappingConfig, SourceConfig
+from manufacturer_normalizer import load_manufacturer_rules
+from parse_cache import PARQUET_AVAILABLE, read_parquet_frame, write_parquet_frame
+
+MANIFEST_VERSION = 4
+
+
+@dataclass
+class ManifestEntry:
+    """One processed input file"""
+    source: str
+    file_name: str
+    file_path: str
+    fingerprint: str
+    rows: int
+    partition: str
+    config_signature: str
+    processed_at: str
+    file_id: int  # high bits of the partition's record ids
+
+
+def source_config_signature(source_config: SourceConfig, config: Optional[DataMappingConfig] = None) -> str:
+    """
+    Hash of a source configuration, the rule files and standard units its steps use and
+    the bit size bands of the derived fields; any change invalidates its partitions
+    """
+    payload = asdict(source_config)
+    transform_steps = source_config.transform_steps or []
+    if 'standardize_bit_manufacturers' in transform_steps:
+        payload['manufacturer_rules'] = load_manufacturer_rules().checksum
+    if config is not None:
+        if 'convert_units' in transform_steps:
+            payload['standard_units'] = config.get_field_units()
+        payload['bit_size_bands'] = [asdict(band) for band in config.bit_size_bands]
+    return hashlib.sha1(json.dumps(payload, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+class RunManifest:
+    """Manifest of processed input files and their stored partitions"""
+
+    def __init__(self, manifest_dir: Path):
+        self.manifest_dir = Path(manifest_dir)
+        self.manifest_path = self.manifest_dir / 'manifest.json'
+        self.partition_dir = self.manifest_dir / 'partitions'
+        self.enabled = PARQUET_AVAILABLE
+        self.entries: Dict[str, ManifestEntry] = {}
+        self.load()
+
+    def load(self):
+        """Load the manifest from disk (an unreadable or outdated manifest starts empty)"""
+        self.entries = {}
+        if not self.manifest_path.exists():
+            return
+
+        try:
+            with open(self.manifest_path) as f:
+                payload = json.load(f)
+            if payload.get('version') != MANIFEST_VERSION:
+                print("⚠️  Run manifest version changed - rebuilding all partitions")
+                return
+            self.entries = {key: ManifestEntry(**entry) for key, entry in payload['files'].items()}
+        except Exception as e:
+            print(f"⚠️  Could not read run manifest ({e}) - rebuilding all partitions")
+
+    def save(self):
+        """Write the manifest atomically"""
+        self.manifest_dir.mkdir(parents=True, exist_ok=True)
+        payload = {
+            'version': MANIFEST_VERSION,
+            'updated_at': datetime.now().isoformat(timespec='seconds'),
+            'files': {key: asdict(entry) for key, entry in self.entries.items()},
+        }
+        tmp_path = self.manifest_path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(payload, f, indent=2)
+        tmp_path.replace(self.manifest_path)
+
+    @staticmethod
+    def file_key(file_path: Path) -> str:
+        return str(Path(file_path).resolve())
+
+    def plan(self, source_name: str, file_fingerprints: Dict[Path, str],
+             config_signature: str) -> Tuple[List[Path], List[Path], List[str]]:
+        """
+        Split a source's current files into unchanged and to-process, and list removed entries.
+
+        Returns (unchanged_files, files_to_process, removed_keys).
+        """
+        unchanged, to_process = [], []
+        current_keys = set()
+
+        for file_path, fingerprint in file_fingerprints.items():
+            key = self.file_key(file_path)
+            current_keys.add(key)
+            entry = self.entries.get(key)
+            if (entry is not None and entry.fingerprint == fingerprint
+                    and entry.config_signature == config_signature
+                    and (self.partition_dir / entry.partition).exists()):
+                unchanged.append(file_path)
+            else:
+                to_process.append(file_path)
+
+        removed = [key for key, entry in self.entries.items()
+                   if entry.source == source_name and key not in current_keys]
+        return unchanged, to_process, removed
+
+    def file_id(self, file_path: Path) -> Optional[int]:
+        """File id a processed file's record ids were packed with"""
+        entry = self.entries.get(self.file_key(file_path))
+        return entry.file_id if entry is not None else None
+
+    def next_file_id(self) -> int:
+        """Lowest file id not used by any entry"""
+        return max((entry.file_id for entry in self.entries.values()), default=-1) + 1
+
+    def read_partition(self, file_path: Path) -> pd.DataFrame:
+        """Load the stored rows for a processed file"""
+        entry = self.entries[self.file_key(file_path)]
+        return read_parquet_frame(self.partition_dir / entry.partition)
+
+    def write_partition(self, source_name: str, file_path: Path, fingerprint: str,
+                        config_signature: str, df: pd.DataFrame, file_id: int) -> bool:
+        """Store a file's rows as its partition and record it in the manifest"""
+        key = self.file_key(file_path)
+        partition = f"{source_name}_{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}.parquet"
+
+        self.partition_dir.mkdir(parents=True, exist_ok=True)
+        if not write_parquet_frame(df.reset_index(drop=True), self.partition_dir / partition):
+            # Leave it out of the manifest so the next run processes it again
+            self.entries.pop(key, None)
+            return False
+
+        self.entries[key] = ManifestEntry(
+            source=source_name,
+            file_name=Path(file_path).name,
+            file_path=key,
+            fingerprint=fingerprint,
+            rows=len(df),
+            partition=partition,
+            config_signature=config_signature,
+            processed_at=datetime.now().isoformat(timespec='seconds'),
+            file_id=file_id,
+        )
+        return True
+
+    def remove(self, key: str):
+        """Drop a file's entry and its partition"""
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            (self.partition_dir / entry.partition).unlink(missing_ok=True)
@@ -7,12 +7,14 @@ import pandas as pd
 from pathlib import Path
 from typing import Dict, List, Optional
 import json
+from excel_readers import list_sheet_names, read_excel_sheet
 
 class SourceConfigurationTool:
     """Interactive tool for configuring new data sources"""
     
-    def __init__(self, base_path: Optional[Path] = None):
+    def __init__(self, base_path: Optional[Path] = None, reader_engine: Optional[str] = None):
         self.base_path = base_path or Path(__file__).parent
+        self.reader_engine = reader_engine
     
     def analyze_new_source(self, file_path: str, sheet_name: Optional[str] = None) -> Dict:
         """Analyze a new data file to understand its structure"""
@@ -28,8 +30,7 @@ class SourceConfigurationTool:
         print(f"🔍 Analyzing file: {path.name}")
         
         # Read Excel file structure
-        excel_file = pd.ExcelFile(path)
-        sheet_names = excel_file.sheet_names
+        sheet_names = list_sheet_names(path, engine=self.reader_engine)
         
         print(f"📊 Sheets found: {sheet_names}")
         
@@ -44,7 +45,7 @@ class SourceConfigurationTool:
         
         for sheet in sheets_to_analyze:
             if sheet in sheet_names:
-                df = pd.read_excel(path, sheet_name=sheet, nrows=10)  # Sample first 10 rows
+                df = read_excel_sheet(path, sheet_name=sheet, engine=self.reader_engine, nrows=10)  # Sample first 10 rows
                 
                 analysis['sheets'][sheet] = {
                     'total_columns': len(df.columns),
@@ -286,7 +287,8 @@ class SourceConfigurationTool:
         for standard_field, source_column in config['column_mappings'].items():
             print(f"        '{standard_field}': '{source_column}',")
         
-        print("    }")
+        print("    },")
+        print("    transform_steps=['standardize_bit_manufacturers', 'standardize_contractors'],")
         print("),")
 
 def main():
@@ -0,0 +1,239 @@
+"""
+Standardization Steps
+Registry of reusable source transformation steps and the per-step metrics of a run.
+
+Each SourceConfig lists its steps by name in transform_steps and the engine
+runs them in order on the standardized frame it owns. A step takes that
+frame, the source's SourceConfig and the engine's DataMappingConfig (for
+settings shared by all sources, such as standard units), may mutate the
+frame in place, and returns it; a new vendor reuses steps by listing them, without engine changes.
+RunMetrics records wall time, rows in/out and the process memory delta of
+every step the engine runs (psutil is optional; without it no memory delta).
+"""
+
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from data_mapping_config import DataMappingConfig, SourceConfig
+from manufacturer_normalizer import ManufacturerNormalizer
+from unit_conversion import convert_units
+from vector_ops import map_unique
+
+try:
+    import psutil
+    _PROCESS = psutil.Process()
+except ImportError:
+    _PROCESS = None
+
+StepFunction = Callable[[pd.DataFrame, SourceConfig, DataMappingConfig], pd.DataFrame]
+
+STEP_REGISTRY: Dict[str, StepFunction] = {}
+
+
+def register_step(name: str) -> Callable[[StepFunction], StepFunction]:
+    """Decorator registering a transformation step under the name SourceConfig.transform_steps uses"""
+    def decorator(func: StepFunction) -> StepFunction:
+        if name in STEP_REGISTRY:
+            raise ValueError(f"Transform step already registered: {name}")
+        STEP_REGISTRY[name] = func
+        return func
+    return decorator
+
+
+def get_step(name: str) -> StepFunction:
+    """Look up a registered transformation step"""
+    if name not in STEP_REGISTRY:
+        raise ValueError(f"Unknown transform step: {name} (registered: {sorted(STEP_REGISTRY)})")
+    return STEP_REGISTRY[name]
+
+
+@dataclass
+class StepMetric:
+    """Timing and size of one step execution"""
+    step: str
+    source: str
+    seconds: float
+    rows_in: int
+    rows_out: int
+    memory_delta_mb: Optional[float] = None  # process RSS change; None without psutil
+
+
+class RunMetrics:
+    """Per-step metrics collected over one integration run"""
+
+    def __init__(self):
+        self.steps: List[StepMetric] = []
+        # Data-quality counters, e.g. (source, 'unparseable run_date') -> rows
+        self.counts: Dict[Tuple[str, str], int] = {}
+
+    def run(self, step: str, source: str, func: Callable[..., pd.DataFrame],
+            df: pd.DataFrame, *args) -> pd.DataFrame:
+        """Run func(df, *args) and record its wall time, rows in/out and memory delta"""
+        rows_in = len(df)
+        rss_before = _PROCESS.memory_info().rss if _PROCESS else None
+        start = time.perf_counter()
+
+        result = func(df, *args)
+
+        seconds = time.perf_counter() - start
+        memory_delta = (_PROCESS.memory_info().rss - rss_before) / 1024 ** 2 if _PROCESS else None
+        self.steps.append(StepMetric(step, source, seconds, rows_in, len(result), memory_delta))
+        return result
+
+    def add_count(self, source: str, counter: str, value: int):
+        """Add to a per-source counter"""
+        self.counts[(source, counter)] = self.counts.get((source, counter), 0) + value
+
+    def to_frame(self) -> pd.DataFrame:
+        """All recorded step executions, in run order"""
+        return pd.DataFrame([asdict(metric) for metric in self.steps],
+                            columns=list(StepMetric.__dataclass_fields__))
+
+    def summary(self) -> pd.DataFrame:
+        """Metrics summed per source and step (incremental runs execute steps once per file)"""
+        return self.to_frame().groupby(['source', 'step'], sort=False).agg(
+            runs=('step', 'size'),
+            seconds=('seconds', 'sum'),
+            rows_in=('rows_in', 'sum'),
+            rows_out=('rows_out', 'sum'),
+            memory_delta_mb=('memory_delta_mb', lambda deltas: deltas.sum(min_count=1)),
+        ).reset_index()
+
+    def report(self):
+        """Print the per-step profile"""
+        if not self.steps:
+            return
+        print(f"   ⏱️  Step profile:")
+        for row in self.summary().itertuples(index=False):
+            memory = f"{row.memory_delta_mb:+8.1f} MB" if pd.notna(row.memory_delta_mb) else ''
+            print(f"      {row.source:<10} {row.step:<30} {row.seconds:7.3f}s  "
+                  f"{row.rows_in:>9,} → {row.rows_out:>9,} rows  {memory}")
+        for (source, counter), value in self.counts.items():
+            if value:
+                print(f"   ⚠️  {source}: {value:,} {counter} values")
+
+
+@register_step('convert_units')
+def convert_source_units(df: pd.DataFrame, source_config: SourceConfig, config: DataMappingConfig) -> pd.DataFrame:
+    """Convert measurements the source delivers in non-standard units (field_units, unit_rules) to the config's units in place"""
+    standard_units = config.get_field_units()
+    converted = convert_units(df, standard_units, source_config.field_units, source_config.unit_rules)
+    for field, counts in converted.items():
+        if counts:
+            sources = ', '.join(f"{count} rows from {unit}" for unit, count in counts.items())
+            print(f"   📏 Converted {field} to {standard_units[field]}: {sources}")
+    return df
+
+
+@register_step('standardize_dull_grades')
+def standardize_dull_grades(df: pd.DataFrame, source_config: SourceConfig, config: DataMappingConfig) -> pd.DataFrame:
+    """Standardize dull grade values for consistency between Reed and Ulterra (in place)"""
+    # Standardize dull gauge values: Reed's 'I' should become 'IN' to match Ulterra
+    if 'dull_gauge' in df.columns:
+        # Count conversions for logging
+        i_count = (df['dull_gauge'] == 'I').sum()
+
+        if i_count > 0:
+            # Convert Reed's 'I' to 'IN' to match Ulterra's format
+            df['dull_gauge'] = df['dull_gauge'].replace('I', 'IN')
+            print(f"   🔧 Standardized dull_gauge: 'I' → 'IN' ({i_count} records)")
+
+            # Track total standardizations
+            total_standardizations = i_count
+            print(f"   ✅ Total dull grade standardizations: {total_standardizations}")
+
+    return df
+
+
+@register_step('standardize_bit_manufacturers')
+def standardize_bit_manufacturers(df: pd.DataFrame, source_config: SourceConfig, config: DataMappingConfig) -> pd.DataFrame:
+    """Standardize bit manufacturer names with the 'standard' rule set of manufacturer_rules.json (in place)"""
+    if 'bit_manufacturer' in df.columns:
+        normalizer = ManufacturerNormalizer('standard')
+        df['bit_manufacturer'], change_log = normalizer.normalize(df['bit_manufacturer'])
+
+        conversions = change_log['rows'].sum()
+        if conversions > 0:
+            print(f"   🔧 Standardized bit_manufacturer names ({conversions} records, "
+                  f"rules v{normalizer.rules.version})")
+
+            # Show the largest conversions
+            examples = [f"'{row.original}' → '{row.normalized}' ({row.rows})" for row in change_log.itertuples()]
+            print(f"   📝 Key conversions: {', '.join(examples[:5])}")
+            if len(examples) > 5:
+                print(f"   📝 ... and {len(examples) - 5} more")
+
+    return df
+
+
+@register_step('standardize_contractors')
+def standardize_contractors(df: pd.DataFrame, source_config: SourceConfig, config: DataMappingConfig) -> pd.DataFrame:
+    """Standardize contractor names and create combined rig names (in place)"""
+    # Define mapping for contractor name standardization
+    contractor_mapping = {
+        # Standardize common contractor variations
+        'ENSIGN DRILLING': 'Ensign Drilling',
+        'ENSIGN': 'Ensign Drilling',
+        'PRECISION DRILLING': 'Precision Drilling',
+        'PRECISION': 'Precision Drilling',
+        'FOX DRILLING INC.': 'Fox Drilling',
+        'FOX DRILLING': 'Fox Drilling',
+        'SAVANNA DRILLING': 'Savanna Drilling',
+        'SAVANNA': 'Savanna Drilling',
+        'AKITA DRILLING': 'Akita Drilling',
+        'AKITA': 'Akita Drilling',
+        'TRINIDAD DRILLING': 'Trinidad Drilling',
+        'TRINIDAD': 'Trinidad Drilling',
+        'NORTHERN BLIZZARD DRILLING': 'Northern Blizzard Drilling',
+        'NORTHERN BLIZZARD': 'Northern Blizzard Drilling',
+        'INDEPENDENCE DRILLING CORPORATION': 'Independence Drilling',
+        'INDEPENDENCE': 'Independence Drilling',
+        'TOTAL DRILLING SOLUTIONS': 'Total Drilling Solutions',
+        'TOTAL DRILLING': 'Total Drilling Solutions',
+    }
+
+    if 'contractor' in df.columns:
+        # Count conversions for logging
+        conversions = 0
+        original_values = df['contractor'].value_counts()
+
+        # Map specific variations, then title case all remaining names; each distinct
+        # name is normalized once and broadcast back (missing values stay 'nan')
+        def normalize_contractor(name):
+            name = str(contractor_mapping.get(name, name))
+            return name.title() if name != 'nan' else name
+
+        df['contractor'] = map_unique(df['contractor'], normalize_contractor)
+
+        # Count how many values were actually changed
+        for orig_name, mapped_name in contractor_mapping.items():
+            if orig_name in original_values and orig_name != mapped_name:
+                conversions += original_values[orig_name]
+
+        if conversions > 0:
+            print(f"   🔧 Standardized contractor names ({conversions} records)")
+
+    # Create combined rig name field (format: "Contractor Rig#")
+    if 'contractor' in df.columns and 'rig_name' in df.columns:
+        # Missing, 'nan' and other falsy parts are treated as empty
+        contractor = map_unique(df['contractor'], lambda value: '' if pd.isna(value) or value == 'nan' else value)
+        rig_name = map_unique(df['rig_name'], lambda value: '' if pd.isna(value) or value == 'nan' or not value else str(value))
+        has_contractor = contractor.astype(bool).to_numpy()
+        has_rig_name = rig_name.astype(bool).to_numpy()
+
+        # Combined name with single space, or whichever part is present
+        df['reporting_rig_name'] = np.select(
+            [has_contractor & has_rig_name, has_contractor],
+            [(contractor + ' ' + rig_name).to_numpy(dtype=object), contractor.to_numpy(dtype=object)],
+            default=rig_name.to_numpy(dtype=object),
+        )
+
+        # Log creation of combined field
+        combined_count = df['reporting_rig_name'].notna().sum()
+        print(f"   🏗️  Created reporting_rig_name field ({combined_count} records)")
+
+    return df
@@ -0,0 +1,118 @@
+"""
+Unit Conversion
+Converts source measurements into the standard units of the integrated schema.
+
+FieldMapping.unit is the unit the integrated frame stores a field in and
+SourceConfig.field_units the unit a source delivers it in. For mixed files,
+SourceConfig.unit_rules re-assign rows to another unit by value (e.g. bit sizes
+below 30 are inches, not millimetres). Conversion is column-vectorized: each
+field is multiplied once by a scalar factor, or by a per-row factor array when
+unit rules apply.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from data_mapping_config import UnitRule
+
+# unit -> (dimension, factor to the dimension's base unit)
+UNITS = {
+    # Length (base: m)
+    'm': ('length', 1.0),
+    'ft': ('length', 0.3048),
+    'mm': ('length', 0.001),
+    'in': ('length', 0.0254),
+    # Rate of penetration (base: m/hr)
+    'm/hr': ('rate', 1.0),
+    'ft/hr': ('rate', 0.3048),
+    # Force / weight on bit (base: daN)
+    'daN': ('force', 1.0),
+    'N': ('force', 0.1),
+    'kN': ('force', 100.0),
+    'lbf': ('force', 0.4448221615),
+    'klbf': ('force', 444.8221615),
+    # Flow rate (base: US gpm)
+    'gpm': ('flow', 1.0),
+    'lpm': ('flow', 1 / 3.785411784),
+    'm3/min': ('flow', 1000 / 3.785411784),
+    'bpm': ('flow', 42.0),
+    # Torque (base: ft-lb)
+    'ft-lb': ('torque', 1.0),
+    'N-m': ('torque', 1 / 1.3558179483),
+    'kN-m': ('torque', 1000 / 1.3558179483),
+    # Area / total flow area (base: mm²)
+    'mm2': ('area', 1.0),
+    'in2': ('area', 645.16),
+}
+
+
+def conversion_factor(from_unit: str, to_unit: str) -> float:
+    """Factor that converts values in from_unit to to_unit"""
+    for unit in (from_unit, to_unit):
+        if unit not in UNITS:
+            raise ValueError(f"Unknown unit: {unit} (expected one of {list(UNITS)})")
+
+    from_dimension, from_factor = UNITS[from_unit]
+    to_dimension, to_factor = UNITS[to_unit]
+    if from_dimension != to_dimension:
+        raise ValueError(f"Cannot convert {from_unit} ({from_dimension}) to {to_unit} ({to_dimension})")
+    return from_factor / to_factor
+
+
+def convert_units(df: pd.DataFrame, standard_units: Dict[str, str],
+                  field_units: Optional[Dict[str, str]] = None,
+                  unit_rules: Optional[List[UnitRule]] = None) -> Dict[str, Dict[str, int]]:
+    """
+    Convert measurement fields of df to their standard units in place.
+
+    Rows of a field are in the unit of the first of its unit_rules they match,
+    otherwise in its field_units unit (the standard unit when undeclared).
+    Missing values stay missing. Returns field -> {source unit: rows converted}.
+    """
+    field_units = field_units or {}
+    rules_by_field: Dict[str, List[UnitRule]] = {}
+    for rule in unit_rules or []:
+        rules_by_field.setdefault(rule.field, []).append(rule)
+
+    converted = {}
+    for field in list(field_units) + [field for field in rules_by_field if field not in field_units]:
+        if field not in df.columns:
+            continue
+        if field not in standard_units:
+            raise ValueError(f"Field {field} has no standard unit to convert to")
+
+        standard_unit = standard_units[field]
+        declared_unit = field_units.get(field, standard_unit)
+        factor = conversion_factor(declared_unit, standard_unit)
+        rules = rules_by_field.get(field, [])
+        if factor == 1.0 and not rules:
+            continue
+
+        values = pd.to_numeric(df[field], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+        present = ~np.isnan(values)
+        counts = {}
+
+        if rules:
+            # Per-row factors: the declared unit's factor unless an earlier-listed rule claims the row
+            factors = np.full(len(values), factor)
+            unclaimed = present.copy()
+            for rule in rules:
+                matches = unclaimed.copy()
+                if rule.below is not None:
+                    matches &= values < rule.below
+                if rule.above is not None:
+                    matches &= values > rule.above
+                factors[matches] = conversion_factor(rule.unit, standard_unit)
+                counts[rule.unit] = counts.get(rule.unit, 0) + int(matches.sum())
+                unclaimed &= ~matches
+            counts[declared_unit] = counts.get(declared_unit, 0) + int(unclaimed.sum())
+            if (factors[present] != 1.0).any():
+                df[field] = values * factors
+        else:
+            counts[declared_unit] = int(present.sum())
+            df[field] = values * factor
+
+        converted[field] = {unit: count for unit, count in counts.items() if count and unit != standard_unit}
+    return converted
@@ -8,30 +8,240 @@ transform, and integrate data from various sources into a unified format.
 
 import pandas as pd
 import numpy as np
+import os
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 import warnings
-from data_mapping_config import DataMappingConfig, SourceConfig
+from data_mapping_config import BitSizeBand, DataMappingConfig, SourceConfig
+from parse_cache import ParseCache, file_fingerprint
+from run_manifest import RunManifest, source_config_signature
+from excel_readers import read_excel_sheet, resolve_reader_engine
+from date_parsing import parse_dates
+from standardization_steps import RunMetrics, get_step
+from vector_ops import apply_precision_policies, apply_storage_types, normalize_identifiers
+
+
+def _read_source_file(file_path: Path, sheet_name: Optional[str], skip_rows: int,
+                      columns: Optional[List[str]] = None,
+                      reader_engine: Optional[str] = None) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+    """
+    Parse a single source workbook, optionally keeping only the given columns.
+    
+    A file lacking some of the columns still loads with the rest;
+    load_source_data reports what is missing from the returned columns.
+
+    Runs in worker processes during parallel ingestion, so it lives at module
+    level and returns the error message instead of raising - one bad file must
+    not take down the rest of the batch.
+    """
+    try:
+        # Project at the reader: the header row is matched against the wanted
+        # columns and everything else is never materialized
+        usecols = None
+        if columns is not None:
+            wanted = set(columns)
+            usecols = lambda col: col in wanted
+        
+        # sheet_name None reads the first sheet
+        df = read_excel_sheet(
+            file_path,
+            sheet_name=sheet_name,
+            engine=reader_engine,
+            skiprows=skip_rows,
+            usecols=usecols
+        )
+        return df, None
+    except Exception as e:
+        return None, str(e)
+
+
+@dataclass
+class SourceFile:
+    """A discovered input file with the metadata caching and incremental runs key on"""
+    path: Path
+    size: int
+    modified: datetime
+    fingerprint: str
+    
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+
+@dataclass
+class ColumnPlan:
+    """A source's column mapping compiled once: what to select, what to call it, how to type it"""
+    field_columns: Dict[str, str]  # standard field -> source column, in mapping order
+    output_columns: List[str]  # mapped fields followed by the metadata fields
+    date_fields: List[str]
+    numeric_fields: List[str]
+    identifier_fields: List[str]
+
+
+# Source metadata columns added at load time -> standardized metadata fields.
+# Per-file provenance (source_file, file_modified_date, ...) lives in the engine's
+# file metadata table and is joined back on export via with_file_metadata().
+METADATA_COLUMNS = {
+    '_data_source': 'data_source',
+    '_record_id': 'record_id',
+}
+
+# record_id packs the file id into the high bits and the row ordinal into the low bits
+RECORD_ROW_BITS = 32
+
+
+def pack_record_ids(file_id: int, n_rows: int) -> np.ndarray:
+    """Record ids for the rows of one file: file_id << RECORD_ROW_BITS | row ordinal"""
+    return (np.int64(file_id) << RECORD_ROW_BITS) | np.arange(n_rows, dtype=np.int64)
+
+
+def record_file_ids(record_ids) -> np.ndarray:
+    """File id of each packed record id"""
+    return np.asarray(record_ids, dtype=np.int64) >> RECORD_ROW_BITS
+
+# Identifier fields normalized to nullable strings (see vector_ops.normalize_identifiers)
+IDENTIFIER_FIELDS = ['license_number', 'bit_serial_number', 'uwi_number', 'uwi_formatted', 'well_name']
+
+# composite_well_id sources in priority order: the first usable identifier wins
+WELL_ID_PRIORITY = [
+    ('api_number', 'API_'),  # most standardized
+    ('license_number', 'LIC_'),  # Canadian wells
+    ('well_name', 'NAME_'),
+]
+
+
+def build_composite_well_ids(df: pd.DataFrame) -> pd.Series:
+    """
+    Composite well identifier for accurate well counting.
+    
+    Uses the first identifier in WELL_ID_PRIORITY that is present and not blank,
+    falling back to UNK_{row label} so unidentified runs stay distinct.
+    """
+    conditions, choices = [], []
+    for field, prefix in WELL_ID_PRIORITY:
+        if field not in df.columns:
+            continue
+        text = df[field].astype(str)
+        conditions.append((df[field].notna() & text.str.strip().ne('')).to_numpy())
+        choices.append((prefix + text).to_numpy(dtype=object))
+    
+    fallback = ('UNK_' + df.index.astype(str)).to_numpy(dtype=object)
+    if not conditions:
+        return pd.Series(fallback, index=df.index, dtype=object)
+    return pd.Series(np.select(conditions, choices, default=fallback), index=df.index, dtype=object)
+
+
+
+def categorize_bit_sizes(sizes: pd.Series, bands: List[BitSizeBand]) -> Tuple[pd.Series, pd.Series]:
+    """
+    Categorize bit sizes (mm) against an ordered band table in one vectorized pass.
+    
+    Returns categorical (bit_size_category, bit_class) series. The first matching
+    band wins; unmatched sizes are 'Other'/'Other' and missing sizes 'Unknown'/'Other'.
+    """
+    values = sizes.to_numpy(dtype=float, na_value=np.nan)
+    
+    category_labels = list(dict.fromkeys([band.label for band in bands] + ['Other', 'Unknown']))
+    class_labels = list(dict.fromkeys([band.bit_class for band in bands] + ['Other']))
+    category_code = {label: code for code, label in enumerate(category_labels)}
+    class_code = {label: code for code, label in enumerate(class_labels)}
+    
+    conditions = [np.isnan(values)]
+    category_choices = [category_code['Unknown']]
+    class_choices = [class_code['Other']]
+    for band in bands:
+        matches = np.ones(len(values), dtype=bool)
+        if band.lower is not None:
+            matches &= values >= band.lower if band.closed in ('both', 'left') else values > band.lower
+        if band.upper is not None:
+            matches &= values <= band.upper if band.closed in ('both', 'right') else values < band.upper
+        conditions.append(matches)
+        category_choices.append(category_code[band.label])
+        class_choices.append(class_code[band.bit_class])
+    
+    category_codes = np.select(conditions, category_choices, default=category_code['Other'])
+    class_codes = np.select(conditions, class_choices, default=class_code['Other'])
+    return (
+        pd.Series(pd.Categorical.from_codes(category_codes, category_labels), index=sizes.index),
+        pd.Series(pd.Categorical.from_codes(class_codes, class_labels), index=sizes.index),
+    )
 
 class DataIntegrationEngine:
-    """Main engine for loading and integrating multi-source drilling data"""
+    """
+    Main engine for loading and integrating multi-source drilling data.
     
-    def __init__(self, base_path: Optional[Path] = None):
+    Transform stages mutate frames the engine owns in place instead of copying
+    per stage. Frames passed in by callers are never modified: standardization
+    starts from the column plan's selection (a new frame) and derived fields are
+    added to the combined frame built by concat. Vendor-specific steps come from
+    each SourceConfig's transform_steps (see standardization_steps), and every
+    stage's timing is recorded in run_metrics.
+    """
+    
+    def __init__(self, base_path: Optional[Path] = None, parallel_load: bool = True,
+                 max_workers: Optional[int] = None, use_cache: bool = True,
+                 cache_dir: Optional[Path] = None, cache_max_size_mb: float = 2048,
+                 cache_content_hash: bool = False, project_columns: bool = True,
+                 manifest_dir: Optional[Path] = None, compact: bool = False):
         self.base_path = base_path or Path(__file__).parent
         self.config = DataMappingConfig()
         self.loaded_data = {}
         self.integrated_data = None
+        # Process-pool ingestion: workbooks are parsed concurrently (XML parsing is CPU-bound)
+        self.parallel_load = parallel_load
+        self.max_workers = max_workers or os.cpu_count() or 1
+        # Read only the source columns the mappings use
+        self.project_columns = project_columns
+        # Columnar cache of parsed sheets, keyed by file fingerprint + read options
+        self.parse_cache = None
+        self.cache_content_hash = cache_content_hash
+        if use_cache:
+            self.parse_cache = ParseCache(
+                cache_dir or self.base_path / '.parse_cache',
+                max_size_mb=cache_max_size_mb,
+                content_hash=cache_content_hash
+            )
         
-    def discover_sources(self) -> Dict[str, List[Path]]:
+        # Compact mode: downcast numeric fields per the config's precision policies
+        self.compact = compact
+        # Per-step timing, rows and memory of the latest integration run
+        self.run_metrics = RunMetrics()
+        
+        # Incremental integration state (per-file partitions + manifest)
+        self.manifest_dir = manifest_dir or self.base_path / '.integration_manifest'
+        # Discovery runs once per engine; invalidate_discovery() forces a re-scan
+        self._discovered: Optional[Dict[str, List[SourceFile]]] = None
+        self._column_plans: Dict[str, ColumnPlan] = {}
+        # Date format inferred per (source, field), reused for every later file of the source
+        self._inferred_date_formats: Dict[Tuple[str, str], Optional[str]] = {}
+        
+        # Provenance of every loaded file, keyed by the file id packed into record_id
+        self._file_records: Dict[int, Dict[str, Any]] = {}
+        self._file_ids: Dict[str, int] = {}  # resolved path -> file id
+        self._next_file_id = 0
+        
+    def discover_sources(self, refresh: bool = False) -> Dict[str, List[Path]]:
         """Discover available data files for each configured source"""
+        return {
+            source_name: [source_file.path for source_file in files]
+            for source_name, files in self.discover_source_files(refresh).items()
+        }
+    
+    def discover_source_files(self, refresh: bool = False) -> Dict[str, List[SourceFile]]:
+        """Discover data files with size/mtime/fingerprint metadata, cached on the engine"""
+        if self._discovered is not None and not refresh:
+            return self._discovered
+        
         discovered = {}
         
         for source_name, source_config in self.config.data_sources.items():
             source_path = self.base_path / source_config.folder_path
             if source_path.exists():
                 files = list(source_path.glob(source_config.file_pattern))
-                discovered[source_name] = files
+                discovered[source_name] = [self._describe_file(file) for file in files]
                 print(f"🔍 {source_name}: Found {len(files)} files")
                 for file in files:
                     print(f"   - {file.name}")
@@ -39,54 +249,137 @@ class DataIntegrationEngine:
                 discovered[source_name] = []
                 print(f"⚠️  {source_name}: Folder not found - {source_path}")
         
+        self._discovered = discovered
         return discovered
     
+    def invalidate_discovery(self):
+        """Forget the cached directory listing so the next discovery re-scans source folders"""
+        self._discovered = None
+    
+    def _describe_file(self, file_path: Path) -> SourceFile:
+        """Stat a file once and derive the metadata downstream stages reuse"""
+        stat = file_path.stat()
+        return SourceFile(
+            path=file_path,
+            size=stat.st_size,
+            modified=datetime.fromtimestamp(stat.st_mtime),
+            fingerprint=file_fingerprint(file_path, self.cache_content_hash, stat=stat)
+        )
+    
+    def _resolve_source_files(self, source_name: str, file_paths: Optional[List[Path]]) -> List[SourceFile]:
+        """Map file paths to discovered SourceFile records, describing unknown paths on the fly"""
+        discovered = self.discover_source_files().get(source_name, [])
+        if file_paths is None:
+            return discovered
+        
+        known = {source_file.path: source_file for source_file in discovered}
+        return [known.get(Path(file_path)) or self._describe_file(Path(file_path)) for file_path in file_paths]
+    
+    def register_file(self, source_name: str, source_file: SourceFile, file_id: Optional[int] = None) -> int:
+        """Record a file in the metadata table, keeping its id stable for the life of the engine"""
+        key = str(source_file.path.resolve())
+        if file_id is None:
+            file_id = self._file_ids.get(key)
+        if file_id is None:
+            file_id = self._next_file_id
+        self._next_file_id = max(self._next_file_id, file_id + 1)
+        
+        self._file_ids[key] = file_id
+        self._file_records[file_id] = {
+            'data_source': source_name,
+            'source_file': source_file.name,
+            'file_path': key,
+            'file_modified_date': source_file.modified,
+            'file_size': source_file.size,
+            'fingerprint': source_file.fingerprint,
+        }
+        return file_id
+    
+    @property
+    def file_metadata(self) -> pd.DataFrame:
+        """One row per loaded file, indexed by file id"""
+        columns = ['data_source', 'source_file', 'file_path', 'file_modified_date', 'file_size', 'fingerprint']
+        metadata = pd.DataFrame.from_dict(self._file_records, orient='index', columns=columns)
+        metadata.index.name = 'file_id'
+        return metadata.sort_index()
+    
+    def with_file_metadata(self, df: pd.DataFrame, fields: Optional[List[str]] = None) -> pd.DataFrame:
+        """Return a copy of df with per-file provenance joined on by record_id (for exports)"""
+        fields = fields or ['source_file', 'file_modified_date']
+        result = df.copy()
+        if 'record_id' not in result.columns or result.empty:
+            return result
+        
+        metadata = self.file_metadata
+        positions = metadata.index.get_indexer(record_file_ids(result['record_id']))
+        insert_at = result.columns.get_loc('record_id')
+        for offset, field in enumerate(fields):
+            values = metadata[field].to_numpy().take(positions, mode='clip')
+            result.insert(insert_at + offset, field, pd.Series(values, index=result.index).where(positions >= 0))
+        return result
+    
+    def record_provenance(self, record_id: int) -> Dict[str, Any]:
+        """Look up the file and row a record came from"""
+        file_id = int(record_id) >> RECORD_ROW_BITS
+        return {
+            'file_id': file_id,
+            'row': int(record_id) & ((1 << RECORD_ROW_BITS) - 1),
+            **self._file_records[file_id],
+        }
+    
     def load_source_data(self, source_name: str, file_paths: Optional[List[Path]] = None) -> pd.DataFrame:
         """Load and combine data from a specific source"""
         source_config = self.config.get_source_config(source_name)
         if not source_config:
             raise ValueError(f"Unknown source: {source_name}")
         
-        if file_paths is None:
-            # Auto-discover files
-            discovered = self.discover_sources()
-            file_paths = discovered.get(source_name, [])
+        # Auto-discover files (cached) when none are given
+        source_files = self._resolve_source_files(source_name, file_paths)
         
-        if not file_paths:
+        if not source_files:
             print(f"❌ No files found for source: {source_name}")
             return pd.DataFrame()
         
-        print(f"📊 Loading {source_name} data from {len(file_paths)} files...")
+        print(f"📊 Loading {source_name} data from {len(source_files)} files...")
         
         dataframes = []
-        for file_path in file_paths:
-            try:
-                # Determine sheet name
-                sheet_name = source_config.sheet_name
-                if sheet_name is None:
-                    # Use first sheet
-                    excel_file = pd.ExcelFile(file_path)
-                    sheet_name = excel_file.sheet_names[0]
-                
-                # Load data
-                df = pd.read_excel(
-                    file_path, 
-                    sheet_name=sheet_name,
-                    skiprows=source_config.skip_rows
-                )
-                
-                # Add metadata
-                df['_source_file'] = file_path.name
-                df['_file_modified'] = datetime.fromtimestamp(file_path.stat().st_mtime)
-                df['_data_source'] = source_name
-                df['_record_id'] = f"{source_name}_{file_path.stem}_{df.index}"
-                
-                dataframes.append(df)
-                print(f"   ✅ {file_path.name}: {len(df)} rows")
-                
-            except Exception as e:
-                print(f"   ❌ {file_path.name}: Error - {str(e)}")
+        missing_columns = {}
+        missing_required = set()
+        for source_file, (df, error) in zip(source_files, self._read_files(source_files, source_config)):
+            file_path = source_file.path
+            if error is not None:
+                print(f"   ❌ {file_path.name}: Error - {error}")
                 continue
+            
+            # Validate column mapping against this file's header row. With projection
+            # the frame holds exactly the mapped columns the header provides, so this
+            # matches validating the full header. Missing columns are warnings only.
+            validation = self.config.validate_mapping(source_name, df.columns.tolist())
+            missing_mapped = [field for field in validation.get('missing_required_fields', [])
+                              if field in source_config.column_mappings]
+            if missing_mapped:
+                print(f"   ⚠️  {file_path.name}: header lacks the columns of required fields {missing_mapped}"
+                      f" - loaded the mapped columns it has")
+            if not validation['valid']:
+                for column in validation.get('missing_source_columns', []):
+                    missing_columns[column] = missing_columns.get(column, 0) + 1
+                missing_required.update(validation.get('missing_required_fields', []))
+            
+            # Add metadata; file provenance goes to the file metadata table
+            file_id = self.register_file(source_name, source_file)
+            df['_data_source'] = source_name
+            df['_record_id'] = pack_record_ids(file_id, len(df))
+            
+            dataframes.append(df)
+            print(f"   ✅ {file_path.name}: {len(df)} rows")
+        
+        if missing_columns or missing_required:
+            print(f"   ⚠️  Mapping validation warnings for {source_name}:")
+            if missing_columns:
+                details = [f"{column} ({count}/{len(dataframes)} files)" for column, count in missing_columns.items()]
+                print(f"      Missing columns: {details}")
+            if missing_required:
+                print(f"      Missing required fields: {sorted(missing_required)}")
         
         if not dataframes:
             return pd.DataFrame()
@@ -95,18 +388,67 @@ class DataIntegrationEngine:
         combined_df = pd.concat(dataframes, ignore_index=True, sort=False)
         print(f"   📈 Combined: {len(combined_df)} total rows")
         
-        # Validate column mapping
-        validation = self.config.validate_mapping(source_name, combined_df.columns.tolist())
-        if not validation['valid']:
-            print(f"   ⚠️  Mapping validation warnings for {source_name}:")
-            if validation.get('missing_source_columns'):
-                print(f"      Missing columns: {validation['missing_source_columns']}")
-            if validation.get('missing_required_fields'):
-                print(f"      Missing required fields: {validation['missing_required_fields']}")
-        
         self.loaded_data[source_name] = combined_df
         return combined_df
     
+    def _read_files(self, source_files: List[SourceFile], source_config: SourceConfig) -> List[Tuple[Optional[pd.DataFrame], Optional[str]]]:
+        """Parse source files, in a process pool when enabled. Results follow source_files order."""
+        columns = self._projected_columns(source_config)
+        reader_engine = resolve_reader_engine(source_config.reader_engine or self.config.default_reader_engine)
+        read_options = {
+            'sheet_name': source_config.sheet_name,
+            'skip_rows': source_config.skip_rows,
+            'columns': columns,
+            'reader_engine': reader_engine,
+        }
+        results: List[Optional[Tuple[Optional[pd.DataFrame], Optional[str]]]] = [None] * len(source_files)
+        cache_keys = {}
+        
+        # Serve unchanged files from the parse cache
+        cache = self.parse_cache if self.parse_cache and self.parse_cache.enabled else None
+        if cache:
+            for i, source_file in enumerate(source_files):
+                cache_keys[i] = cache.cache_key(source_file.path, read_options, fingerprint=source_file.fingerprint)
+                cached_df = cache.load(cache_keys[i])
+                if cached_df is not None:
+                    results[i] = (cached_df, None)
+            
+            hits = sum(result is not None for result in results)
+            if hits:
+                print(f"   ⚡ Parse cache: {hits}/{len(source_files)} files loaded from cache")
+        
+        pending = [i for i, result in enumerate(results) if result is None]
+        args = [(source_files[i].path, source_config.sheet_name, source_config.skip_rows, columns, reader_engine)
+                for i in pending]
+        workers = min(self.max_workers, len(args))
+        
+        parsed = None
+        if self.parallel_load and workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    # map() yields in submission order, so output stays deterministic
+                    parsed = list(executor.map(_read_source_file, *zip(*args)))
+            except Exception as e:
+                print(f"   ⚠️  Parallel ingestion unavailable ({e}) - falling back to serial load")
+        
+        if parsed is None:
+            parsed = [_read_source_file(*arg) for arg in args]
+        
+        for i, (df, error) in zip(pending, parsed):
+            results[i] = (df, error)
+            if cache and error is None:
+                cache.store(cache_keys[i], df)
+        
+        return results
+    
+    def _projected_columns(self, source_config: SourceConfig) -> Optional[List[str]]:
+        """Source columns to read for a source, or None to read the whole sheet"""
+        if not self.project_columns or not source_config.column_mappings:
+            return None
+        
+        columns = list(source_config.column_mappings.values()) + list(source_config.extra_columns or [])
+        return sorted(set(columns))
+    
     def standardize_data(self, source_name: str, df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         """Transform source data to standardized format"""
         if df is None:
@@ -120,23 +462,7 @@ class DataIntegrationEngine:
         
         print(f"🔄 Standardizing {source_name} data...")
         
-        # Create standardized dataframe
-        standardized_df = pd.DataFrame()
-        
-        # Map columns according to configuration
-        for standard_field, source_column in source_config.column_mappings.items():
-            if source_column in df.columns:
-                standardized_df[standard_field] = df[source_column].copy()
-            else:
-                # Create empty column for missing fields
-                standardized_df[standard_field] = np.nan
-                print(f"   ⚠️  Missing column '{source_column}' for field '{standard_field}'")
-        
-        # Add metadata fields
-        standardized_df['data_source'] = df['_data_source']
-        standardized_df['source_file'] = df['_source_file']
-        standardized_df['file_modified_date'] = df['_file_modified']
-        standardized_df['record_id'] = df['_record_id']
+        standardized_df = self._run_step('column_plan', source_name, self._apply_column_plan, df, source_name)
         
         # Apply data type conversions and cleaning
         standardized_df = self._apply_data_conversions(standardized_df, source_name)
@@ -144,63 +470,106 @@ class DataIntegrationEngine:
         print(f"   ✅ Standardized: {len(standardized_df)} rows, {len(standardized_df.columns)} columns")
         return standardized_df
     
-    def _apply_data_conversions(self, df: pd.DataFrame, source_name: str) -> pd.DataFrame:
-        """Apply data type conversions and unit standardizations"""
-        df = df.copy()
+    def compile_column_plan(self, source_name: str) -> ColumnPlan:
+        """Compile (once per source) the column selection and dtype targets for standardization"""
+        if source_name not in self._column_plans:
+            source_config = self.config.get_source_config(source_name)
+            field_columns = dict(source_config.column_mappings)
+            output_columns = list(field_columns) + [
+                field for field in METADATA_COLUMNS.values() if field not in field_columns
+            ]
+            
+            def fields_of_type(data_type: str) -> List[str]:
+                return [
+                    field for field in output_columns
+                    if field in self.config.standard_fields
+                    and self.config.standard_fields[field].data_type == data_type
+                ]
+            
+            self._column_plans[source_name] = ColumnPlan(
+                field_columns=field_columns,
+                output_columns=output_columns,
+                date_fields=fields_of_type('date'),
+                numeric_fields=fields_of_type('numeric'),
+                identifier_fields=[field for field in IDENTIFIER_FIELDS if field in output_columns],
+            )
+        return self._column_plans[source_name]
+    
+    def _apply_column_plan(self, df: pd.DataFrame, source_name: str) -> pd.DataFrame:
+        """
+        Select and rename every present column in one step; missing fields come back as NaN.
+        The result is a new frame (never a view of df), so later stages may mutate it in place.
+        """
+        plan = self.compile_column_plan(source_name)
+        
+        present = {field: column for field, column in plan.field_columns.items() if column in df.columns}
+        for field, column in plan.field_columns.items():
+            if field not in present:
+                print(f"   ⚠️  Missing column '{column}' for field '{field}'")
+        
+        # One take for the selection; renaming the new frame's axis does not copy again
+        standardized_df = df.loc[:, list(present.values()) + list(METADATA_COLUMNS.keys())]
+        standardized_df.columns = list(present.keys()) + list(METADATA_COLUMNS.values())
+        
+        if len(present) < len(plan.field_columns):
+            standardized_df = standardized_df.reindex(columns=plan.output_columns)
+        return standardized_df
+    
+    def _apply_dtype_targets(self, df: pd.DataFrame, source_name: str) -> pd.DataFrame:
+        """Convert date, numeric and identifier fields in place on a frame the engine owns"""
+        plan = self.compile_column_plan(source_name)
+        date_formats = self.config.get_source_config(source_name).date_formats or {}
+        
+        # Declared formats (or Excel serials) where given, else a cached inferred format;
+        # already-datetime columns pass through and text is parsed once per distinct value
+        for field in plan.date_fields:
+            key = (source_name, field)
+            df[field], unparseable, self._inferred_date_formats[key] = parse_dates(
+                df[field], date_formats.get(field), self._inferred_date_formats.get(key)
+            )
+            if unparseable:
+                print(f"   ⚠️  {unparseable} unparseable {field} values set to NaT")
+                self.run_metrics.add_count(source_name, f"unparseable {field}", unparseable)
         
-        # Date conversions
-        date_fields = ['run_date', 'spud_date', 'td_date', 'file_modified_date']
-        for field in date_fields:
-            if field in df.columns:
-                df[field] = pd.to_datetime(df[field], errors='coerce')
+        for field in plan.numeric_fields:
+            df[field] = pd.to_numeric(df[field], errors='coerce')
         
-        # Numeric conversions
-        numeric_fields = [
-            'bit_size_mm', 'run_number', 'depth_in_m', 'depth_out_m', 
-            'distance_drilled_m', 'total_depth_m', 'drilling_hours', 
-            'on_bottom_hours', 'rop_mhr', 'latitude', 'longitude'
-        ]
-        for field in numeric_fields:
-            if field in df.columns:
-                df[field] = pd.to_numeric(df[field], errors='coerce')
+        # Key identifier fields become clean nullable strings (consistent for matching)
+        for field in plan.identifier_fields:
+            df[field] = normalize_identifiers(df[field])
         
-        # String conversions for key identifier fields (ensure consistent string format)
-        string_fields = ['license_number', 'bit_serial_number', 'uwi_number', 'uwi_formatted', 'well_name']
-        for field in string_fields:
-            if field in df.columns:
-                # Convert to string, handling NaN values appropriately
-                df[field] = df[field].astype('object').fillna('').astype(str)
-                # Replace 'nan' strings with actual NaN for pandas operations
-                df[field] = df[field].replace('nan', pd.NA)
-        
-        # Source-specific processing
-        if source_name == 'reed':
-            # Reed data is assumed to be in correct metric units
-            print("   ✅ Reed data processing - no unit conversion")
-            # Standardize dull grade values for consistency with Ulterra
-            df = self._standardize_dull_grades(df)
-            # Standardize bit manufacturer names
-            df = self._standardize_bit_manufacturers(df)
-            # Standardize contractor names and create combined rig names
-            df = self._standardize_contractors(df)
-        elif source_name == 'ulterra':
-            # Ulterra data is in metric units
-            print("   ✅ Ulterra data processing - no unit conversion")
-            # Ulterra dull grades are already in standard format
-            print("   ✅ Ulterra dull grades already in standard format")
-            # Standardize bit manufacturer abbreviations to full names
-            df = self._standardize_bit_manufacturers(df)
-            # Standardize contractor names and create combined rig names
-            df = self._standardize_contractors(df)
+        return df
+    
+    def _apply_data_conversions(self, df: pd.DataFrame, source_name: str) -> pd.DataFrame:
+        """Apply data type conversions, then the source's transform steps, in place on the owned frame"""
+        df = self._run_step('dtype_targets', source_name, self._apply_dtype_targets, df, source_name)
+        
+        source_config = self.config.get_source_config(source_name)
+        for step_name in source_config.transform_steps or []:
+            df = self._run_step(step_name, source_name, get_step(step_name), df, source_config, self.config)
         
         return df
     
-    def integrate_all_sources(self, sources: Optional[List[str]] = None) -> pd.DataFrame:
-        """Load and integrate data from all or specified sources"""
+    def _run_step(self, step_name: str, source_name: str, func, df: pd.DataFrame, *args) -> pd.DataFrame:
+        """Run one pipeline step, func(df, *args), on an engine-owned frame and record its metrics"""
+        return self.run_metrics.run(step_name, source_name, func, df, *args)
+    
+    def integrate_all_sources(self, sources: Optional[List[str]] = None, incremental: bool = False) -> pd.DataFrame:
+        """
+        Load and integrate data from all or specified sources.
+        
+        With incremental=True only new or changed input files are loaded and
+        standardized; rows of unchanged files come from the partitions stored by
+        earlier incremental runs and rows of removed files are dropped.
+        """
         if sources is None:
             sources = list(self.config.data_sources.keys())
         
         print(f"🚀 Starting integration of sources: {sources}")
+        self.run_metrics = RunMetrics()
+        
+        if incremental:
+            return self._integrate_incremental(sources)
         
         standardized_dataframes = []
         
@@ -229,7 +598,93 @@ class DataIntegrationEngine:
         integrated_df = pd.concat(standardized_dataframes, ignore_index=True, sort=False)
         
         # Add derived fields
-        integrated_df = self._add_derived_fields(integrated_df)
+        integrated_df = self._run_step('derived_fields', 'all', self._add_derived_fields, integrated_df)
+        
+        return self._finalize_integration(integrated_df)
+    
+    def _integrate_incremental(self, sources: List[str]) -> pd.DataFrame:
+        """Integrate only new/changed files, reusing stored partitions for the rest"""
+        manifest = RunManifest(self.manifest_dir)
+        if not manifest.enabled:
+            print("⚠️  pyarrow not installed - incremental mode unavailable, running full integration")
+            return self.integrate_all_sources(sources)
+        
+        discovered = self.discover_source_files()
+        partitions = []
+        
+        for source_name in sources:
+            try:
+                source_config = self.config.get_source_config(source_name)
+                if not source_config:
+                    raise ValueError(f"Unknown source: {source_name}")
+                
+                source_files = {source_file.path: source_file for source_file in discovered.get(source_name, [])}
+                fingerprints = {path: source_file.fingerprint for path, source_file in source_files.items()}
+                signature = source_config_signature(source_config, self.config)
+                unchanged, to_process, removed = manifest.plan(source_name, fingerprints, signature)
+                
+                for key in removed:
+                    manifest.remove(key)
+                
+                # Keep the file ids stored partitions' record ids were packed with
+                self._next_file_id = max(self._next_file_id, manifest.next_file_id())
+                for file_path in unchanged + to_process:
+                    file_id = manifest.file_id(file_path)
+                    if file_id is not None:
+                        self.register_file(source_name, source_files[file_path], file_id)
+                print(f"📋 {source_name}: {len(unchanged)} unchanged, {len(to_process)} new/changed, "
+                      f"{len(removed)} removed")
+                
+                source_partitions = {file_path: manifest.read_partition(file_path) for file_path in unchanged}
+                
+                raw_df = self.load_source_data(source_name, to_process) if to_process else pd.DataFrame()
+                if to_process and raw_df.empty:
+                    print(f"   ⚠️  No new {source_name} data loaded")
+                if not raw_df.empty:
+                    standardized_df = self.standardize_data(source_name, raw_df)
+                    
+                    # Row-level derived fields (bit size bands, years, composite ids) are
+                    # computed per affected file; distance drilled is decided after combining
+                    file_groups = dict(tuple(standardized_df.groupby(record_file_ids(standardized_df['record_id']), sort=False)))
+                    for file_path in to_process:
+                        file_id = self._file_ids.get(str(file_path.resolve()))
+                        file_df = file_groups.get(file_id)
+                        if file_df is None:
+                            continue
+                        file_df = self._run_step('derived_fields', source_name, self._add_derived_fields,
+                                                 file_df.reset_index(drop=True), False)
+                        manifest.write_partition(source_name, file_path, fingerprints[file_path], signature, file_df, file_id)
+                        source_partitions[file_path] = file_df
+                
+                # Combine in source file order, as a full run reads them
+                partitions.extend(source_partitions[file_path] for file_path in source_files
+                                  if file_path in source_partitions)
+                
+            except Exception as e:
+                print(f"   ❌ Error processing {source_name}: {str(e)}")
+                continue
+        
+        manifest.save()
+        
+        if not partitions:
+            print("❌ No data successfully integrated")
+            return pd.DataFrame()
+        
+        print(f"🔗 Combining {len(partitions)} file partitions...")
+        integrated_df = pd.concat(partitions, ignore_index=True, sort=False)
+        
+        integrated_df = self._run_step('dataset_fields', 'all', self._fill_distance_drilled, integrated_df)
+        
+        # Fallback well ids embed the row label, which is only known after combining
+        if 'composite_well_id' in integrated_df.columns:
+            unknown = integrated_df['composite_well_id'].str.startswith('UNK_', na=False)
+            integrated_df.loc[unknown, 'composite_well_id'] = 'UNK_' + integrated_df.index[unknown].astype(str)
+        
+        return self._finalize_integration(integrated_df)
+    
+    def _finalize_integration(self, integrated_df: pd.DataFrame) -> pd.DataFrame:
+        """Apply storage types, sort the combined dataset, store it on the engine and report totals"""
+        integrated_df = self._run_step('storage_types', 'all', self.apply_storage_types, integrated_df)
         
         # Sort by source and date
         sort_columns = ['data_source', 'spud_date', 'run_date']
@@ -243,17 +698,37 @@ class DataIntegrationEngine:
         print(f"   📊 Total records: {len(integrated_df)}")
         print(f"   📈 Total columns: {len(integrated_df.columns)}")
         print(f"   🏭 Data sources: {integrated_df['data_source'].value_counts().to_dict()}")
+        self.run_metrics.report()
         
         return integrated_df
     
-    def _add_derived_fields(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Add calculated and derived fields"""
-        df = df.copy()
-        
-        # Calculate distance drilled if missing
-        if 'distance_drilled_m' not in df.columns or df['distance_drilled_m'].isna().all():
-            if 'depth_in_m' in df.columns and 'depth_out_m' in df.columns:
-                df['distance_drilled_m'] = df['depth_out_m'] - df['depth_in_m']
+    def apply_storage_types(self, df: pd.DataFrame, report: bool = True) -> pd.DataFrame:
+        """
+        Cast fields to the storage dtypes declared in the configuration (categorical etc.),
+        and in compact mode downcast numeric fields per the precision policies
+        """
+        memory_before = df.memory_usage(deep=True).sum() if report else 0
+        df = apply_storage_types(df, self.config.get_storage_types())
+        
+        if self.compact:
+            kept = apply_precision_policies(df, self.config.precision_policies)
+            if report:
+                for field, reason in kept.items():
+                    print(f"   ⚠️  {field} kept at full precision: {reason}")
+        
+        if report:
+            memory_after = df.memory_usage(deep=True).sum()
+            print(f"   🗜️  Storage types applied: {memory_before / 1024 ** 2:.1f} MB → {memory_after / 1024 ** 2:.1f} MB")
+        return df
+    
+    def _add_derived_fields(self, df: pd.DataFrame, whole_dataset: bool = True) -> pd.DataFrame:
+        """
+        Add calculated and derived fields in place on an engine-owned frame
+        Per-file frames (whole_dataset=False) skip the fields decided over the whole
+        dataset; _fill_distance_drilled runs on the combined partitions instead
+        """
+        if whole_dataset:
+            df = self._fill_distance_drilled(df)
         
         # Extract year from dates
         for date_field in ['spud_date', 'run_date', 'td_date']:
@@ -269,28 +744,17 @@ class DataIntegrationEngine:
             df['total_penetration'] = df['rop_mhr'] * df['drilling_hours']
         
         # Add composite well identifier for accurate well counting
-        def create_composite_well_id(row, idx):
-            # Priority 1: Use API/UWI if available (most standardized)
-            if pd.notna(row.get('api_number')) and str(row.get('api_number', '')).strip():
-                return f"API_{row['api_number']}"
-            
-            # Priority 2: Use License number if available (Canadian wells)
-            elif pd.notna(row.get('license_number')) and str(row.get('license_number', '')).strip():
-                return f"LIC_{row['license_number']}"
-            
-            # Priority 3: Use well name as fallback
-            elif pd.notna(row.get('well_name')) and str(row.get('well_name', '')).strip():
-                return f"NAME_{row['well_name']}"
-            
-            # Last resort: create unique ID
-            else:
-                return f"UNK_{idx}"
-        
-        # Create composite well identifier
-        df['composite_well_id'] = [create_composite_well_id(row, idx) for idx, row in df.iterrows()]
+        df['composite_well_id'] = build_composite_well_ids(df)
         
         return df
     
+    def _fill_distance_drilled(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Calculate distance drilled if missing from the whole dataset (in place)"""
+        if 'distance_drilled_m' not in df.columns or df['distance_drilled_m'].isna().all():
+            if 'depth_in_m' in df.columns and 'depth_out_m' in df.columns:
+                df['distance_drilled_m'] = df['depth_out_m'] - df['depth_in_m']
+        return df
+    
     def save_integrated_data(self, filename: Optional[str] = None, format: str = 'excel') -> Path:
         """Save integrated data to file"""
         if self.integrated_data is None:
@@ -308,7 +772,10 @@ class DataIntegrationEngine:
             
             with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
                 # Main integrated data
-                self.integrated_data.to_excel(writer, sheet_name='Integrated_Data', index=False)
+                self.with_file_metadata(self.integrated_data).to_excel(writer, sheet_name='Integrated_Data', index=False)
+                
+                # Input files the records came from
+                self.file_metadata.reset_index().to_excel(writer, sheet_name='Source_Files', index=False)
                 
                 # Summary by source
                 source_summary = self._create_source_summary()
@@ -320,7 +787,7 @@ class DataIntegrationEngine:
                 
         elif format.lower() == 'csv':
             output_path = output_folder / f"{filename}.csv"
-            self.integrated_data.to_csv(output_path, index=False)
+            self.with_file_metadata(self.integrated_data).to_csv(output_path, index=False)
         
         else:
             raise ValueError(f"Unsupported format: {format}")
@@ -333,26 +800,19 @@ class DataIntegrationEngine:
         if self.integrated_data is None:
             return pd.DataFrame()
         
-        summary_data = []
-        
-        for source in self.integrated_data['data_source'].unique():
-            source_data = self.integrated_data[self.integrated_data['data_source'] == source]
-            
-            summary = {
-                'data_source': source,
-                'total_records': len(source_data),
-                'unique_wells': source_data['composite_well_id'].nunique(),
-                'unique_operators': source_data['operator'].nunique(),
-                'unique_bit_types': source_data['bit_type'].nunique(),
-                'date_range_start': source_data['spud_date'].min(),
-                'date_range_end': source_data['spud_date'].max(),
-                'avg_rop': source_data['rop_mhr'].mean(),
-                'avg_drilling_hours': source_data['drilling_hours'].mean(),
-                'total_meters_drilled': source_data['distance_drilled_m'].sum(),
-            }
-            summary_data.append(summary)
-        
-        return pd.DataFrame(summary_data)
+        summary = self.integrated_data.groupby('data_source', observed=True, sort=False).agg(
+            total_records=('data_source', 'size'),
+            unique_wells=('composite_well_id', 'nunique'),
+            unique_operators=('operator', 'nunique'),
+            unique_bit_types=('bit_type', 'nunique'),
+            date_range_start=('spud_date', 'min'),
+            date_range_end=('spud_date', 'max'),
+            avg_rop=('rop_mhr', 'mean'),
+            avg_drilling_hours=('drilling_hours', 'mean'),
+            total_meters_drilled=('distance_drilled_m', 'sum'),
+        )
+        
+        return summary.reset_index()
     
     def _create_mapping_reference(self) -> pd.DataFrame:
         """Create reference table of field mappings"""
@@ -424,232 +884,25 @@ class DataIntegrationEngine:
             'total_distance_drilled': df['distance_drilled_m'].sum()
         }
     
-    def _standardize_dull_grades(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Standardize dull grade values for consistency between Reed and Ulterra"""
-        df = df.copy()
-        
-        # Standardize dull gauge values: Reed's 'I' should become 'IN' to match Ulterra
-        if 'dull_gauge' in df.columns:
-            # Count conversions for logging
-            i_count = (df['dull_gauge'] == 'I').sum()
-            
-            if i_count > 0:
-                # Convert Reed's 'I' to 'IN' to match Ulterra's format
-                df['dull_gauge'] = df['dull_gauge'].replace('I', 'IN')
-                print(f"   🔧 Standardized dull_gauge: 'I' → 'IN' ({i_count} records)")
-                
-                # Track total standardizations
-                total_standardizations = i_count
-                print(f"   ✅ Total dull grade standardizations: {total_standardizations}")
-        
-        return df
-    
-    def _standardize_bit_manufacturers(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Standardize bit manufacturer names for consistency between Reed and Ulterra"""
-        df = df.copy()
-        
-        # Define mapping from Ulterra abbreviations to standard full names
-        manufacturer_mapping = {
-            # Ulterra abbreviations to full names (matching Reed format)
-            'BH': 'BAKER HUGHES',
-            'NOV': 'REED HYCALOG',  # NOV owns Reed Hycalog brand
-            'ULT': 'ULTERRA',
-            'SLB': 'SCHLUMBERGER',
-            'HAL': 'HALLIBURTON',
-            'SHR': 'SHEAR BITS',
-            'DF': 'DRILFORMANCE',
-            'OTH': 'OTHER',
-            'TRX': 'TAUREX',
-            'VAR': 'VAREL INTERNATIONAL',
-            'KD': 'KING DREAM',
-            'HAC': 'BAKER HUGHES',  # Hughes Christensen is part of Baker Hughes
-            'DRM': 'DREAM',
-            
-            # Reed standardizations (fixing variations and grouping by parent companies)
-            'REEDHYCALOG': 'REED HYCALOG',
-            'NATIONAL OILWELL VARCO': 'REED HYCALOG',  # Group NOV under Reed Hycalog brand
-            'HUGHES CHRISTENSEN': 'BAKER HUGHES',  # Hughes Christensen is part of Baker Hughes
-            'SMITH BITS': 'SMITH',  # Smith is part of Schlumberger group
-            'SECURITY DIAMANT BOART STRATABIT': 'HALLIBURTON',  # Security DBS is part of Halliburton
-            'J AND L SUPPLY CO. LTD.': 'J&L SUPPLY',
-            'KITTERS BIT SUPPLY': 'KITTERS',
-        }
-        
-        if 'bit_manufacturer' in df.columns:
-            # Count conversions for logging
-            conversions = 0
-            original_values = df['bit_manufacturer'].value_counts()
-            
-            # Apply standardization
-            df['bit_manufacturer'] = df['bit_manufacturer'].replace(manufacturer_mapping)
-            
-            # Count how many values were actually changed
-            new_values = df['bit_manufacturer'].value_counts()
-            for orig_name, mapped_name in manufacturer_mapping.items():
-                if orig_name in original_values and orig_name != mapped_name:
-                    conversions += original_values[orig_name]
-            
-            if conversions > 0:
-                print(f"   🔧 Standardized bit_manufacturer names ({conversions} records)")
-                
-                # Show some examples of conversions
-                examples = []
-                for orig, new in manufacturer_mapping.items():
-                    if orig != new and orig in original_values:
-                        examples.append(f"'{orig}' → '{new}' ({original_values[orig]})")
-                
-                if examples:
-                    print(f"   📝 Key conversions: {', '.join(examples[:5])}")
-                    if len(examples) > 5:
-                        print(f"   📝 ... and {len(examples) - 5} more")
-        
-        return df
-
-    def _standardize_contractors(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Standardize contractor names and create combined rig names"""
-        df = df.copy()
-        
-        # Define mapping for contractor name standardization
-        contractor_mapping = {
-            # Standardize common contractor variations
-            'ENSIGN DRILLING': 'Ensign Drilling',
-            'ENSIGN': 'Ensign Drilling',
-            'PRECISION DRILLING': 'Precision Drilling',
-            'PRECISION': 'Precision Drilling',
-            'FOX DRILLING INC.': 'Fox Drilling',
-            'FOX DRILLING': 'Fox Drilling',
-            'SAVANNA DRILLING': 'Savanna Drilling',
-            'SAVANNA': 'Savanna Drilling',
-            'AKITA DRILLING': 'Akita Drilling',
-            'AKITA': 'Akita Drilling',
-            'TRINIDAD DRILLING': 'Trinidad Drilling',
-            'TRINIDAD': 'Trinidad Drilling',
-            'NORTHERN BLIZZARD DRILLING': 'Northern Blizzard Drilling',
-            'NORTHERN BLIZZARD': 'Northern Blizzard Drilling',
-            'INDEPENDENCE DRILLING CORPORATION': 'Independence Drilling',
-            'INDEPENDENCE': 'Independence Drilling',
-            'TOTAL DRILLING SOLUTIONS': 'Total Drilling Solutions',
-            'TOTAL DRILLING': 'Total Drilling Solutions',
-        }
-        
-        if 'contractor' in df.columns:
-            # Count conversions for logging
-            conversions = 0
-            original_values = df['contractor'].value_counts()
-            
-            # First standardize specific mappings
-            df['contractor'] = df['contractor'].replace(contractor_mapping)
-            
-            # Then apply title case to all remaining contractor names
-            df['contractor'] = df['contractor'].astype(str).apply(
-                lambda x: x.title() if pd.notna(x) and x != 'nan' else x
-            )
-            
-            # Count how many values were actually changed
-            for orig_name, mapped_name in contractor_mapping.items():
-                if orig_name in original_values and orig_name != mapped_name:
-                    conversions += original_values[orig_name]
-            
-            if conversions > 0:
-                print(f"   🔧 Standardized contractor names ({conversions} records)")
-        
-        # Create combined rig name field (format: "Contractor Rig#")
-        if 'contractor' in df.columns and 'rig_name' in df.columns:
-            def create_combined_rig_name(row):
-                contractor = row.get('contractor', '')
-                rig_name = row.get('rig_name', '')
-                
-                # Handle missing values
-                if pd.isna(contractor) or contractor == 'nan':
-                    contractor = ''
-                if pd.isna(rig_name) or rig_name == 'nan':
-                    rig_name = ''
-                
-                # Create combined name with single space
-                if contractor and rig_name:
-                    return f"{contractor} {rig_name}"
-                elif contractor:
-                    return contractor
-                elif rig_name:
-                    return str(rig_name)
-                else:
-                    return ''
-            
-            df['reporting_rig_name'] = df.apply(create_combined_rig_name, axis=1)
-            
-            # Log creation of combined field
-            combined_count = df['reporting_rig_name'].notna().sum()
-            print(f"   🏗️  Created reporting_rig_name field ({combined_count} records)")
-        
-        return df
-
     def _create_improved_bit_size_categories(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Create improved bit size categories based on common drilling bit sizes"""
-        df = df.copy()
-        
-        def categorize_bit_size(size):
-            """Categorize bit size into functional drilling groups"""
-            if pd.isna(size):
-                return 'Unknown', 'Other'
-            
-            # Primary categories (Common bit sizes) - simplified names
-            if 153 <= size <= 162:
-                return '158mm', 'Common'  # 6.125" bit group
-            elif 167 <= size <= 177:
-                return '171mm', 'Common'  # 6.75" bit group  
-            elif 197 <= size <= 207:
-                return '200mm', 'Common'  # 8" bit group
-            elif 217 <= size <= 227:
-                return '222mm', 'Common'  # 8.75" bit group
-            elif 247 <= size <= 257:
-                return '251mm', 'Common'  # 10" bit group
-            elif 275 <= size <= 285:
-                return '279mm', 'Common'  # 11" bit group
-            elif 307 <= size <= 317:
-                return '311mm', 'Common'  # 12.25" bit group
-            elif 345 <= size <= 355:
-                return '349mm', 'Common'  # 14" bit group
-            elif 205 <= size <= 220:
-                return '215mm', 'Common'  # Mid-range common size
-            
-            # Secondary categories (Other sizes)
-            elif size < 150:
-                return '<150mm', 'Other'
-            elif 160 <= size <= 170:
-                return '160-170mm', 'Other'
-            elif 175 <= size <= 200:
-                return '175-200mm', 'Other'
-            elif 225 <= size <= 250:
-                return '225-250mm', 'Other'
-            elif 255 <= size <= 275:
-                return '255-275mm', 'Other'
-            elif 285 <= size <= 310:
-                return '285-310mm', 'Other'
-            elif 315 <= size <= 345:
-                return '315-345mm', 'Other'
-            elif size > 355:
-                return '>355mm', 'Other'
-            else:
-                return 'Other', 'Other'
+        """Create improved bit size categories based on common drilling bit sizes (in place)"""
         
         if 'bit_size_mm' in df.columns:
-            # Apply categorization to get both category and class
-            categories_and_classes = df['bit_size_mm'].apply(categorize_bit_size)
-            
-            # Split into separate columns
-            df['bit_size_category'] = categories_and_classes.apply(lambda x: x[0] if isinstance(x, tuple) else x)
-            df['bit_class'] = categories_and_classes.apply(lambda x: x[1] if isinstance(x, tuple) else 'Other')
+            # One vectorized pass over the configured size bands; first matching band wins
+            df['bit_size_category'], df['bit_class'] = categorize_bit_sizes(
+                df['bit_size_mm'], self.config.bit_size_bands
+            )
             
             # Log the categorization results
-            category_counts = df['bit_size_category'].value_counts()
             class_counts = df['bit_class'].value_counts()
             total_categorized = df['bit_size_category'].notna().sum()
             
             print(f"   🏷️  Updated bit_size_category ({total_categorized} records)")
-            print(f"   📊 Bit classes: {dict(class_counts)}")
+            print(f"   📊 Bit classes: {dict(class_counts[class_counts > 0])}")
             
             # Show top categories
-            common_categories = df[df['bit_class'] == 'Common']['bit_size_category'].value_counts().head(3)
+            common_categories = df[df['bit_class'] == 'Common']['bit_size_category'].value_counts()
+            common_categories = common_categories[common_categories > 0].head(3)
             if len(common_categories) > 0:
                 examples = []
                 for cat, count in common_categories.items():
@@ -0,0 +1,266 @@
+"""
+Vectorized Column Helpers
+Shared kernels for normalizing low-cardinality columns without per-row Python loops.
+
+Vendor columns such as contractor or manufacturer names repeat a small
+vocabulary across many run records, so normalization functions are applied
+once per distinct value and the results are broadcast back to every row.
+Storage helpers apply the dtypes declared in DataMappingConfig (categorical
+for low-cardinality fields, nullable strings for identifiers, compact numeric
+dtypes in compact mode) and release them where values are patched. License
+keys for the GDC join are trimmed with Arrow string kernels and can be
+turned into int64 join keys.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    ARROW_AVAILABLE = True
+    STRING_DTYPE = pd.StringDtype('pyarrow')
+except ImportError:
+    ARROW_AVAILABLE = False
+    STRING_DTYPE = pd.StringDtype('python')
+
+# Identifier text that means "no value" (compared case-insensitively after stripping)
+NULL_IDENTIFIER_TOKENS = ['', 'nan', 'none']
+
+_type_of = np.frompyfunc(type, 1, 1)
+
+# Whole-number decimals with up to this many integer digits convert exactly through float
+_EXACT_FLOAT_DIGITS = 15
+# Digit keys up to this long fit in int64
+_INT64_DIGITS = 18
+
+
+def distinct_value_codes(values: pd.Series) -> np.ndarray:
+    """
+    Integer code per row such that rows share a code only if their values are interchangeable.
+
+    Object columns are keyed by (type, str form): values like 12, 12.0 and True
+    compare/hash equal to each other but stringify differently, and missing
+    values (None, NaN, pd.NA, NaT) stay apart by kind. Typed columns are
+    factorized directly.
+    """
+    if values.dtype != object:
+        codes, _ = pd.factorize(values, use_na_sentinel=False)
+        return codes
+
+    if len(values) == 0:
+        return np.zeros(0, dtype=np.intp)
+
+    text_codes, _ = pd.factorize(values.astype(str))
+    type_codes, _ = pd.factorize(_type_of(values.to_numpy(dtype=object)))
+    codes, _ = pd.factorize(text_codes.astype(np.int64) * (type_codes.max() + 1) + type_codes)
+    return codes
+
+
+def map_unique(values: pd.Series, func: Callable[[Any], Any]) -> pd.Series:
+    """
+    Apply func once per distinct value and broadcast the results back to every row.
+
+    Equivalent to values.map(func) (as an object column) for any func that
+    depends only on the value.
+    """
+    codes = distinct_value_codes(values)
+    _, first_positions = np.unique(codes, return_index=True)
+    representatives = values.to_numpy(dtype=object)[first_positions]
+
+    mapped = np.empty(len(representatives), dtype=object)
+    for i, value in enumerate(representatives):
+        mapped[i] = func(value)
+
+    return pd.Series(mapped.take(codes), index=values.index, dtype=object)
+
+
+def normalize_identifiers(values: pd.Series) -> pd.Series:
+    """
+    Normalize identifier values (license, UWI, serial numbers, well names) to nullable strings.
+
+    Numeric text with a '.0' tail (how float cells stringify: 12345.0) loses it,
+    zero-padded strings keep their leading zeros, surrounding whitespace is
+    stripped, and missing values or NULL_IDENTIFIER_TOKENS become <NA>. Values
+    are stringified once and all cleanup runs as Arrow string kernels.
+    """
+    if isinstance(values.dtype, pd.StringDtype):
+        text = values.astype(STRING_DTYPE)
+    else:
+        strings = values.astype(str).to_numpy(dtype=object)
+        strings[values.isna().to_numpy()] = None
+        text = pd.Series(pd.array(strings, dtype=STRING_DTYPE), index=values.index)
+
+    text = text.str.strip()
+    float_formatted = text.str.match(r'-?\d+\.0$').fillna(False).to_numpy(dtype=bool)
+    text = text.where(~float_formatted, text.str.slice(stop=-2))
+    return text.mask(text.str.lower().isin(NULL_IDENTIFIER_TOKENS))
+
+
+def apply_storage_types(df: pd.DataFrame, storage_types: Dict[str, str]) -> pd.DataFrame:
+    """Cast fields to their declared storage dtypes in place (fields not in df are skipped)"""
+    for field, dtype in storage_types.items():
+        if field not in df.columns:
+            continue
+        target = STRING_DTYPE if dtype == 'string' else dtype
+        # Compare dtypes, not names: python- and Arrow-backed strings are both named 'string'
+        if df[field].dtype != target:
+            df[field] = df[field].astype(target)
+    return df
+
+
+def apply_precision_policies(df: pd.DataFrame, policies: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Downcast numeric fields to their policy dtype in place where every value fits the policy.
+
+    policies maps field -> object with dtype/lower/upper (DataMappingConfig.PrecisionPolicy).
+    Fields that are not numeric, have values outside [lower, upper] or, for integer
+    dtypes, fractional values keep their dtype; they are returned with the reason.
+    """
+    kept = {}
+    for field, policy in policies.items():
+        if field not in df.columns or str(df[field].dtype) == policy.dtype:
+            continue
+        values = df[field]
+        if not pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(values):
+            kept[field] = f"not numeric ({values.dtype})"
+            continue
+
+        lower = -np.inf if policy.lower is None else policy.lower
+        upper = np.inf if policy.upper is None else policy.upper
+        target = pd.api.types.pandas_dtype(policy.dtype)
+        if target.kind in 'iu':
+            limits = np.iinfo(target.numpy_dtype)
+            lower, upper = max(lower, limits.min), min(upper, limits.max)
+
+        present = values.dropna().to_numpy(dtype=np.float64)
+        if len(present) and (present.min() < lower or present.max() > upper):
+            kept[field] = f"values outside [{lower:g}, {upper:g}] (observed {present.min():g} to {present.max():g})"
+        elif target.kind in 'iu' and not np.array_equal(present, np.trunc(present)):
+            kept[field] = "fractional values"
+        else:
+            df[field] = values.astype(target)
+    return kept
+
+
+def release_storage_types(df: pd.DataFrame, fields: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Cast categorical and nullable-string fields back to object in place so they accept any value.
+
+    Categorical columns reject .loc assignments of values outside their categories and
+    string columns reject non-string values; callers that patch values release them
+    first and re-apply storage types after.
+    """
+    for field in fields if fields is not None else df.columns:
+        if field in df.columns and isinstance(df[field].dtype, (pd.CategoricalDtype, pd.StringDtype)):
+            df[field] = df[field].astype(object)
+    return df
+
+
+def trim_license_number(value) -> Optional[str]:
+    """
+    Trim leading zeros from a license number for consistent matching (scalar reference).
+
+    Whitespace is stripped, missing values and NULL_IDENTIFIER_TOKENS become None,
+    whole-number decimals lose the decimal part, and all-digit text loses its
+    leading zeros ('000' becomes '0'). Anything else is returned as text.
+    """
+    if pd.isna(value) or value is None:
+        return None
+
+    str_value = str(value).strip()
+    if not str_value or str_value.lower() in NULL_IDENTIFIER_TOKENS:
+        return None
+
+    # Remove decimal places if present
+    if '.' in str_value and str_value.replace('.', '').replace('-', '').isdigit():
+        try:
+            float_val = float(str_value)
+            if float_val == int(float_val):  # No fractional part
+                str_value = str(int(float_val))
+        except (ValueError, OverflowError):
+            pass
+
+    if str_value.isdigit():
+        trimmed = str_value.lstrip('0')
+        return trimmed if trimmed else '0'
+
+    return str_value
+
+
+def trim_license_numbers(values: pd.Series) -> pd.Series:
+    """
+    trim_license_number for a whole column, as Arrow compute kernels.
+
+    Values are stringified once. Whole-number decimals of up to 15 digits drop
+    their decimal part as text (float conversion is exact there); other text
+    whose result depends on Python's float parsing or Unicode rules (other
+    decimals, non-printable or non-ASCII characters) is rare and goes through
+    trim_license_number once per distinct value, as does everything without
+    pyarrow. Returns an object column with None for missing keys.
+    """
+    if not ARROW_AVAILABLE:
+        return map_unique(values, trim_license_number)
+
+    strings = values.astype(str).to_numpy(dtype=object)
+    strings[values.isna().to_numpy()] = None
+    text = pa.array(strings, type=pa.string())
+
+    regular = pc.and_(pc.string_is_ascii(text),
+                      pc.or_(pc.ascii_is_printable(text), pc.equal(pc.binary_length(text), 0)))
+    text = pc.utf8_trim_whitespace(text)
+
+    # 12.000 -> '12.' -> '12'; anything else with a dot and only digits/dots/dashes needs float parsing
+    zeros_trimmed = pc.utf8_rtrim(text, '0')
+    integer_part = pc.utf8_slice_codeunits(zeros_trimmed, 0, -1)
+    whole_decimal = pc.and_(pc.ends_with(zeros_trimmed, '.'),
+                            pc.and_(pc.utf8_is_digit(integer_part),
+                                    pc.less_equal(pc.binary_length(integer_part), _EXACT_FLOAT_DIGITS)))
+    numeric_text = pc.replace_substring(pc.replace_substring(text, '.', ''), '-', '')
+    float_decimal = pc.and_(pc.match_substring(text, '.'), pc.utf8_is_digit(numeric_text))
+    irregular = pc.or_(pc.invert(regular), pc.and_not(float_decimal, whole_decimal))
+
+    digits = pc.if_else(whole_decimal, integer_part, text)
+    is_digits = pc.or_(whole_decimal, pc.utf8_is_digit(text))
+    stripped = pc.utf8_ltrim(digits, '0')
+    stripped = pc.if_else(pc.equal(pc.binary_length(stripped), 0), '0', stripped)
+    text = pc.if_else(is_digits, stripped, text)
+    null_token = pc.is_in(pc.utf8_lower(text), value_set=pa.array(NULL_IDENTIFIER_TOKENS))
+    text = pc.if_else(null_token, pa.scalar(None, pa.string()), text)
+
+    trimmed = text.to_numpy(zero_copy_only=False)
+    irregular = irregular.to_numpy(zero_copy_only=False) == True  # noqa: E712 (missing -> False)
+    if irregular.any():
+        trimmed[irregular] = map_unique(values[irregular], trim_license_number).to_numpy()
+    return pd.Series(trimmed, index=values.index, dtype=object)
+
+
+def integer_join_keys(left: pd.Series, right: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    int64 join keys for two columns of trimmed license keys (trim_license_numbers output).
+
+    Keys without leading zeros of up to 18 digits become their integer value;
+    other text gets a negative code shared by both sides and missing keys get
+    -1, so two keys are equal exactly when the strings were (as pandas merges
+    them, missing matching missing). Without pyarrow every key is factorized.
+    """
+    both = pd.concat([left, right], ignore_index=True)
+    if not ARROW_AVAILABLE:
+        codes, _ = pd.factorize(both)
+        return codes[:len(left)], codes[len(left):]
+
+    text = pa.array(both.to_numpy(dtype=object), type=pa.string())
+    length = pc.binary_length(text)
+    ascii_digits = pc.and_(pc.string_is_ascii(text), pc.utf8_is_digit(text))
+    numeric = pc.and_(pc.and_(ascii_digits, pc.less_equal(length, _INT64_DIGITS)),
+                      pc.or_(pc.invert(pc.starts_with(text, '0')), pc.equal(length, 1)))
+    numeric = numeric.to_numpy(zero_copy_only=False) == True  # noqa: E712 (missing -> False)
+    other = ~numeric & both.notna().to_numpy()
+
+    keys = np.full(len(both), -1, dtype=np.int64)
+    keys[numeric] = pc.cast(text.filter(pa.array(numeric)), pa.int64()).to_numpy()
+    codes, _ = pd.factorize(both[other])
+    keys[other] = -2 - codes
+    return keys[:len(left)], keys[len(left):]
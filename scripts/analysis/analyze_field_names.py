@@ -6,30 +6,22 @@ Compare field names to understand matching opportunities
 import pandas as pd
 import numpy as np
 from pathlib import Path
-import oracledb
 import logging
+import sys
+
+# Add core directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'core'))
+from excel_readers import read_excel_sheet
+from gdc_access import fetch_frame, shared_pool
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 def connect_to_gdc():
-    """Connect to GDC Oracle database"""
+    """Check out a session from the shared GDC pool"""
     try:
-        connection_params = {
-            'host': 'WC-CGY-ORAP01',
-            'port': 1521,
-            'service': 'PRD1',
-            'user': 'synergyro',
-            'password': 'synergyro'
-        }
-        
-        dsn = f"{connection_params['host']}:{connection_params['port']}/{connection_params['service']}"
-        connection = oracledb.connect(
-            user=connection_params['user'],
-            password=connection_params['password'],
-            dsn=dsn
-        )
+        connection = shared_pool().acquire()
         
         logger.info("✅ Connected to Oracle GDC database")
         return connection
@@ -52,7 +44,7 @@ def analyze_bit_data_fields():
     logger.info(f"📊 Loading bit data from: {latest_file.name}")
     
     # Load integrated data
-    df = pd.read_excel(latest_file)
+    df = read_excel_sheet(latest_file)
     
     # Filter to records missing license numbers
     missing_license = df[
@@ -94,7 +86,7 @@ def analyze_gdc_fields(connection, bit_fields=None):
         ORDER BY COLUMN_ID
         """
         
-        structure_df = pd.read_sql(structure_query, connection)
+        structure_df = fetch_frame(connection, structure_query)
         
         print(f"\n🏗️  GDC.WELL TABLE STRUCTURE:")
         print("=" * 50)
@@ -126,7 +118,7 @@ def analyze_gdc_fields(connection, bit_fields=None):
             """
             
             try:
-                sample_df = pd.read_sql(sample_query, connection)
+                sample_df = fetch_frame(connection, sample_query)
                 print(f"\n  🔹 {col}:")
                 for _, row in sample_df.iterrows():
                     field_val = str(row['FIELD_VALUE'])[:40]  # Truncate long values
@@ -151,7 +143,7 @@ def analyze_gdc_fields(connection, bit_fields=None):
                     WHERE {gdc_col} IS NOT NULL
                     """
                     
-                    gdc_fields_df = pd.read_sql(gdc_query, connection)
+                    gdc_fields_df = fetch_frame(connection, gdc_query)
                     gdc_field_set = set(gdc_fields_df['FIELD_VALUE'].str.upper().str.strip())
                     
                     # Check for matches with bit field names
@@ -225,7 +217,7 @@ def main():
                 print("❌ Could not identify suitable field columns in GDC table")
         
         finally:
-            connection.close()
+            shared_pool().release(connection)
     else:
         print("❌ Could not connect to GDC database")
 
@@ -6,6 +6,11 @@ to help determine potential lookup keys for finding license numbers.
 import pandas as pd
 import numpy as np
 from pathlib import Path
+import sys
+
+# Add core directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'core'))
+from excel_readers import read_excel_sheet
 
 def analyze_missing_license_keys():
     """Analyze what data is available for records missing license numbers"""
@@ -16,7 +21,7 @@ def analyze_missing_license_keys():
     latest_file = max(integrated_files, key=lambda x: x.stat().st_mtime)
     
     print(f"📊 Analyzing: {latest_file.name}")
-    df = pd.read_excel(latest_file)
+    df = read_excel_sheet(latest_file)
     
     # Filter to records missing license numbers
     missing_license = df[
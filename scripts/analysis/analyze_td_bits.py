@@ -5,6 +5,11 @@ from pathlib import Path
 import numpy as np
 from datetime import datetime
 import warnings
+import sys
+
+# Add core directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'core'))
+from excel_readers import read_excel_sheet
 warnings.filterwarnings('ignore')
 
 def analyze_td_bits():
@@ -25,7 +30,7 @@ def analyze_td_bits():
     print(f"Analyzing data from: {latest_file.name}")
     
     # Load the data
-    df = pd.read_excel(latest_file)
+    df = read_excel_sheet(latest_file)
     print(f"Total records: {len(df)}")
     
     # Filter for TD bits
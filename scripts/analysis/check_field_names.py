@@ -4,6 +4,11 @@ Quick script to check field names in bit data and compare with GDC fields
 
 import pandas as pd
 from pathlib import Path
+import sys
+
+# Add core directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'core'))
+from excel_readers import read_excel_sheet
 
 # Load the integrated data
 output_dir = Path("Output")
@@ -11,7 +16,7 @@ integrated_files = list(output_dir.glob("Integrated_BitData_*.xlsx"))
 latest_file = max(integrated_files, key=lambda x: x.stat().st_mtime)
 
 print(f"Loading: {latest_file.name}")
-df = pd.read_excel(latest_file)
+df = read_excel_sheet(latest_file)
 
 # Filter to Ulterra records missing license numbers
 missing_license = df[
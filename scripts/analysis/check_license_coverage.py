@@ -5,6 +5,11 @@ Quick analysis of license number coverage in the integrated dataset
 import pandas as pd
 import numpy as np
 from pathlib import Path
+import sys
+
+# Add core directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'core'))
+from excel_readers import read_excel_sheet
 
 def analyze_license_coverage():
     """Analyze license number coverage by source"""
@@ -25,7 +30,7 @@ def analyze_license_coverage():
     print(f"📊 Analyzing: {latest_file.name}")
     
     # Load the data
-    df = pd.read_excel(latest_file)
+    df = read_excel_sheet(latest_file)
     
     print(f"\n📈 Total Records: {len(df):,}")
     print(f"📈 Total Sources: {df['data_source'].nunique()}")
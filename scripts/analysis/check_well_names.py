@@ -3,8 +3,13 @@ Check WELL_NAME column for field name patterns
 """
 
 import pandas as pd
-import oracledb
 import logging
+import sys
+from pathlib import Path
+
+# Add core directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'core'))
+from gdc_access import fetch_frame, shared_pool
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -13,8 +18,7 @@ def check_well_names():
     """Check WELL_NAME column for patterns matching our bit field names"""
     
     try:
-        dsn = "WC-CGY-ORAP01:1521/PRD1"
-        connection = oracledb.connect(user='synergyro', password='synergyro', dsn=dsn)
+        connection = shared_pool().acquire()
         
         # Our bit field names
         bit_fields = ['ANTE CREEK', 'KAKWA', 'WAPITI', 'GOLD CREEK', 'KARR', 'JAYAR', 
@@ -37,7 +41,7 @@ def check_well_names():
             """
             
             try:
-                results = pd.read_sql(query, connection)
+                results = fetch_frame(connection, query)
                 if not results.empty:
                     print(f"  ✅ Found {len(results)} well name patterns:")
                     for _, row in results.iterrows():
@@ -72,7 +76,7 @@ def check_well_names():
         """
         
         try:
-            patterns = pd.read_sql(query, connection)
+            patterns = fetch_frame(connection, query)
             if not patterns.empty:
                 print("✅ Found some field/well name combinations:")
                 for _, row in patterns.iterrows():
@@ -83,7 +87,7 @@ def check_well_names():
         except Exception as e:
             print(f"❌ Error checking patterns: {e}")
         
-        connection.close()
+        shared_pool().release(connection)
         
     except Exception as e:
         logger.error(f"Connection or query error: {e}")
@@ -8,7 +8,12 @@ import pandas as pd
 from pathlib import Path
 import logging
 from datetime import datetime
-import numpy as np
+import sys
+
+# Add core directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'core'))
+from excel_readers import read_excel_sheet
+from manufacturer_normalizer import ManufacturerNormalizer
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -18,7 +23,9 @@ class ManufacturerCleanup:
     def __init__(self):
         self.output_dir = Path("Output")
         self.df = None
-        self.manufacturer_mapping = {}
+        self.normalizer = None
+        self.manufacturer_mapping = None
+        self.change_log = None
         self.cleanup_stats = {}
         
     def load_latest_dataset(self):
@@ -38,7 +45,7 @@ class ManufacturerCleanup:
             raise FileNotFoundError("No integrated data files found")
         
         logger.info(f"📊 Loading dataset: {latest_file.name}")
-        self.df = pd.read_excel(latest_file)
+        self.df = read_excel_sheet(latest_file)
         logger.info(f"📈 Total records loaded: {len(self.df):,}")
         
         return latest_file.name
@@ -62,87 +69,21 @@ class ManufacturerCleanup:
         return manufacturer_counts
     
     def create_manufacturer_mapping(self):
-        """Create standardized manufacturer name mapping"""
-        
-        # Company consolidation rules as specified
-        self.manufacturer_mapping = {
-            # NOV and Reed Hycalog are the same company -> Reed
-            'NOV': 'Reed',
-            'Reed Hycalog': 'Reed',
-            'Reed': 'Reed',
-            'REED': 'Reed',
-            'reed': 'Reed',
-            'NOV/Reed': 'Reed',
-            'Reed/NOV': 'Reed',
-            
-            # Schlumberger and Smith are the same source -> Smith
-            'Schlumberger': 'Smith',
-            'Smith': 'Smith',
-            'SMITH': 'Smith',
-            'smith': 'Smith',
-            'Smith Bits': 'Smith',
-            'Smith International': 'Smith',
-            'Schlumberger/Smith': 'Smith',
-            'Smith/Schlumberger': 'Smith',
-            
-            # Halliburton and Security are the same -> Security
-            'Halliburton': 'Security',
-            'Security': 'Security',
-            'SECURITY': 'Security',
-            'security': 'Security',
-            'Security DBS': 'Security',
-            'Halliburton/Security': 'Security',
-            'Security/Halliburton': 'Security',
-            
-            # Other common standardizations
-            'Baker Hughes': 'Baker Hughes',
-            'BAKER HUGHES': 'Baker Hughes',
-            'baker hughes': 'Baker Hughes',
-            'BHI': 'Baker Hughes',
-            'Hughes': 'Baker Hughes',
-            
-            'Ulterra': 'Ulterra',
-            'ULTERRA': 'Ulterra',
-            'ulterra': 'Ulterra',
-            
-            'Varel': 'Varel',
-            'VAREL': 'Varel',
-            'varel': 'Varel',
-            
-            'Kingdream': 'Kingdream',
-            'KINGDREAM': 'Kingdream',
-            'kingdream': 'Kingdream',
-            
-            'Bit Brokers': 'Bit Brokers',
-            'BIT BROKERS': 'Bit Brokers',
-            'bit brokers': 'Bit Brokers',
-            
-            'National Oilwell': 'Reed',  # NOV subsidiary
-            'National': 'Reed',
-            
-            # Handle null/missing values
-            None: 'Unknown',
-            'Unknown': 'Unknown',
-            'UNKNOWN': 'Unknown',
-            '': 'Unknown',
-            np.nan: 'Unknown'
-        }
+        """Load the 'cleanup' rule set from core/manufacturer_rules.json"""
+        self.normalizer = ManufacturerNormalizer('cleanup')
+        self.manufacturer_mapping = self.normalizer.rule_set.to_frame()
         
-        logger.info(f"📋 Created manufacturer mapping with {len(self.manufacturer_mapping)} entries")
+        logger.info(f"📋 Loaded manufacturer rules v{self.normalizer.rules.version} "
+                    f"with {len(self.manufacturer_mapping)} entries")
         
         # Show the consolidation plan
         print(f"\n🔄 MANUFACTURER CONSOLIDATION PLAN:")
         print("=" * 50)
         
-        consolidations = {}
-        for original, standardized in self.manufacturer_mapping.items():
-            if standardized not in consolidations:
-                consolidations[standardized] = []
-            consolidations[standardized].append(str(original))
-        
-        for standard_name, variations in consolidations.items():
-            if len(variations) > 1:
-                print(f"  {standard_name}: {', '.join(variations)}")
+        for standard_name, rules in self.manufacturer_mapping.groupby('canonical', sort=False):
+            print(f"  {standard_name}: {', '.join(rules['pattern'])}")
+        if self.normalizer.rule_set.missing is not None:
+            print(f"  Missing values: {self.normalizer.rule_set.missing}")
         
         return self.manufacturer_mapping
     
@@ -159,24 +100,10 @@ class ManufacturerCleanup:
         # Create backup of original values
         self.df['bit_manufacturer_original'] = self.df['bit_manufacturer'].copy()
         
-        # Track changes
-        changes_made = 0
-        unchanged_count = 0
-        
-        # Apply mapping
-        for idx, original_value in enumerate(self.df['bit_manufacturer']):
-            # Handle NaN values
-            if pd.isna(original_value):
-                standardized = 'Unknown'
-            else:
-                original_str = str(original_value).strip()
-                standardized = self.manufacturer_mapping.get(original_str, original_str)
-            
-            if str(standardized) != str(original_value):
-                self.df.at[idx, 'bit_manufacturer'] = standardized
-                changes_made += 1
-            else:
-                unchanged_count += 1
+        # Apply rules to the distinct names and broadcast back
+        self.df['bit_manufacturer'], self.change_log = self.normalizer.normalize(self.df['bit_manufacturer'])
+        changes_made = int(self.change_log['rows'].sum())
+        unchanged_count = len(self.df) - changes_made
         
         logger.info(f"✅ Applied manufacturer cleanup: {changes_made:,} records changed, {unchanged_count:,} unchanged")
         
@@ -310,12 +237,9 @@ class ManufacturerCleanup:
             })
             standardized_df.to_excel(writer, sheet_name='Standardized_Manufacturers', index=False)
             
-            # Mapping table
-            mapping_df = pd.DataFrame([
-                {'Original_Name': k, 'Standardized_Name': v} 
-                for k, v in self.manufacturer_mapping.items()
-            ])
-            mapping_df.to_excel(writer, sheet_name='Mapping_Rules', index=False)
+            # Mapping rules and what each changed
+            self.manufacturer_mapping.to_excel(writer, sheet_name='Mapping_Rules', index=False)
+            self.change_log.to_excel(writer, sheet_name='Change_Log', index=False)
             
             # Changed records sample
             changed_records = self.df[
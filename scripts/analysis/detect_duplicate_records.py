@@ -9,6 +9,11 @@ from pathlib import Path
 import logging
 from datetime import datetime
 import numpy as np
+import sys
+
+# Add core directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'core'))
+from excel_readers import read_excel_sheet
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -37,7 +42,7 @@ class DuplicateAnalyzer:
             raise FileNotFoundError("No integrated data files found")
         
         logger.info(f"📊 Loading dataset: {latest_file.name}")
-        self.df = pd.read_excel(latest_file)
+        self.df = read_excel_sheet(latest_file)
         logger.info(f"📈 Total records loaded: {len(self.df):,}")
         
         return latest_file.name
@@ -8,6 +8,12 @@ import pandas as pd
 from pathlib import Path
 import logging
 from datetime import datetime
+import sys
+
+# Add core directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'core'))
+from excel_readers import read_excel_sheet
+from manufacturer_normalizer import ManufacturerNormalizer
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -38,86 +44,24 @@ class EnhancedManufacturerCleanup:
             raise FileNotFoundError("No integrated data files found")
         
         logger.info(f"📊 Loading dataset: {latest_file.name}")
-        self.df = pd.read_excel(latest_file)
+        self.df = read_excel_sheet(latest_file)
         logger.info(f"📈 Total records loaded: {len(self.df):,}")
         
         return latest_file.name
     
     def create_enhanced_mapping(self):
-        """Create enhanced manufacturer mapping based on actual data and business rules"""
-        
-        # Based on the actual manufacturer names in the dataset and business consolidation rules
-        mapping = {
-            # Reed consolidation (NOV and Reed Hycalog are the same company)
-            'REEDHYCALOG': 'Reed',
-            'Reed': 'Reed',
-            'NOV': 'Reed',
-            
-            # Smith consolidation (Schlumberger and Smith are the same source)
-            'SMITH BITS': 'Smith',
-            'SLB': 'Smith',  # Schlumberger company code
-            
-            # Security consolidation (Halliburton and Security are the same)
-            'SECURITY DIAMANT BOART STRATABIT': 'Security',
-            'HAL': 'Security',  # Halliburton company code
-            
-            # Baker Hughes consolidation
-            'HUGHES CHRISTENSEN': 'Baker Hughes',
-            'BH': 'Baker Hughes',  # Baker Hughes company code
-            
-            # Ulterra standardization
-            'Ulterra': 'Ulterra',
-            'ULT': 'Ulterra',  # Ulterra company code
-            
-            # Varel standardization
-            'VAREL INTERNATIONAL': 'Varel',
-            'VAR': 'Varel',  # Varel company code
-            
-            # Kingdream standardization
-            'KING DREAM': 'Kingdream',
-            'KD': 'Kingdream',  # Kingdream company code
-            
-            # Other manufacturers - keep as is but clean up
-            'DRILFORMANCE': 'Drilformance',
-            'DF': 'Drilformance',  # Likely Drilformance code
-            
-            'SHEAR BITS': 'Shear Bits',
-            'SHR': 'Shear Bits',  # Likely Shear Bits code
-            
-            'J AND L SUPPLY CO. LTD.': 'J&L Supply',
-            'TAUREX': 'Taurex',
-            'TRX': 'Taurex',  # Likely Taurex code
-            
-            'TRENDON': 'Trendon',
-            'SANDVIK': 'Sandvik',
-            'KITTERS BIT SUPPLY': 'Kitters Bit Supply',
-            'HAC': 'HAC',
-            'DRM': 'DRM',
-            
-            # Handle generic/unknown
-            'OTHER': 'Other',
-            'OTH': 'Other',
-            'Unknown': 'Unknown',
-            'UNKNOWN': 'Unknown'
-        }
-        
-        print(f"\n🔄 ENHANCED MANUFACTURER CONSOLIDATION PLAN:")
+        """Load the 'consolidation' rule set from core/manufacturer_rules.json"""
+        normalizer = ManufacturerNormalizer('consolidation')
+        rules = normalizer.rule_set.to_frame()
+        
+        print(f"\n🔄 ENHANCED MANUFACTURER CONSOLIDATION PLAN (rules v{normalizer.rules.version}):")
         print("=" * 60)
         
         # Group by target company
-        consolidations = {}
-        for original, target in mapping.items():
-            if target not in consolidations:
-                consolidations[target] = []
-            consolidations[target].append(original)
-        
-        for target, sources in consolidations.items():
-            if len(sources) > 1:
-                print(f"  {target:<15}: {', '.join(sources)}")
-            else:
-                print(f"  {target:<15}: {sources[0]} (no change)")
-        
-        return mapping
+        for target, sources in rules.groupby('canonical', sort=False):
+            print(f"  {target:<15}: {', '.join(sources['pattern'])}")
+        
+        return normalizer
     
     def apply_enhanced_cleanup(self):
         """Apply the enhanced manufacturer consolidation"""
@@ -125,7 +69,7 @@ class EnhancedManufacturerCleanup:
             logger.error("❌ No dataset loaded")
             return 0
         
-        mapping = self.create_enhanced_mapping()
+        normalizer = self.create_enhanced_mapping()
         
         if 'bit_manufacturer' not in self.df.columns:
             logger.error("❌ bit_manufacturer column not found")
@@ -135,14 +79,12 @@ class EnhancedManufacturerCleanup:
         if 'bit_manufacturer_original' not in self.df.columns:
             self.df['bit_manufacturer_original'] = self.df['bit_manufacturer'].copy()
         
-        # Apply mapping
-        changes_made = 0
-        for idx, current_value in enumerate(self.df['bit_manufacturer']):
-            if current_value in mapping:
-                new_value = mapping[current_value]
-                if new_value != current_value:
-                    self.df.at[idx, 'bit_manufacturer'] = new_value
-                    changes_made += 1
+        # Apply rules to the distinct names and broadcast back
+        self.df['bit_manufacturer'], change_log = normalizer.normalize(self.df['bit_manufacturer'])
+        changes_made = int(change_log['rows'].sum())
+        
+        for change in change_log.itertuples():
+            print(f"  {change.original} → {change.normalized}: {change.rows:,} records")
         
         logger.info(f"✅ Enhanced cleanup applied: {changes_made:,} records changed")
         return changes_made
@@ -4,18 +4,21 @@ Look for columns that might contain actual field names rather than codes
 """
 
 import pandas as pd
-import oracledb
 import logging
+import sys
+from pathlib import Path
+
+# Add core directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'core'))
+from gdc_access import fetch_frame, shared_pool
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 def connect_to_gdc():
-    """Connect to GDC Oracle database"""
+    """Check out a session from the shared GDC pool"""
     try:
-        dsn = "WC-CGY-ORAP01:1521/PRD1"
-        connection = oracledb.connect(user='synergyro', password='synergyro', dsn=dsn)
-        return connection
+        return shared_pool().acquire()
     except Exception as e:
         logger.error(f"Connection failed: {e}")
         return None
@@ -37,7 +40,7 @@ def explore_all_columns():
         ORDER BY COLUMN_ID
         """
         
-        columns_df = pd.read_sql(query, connection)
+        columns_df = fetch_frame(connection, query)
         
         print("🔍 ALL GDC.WELL COLUMNS:")
         print("=" * 70)
@@ -80,7 +83,7 @@ def explore_all_columns():
                 FETCH FIRST 20 ROWS ONLY
                 """
                 
-                sample_df = pd.read_sql(sample_query, connection)
+                sample_df = fetch_frame(connection, sample_query)
                 for _, row in sample_df.iterrows():
                     value = str(row[col])
                     if len(value) > 40:
@@ -115,7 +118,7 @@ def explore_all_columns():
                 FETCH FIRST 10 ROWS ONLY
                 """
                 
-                pattern_df = pd.read_sql(pattern_query, connection)
+                pattern_df = fetch_frame(connection, pattern_query)
                 if not pattern_df.empty:
                     print("  ✅ Found potential field name matches:")
                     for _, row in pattern_df.iterrows():
@@ -127,7 +130,7 @@ def explore_all_columns():
                 print(f"  ❌ Error checking patterns in {col}: {e}")
     
     finally:
-        connection.close()
+        shared_pool().release(connection)
 
 if __name__ == "__main__":
     explore_all_columns()
@@ -6,6 +6,12 @@ Apply the safe, high-confidence license updates to the integrated dataset
 import pandas as pd
 from datetime import datetime
 import logging
+import sys
+from pathlib import Path
+
+# Add core directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'core'))
+from excel_readers import read_excel_sheet
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -15,11 +21,11 @@ def apply_safe_updates():
     print("=" * 35)
     
     # Load the integrated dataset
-    integrated_df = pd.read_excel('Output/Integrated_BitData_20250702_102059.xlsx')
+    integrated_df = read_excel_sheet('Output/Integrated_BitData_20250702_102059.xlsx')
     logger.info(f"📊 Loaded integrated dataset: {len(integrated_df):,} records")
     
     # Load safe lookup results
-    safe_results = pd.read_excel('Output/Safe_License_Lookup_Results_20250702_111951.xlsx')
+    safe_results = read_excel_sheet('Output/Safe_License_Lookup_Results_20250702_111951.xlsx')
     logger.info(f"🔍 Loaded safe lookup results: {len(safe_results):,} matches")
     
     missing_before = integrated_df['license_number'].isna().sum()
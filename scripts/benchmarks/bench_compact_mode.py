@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Compact Mode Benchmark
+Reports memory, aggregation timings and precision loss of the integrated frame with and without compact mode.
+
+Both frames get the configured storage types (categoricals, nullable
+strings); the compact frame additionally downcasts numeric fields to the
+float32/Int16 dtypes of DataMappingConfig's precision policies. Aggregates
+are compared against full precision, and a field with a value outside its
+declared range must be left at full precision.
+
+Usage:
+    python scripts/benchmarks/bench_compact_mode.py --rows 1000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from synthetic_data import make_ulterra_frame
+from universal_data_integration import DataIntegrationEngine, pack_record_ids
+from vector_ops import apply_precision_policies
+
+AGGREGATED_FIELDS = ['depth_in_m', 'distance_drilled_m', 'drilling_hours', 'rop_mhr', 'wob_high_dan', 'rpm_high']
+
+
+def time_queries(df: pd.DataFrame, repeats: int = 3) -> dict:
+    """Best-of-repeats timings of numeric aggregations like the analysis scripts run"""
+    queries = {
+        'operator x bit_class means': lambda: df.groupby(['operator', 'bit_class'], observed=True)[AGGREGATED_FIELDS].mean(),
+        'yearly footage by contractor': lambda: df.groupby(['contractor', 'run_year'], observed=True)['distance_drilled_m'].sum(),
+        'column describe': lambda: df[AGGREGATED_FIELDS].describe(),
+    }
+    timings = {}
+    for name, query in queries.items():
+        best = float('inf')
+        for _ in range(repeats):
+            start = time.perf_counter()
+            query()
+            best = min(best, time.perf_counter() - start)
+        timings[name] = best
+    return timings
+
+
+def check_range_guard(engine: DataIntegrationEngine) -> bool:
+    """An out-of-range value must keep its field at full precision"""
+    df = pd.DataFrame({'depth_in_m': [1200.0, 250_000.0], 'run_number': [1.0, 2.5], 'rop_mhr': [12.3, np.nan]})
+    kept = apply_precision_policies(df, engine.config.precision_policies)
+    ok = (set(kept) == {'depth_in_m', 'run_number'}
+          and df['depth_in_m'].dtype == np.float64 and df['rop_mhr'].dtype == np.float32)
+    print(f"   {'✅' if ok else '❌'} range guard kept {sorted(kept)} at full precision")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"📄 Building synthetic integrated frame ({args.rows:,} rows)...")
+    raw = make_ulterra_frame(args.rows)
+    raw['_data_source'] = 'ulterra'
+    raw['_record_id'] = pack_record_ids(0, len(raw))
+
+    engine = DataIntegrationEngine(use_cache=False)
+    integrated = engine._add_derived_fields(engine.standardize_data('ulterra', raw))
+    del raw
+
+    full = engine.apply_storage_types(integrated.copy(), report=False)
+    compact_engine = DataIntegrationEngine(use_cache=False, compact=True)
+    compact = compact_engine.apply_storage_types(integrated, report=False)
+    del integrated
+
+    print("\n🔍 Precision")
+    conformant = check_range_guard(compact_engine)
+    for field in compact_engine.config.precision_policies:
+        if field in compact.columns and compact[field].dtype != full[field].dtype:
+            reference = full[field].astype('float64')
+            error = (compact[field].astype('float64') - reference).abs() / reference.abs().clip(lower=1)
+            print(f"   {field:<20} {str(full[field].dtype):>8} → {str(compact[field].dtype):<8} "
+                  f"max error {error.max():.1e} (relative, or absolute below 1)")
+
+    full_means = full.groupby('operator', observed=True)[AGGREGATED_FIELDS].mean()
+    compact_means = compact.groupby('operator', observed=True)[AGGREGATED_FIELDS].mean()
+    drift = ((compact_means - full_means).abs() / full_means.abs().clip(lower=1)).max().max()
+    print(f"   per-operator means: max relative drift {drift:.1e}")
+
+    full_memory = full.memory_usage(deep=True).sum()
+    compact_memory = compact.memory_usage(deep=True).sum()
+    print("\n🗜️  Memory")
+    print(f"   storage types          {full_memory / 1024 ** 2:8.1f} MB")
+    print(f"   storage types+compact  {compact_memory / 1024 ** 2:8.1f} MB "
+          f"({(1 - compact_memory / full_memory) * 100:.0f}% less)")
+    policy_fields = [field for field in compact_engine.config.precision_policies if field in compact.columns]
+    full_numeric = full[policy_fields].memory_usage(index=False).sum()
+    compact_numeric = compact[policy_fields].memory_usage(index=False).sum()
+    print(f"   policy fields only     {full_numeric / 1024 ** 2:8.1f} MB → {compact_numeric / 1024 ** 2:.1f} MB "
+          f"({(1 - compact_numeric / full_numeric) * 100:.0f}% less, {len(policy_fields)} fields)")
+
+    full_timings = time_queries(full)
+    compact_timings = time_queries(compact)
+    print("\n🏁 Aggregation timings")
+    for name in full_timings:
+        print(f"   {name:<30} {full_timings[name]:6.3f}s → {compact_timings[name]:6.3f}s")
+
+    if not conformant:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
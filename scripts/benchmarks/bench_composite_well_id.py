@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Composite Well ID Benchmark
+Checks the vectorized composite_well_id against the legacy per-row builder and times both.
+
+Inputs mix the value shapes seen in integrated data: string and numeric
+license numbers, blanks, whitespace-only cells, missing values and a
+non-default row index (the UNK_ fallback embeds the row label).
+
+Usage:
+    python scripts/benchmarks/bench_composite_well_id.py --rows 500000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+import synthetic_data  # noqa: F401  (puts core/ on sys.path)
+from universal_data_integration import build_composite_well_ids
+
+
+def legacy_composite_well_ids(df: pd.DataFrame) -> list:
+    """The pre-vectorization iterrows implementation (reference)"""
+    def create_composite_well_id(row, idx):
+        if pd.notna(row.get('api_number')) and str(row.get('api_number', '')).strip():
+            return f"API_{row['api_number']}"
+        elif pd.notna(row.get('license_number')) and str(row.get('license_number', '')).strip():
+            return f"LIC_{row['license_number']}"
+        elif pd.notna(row.get('well_name')) and str(row.get('well_name', '')).strip():
+            return f"NAME_{row['well_name']}"
+        else:
+            return f"UNK_{idx}"
+
+    return [create_composite_well_id(row, idx) for idx, row in df.iterrows()]
+
+
+def make_identifier_frame(n_rows: int, seed: int = 7) -> pd.DataFrame:
+    """Identifier columns with the blanks, mixed types and gaps of real vendor data"""
+    rng = np.random.default_rng(seed)
+    license_pool = np.array(['0512345', 512346, '  ', '', None, pd.NA, 'W0512347', 512348.0, 'nan'], dtype=object)
+    name_pool = np.array(['OPERATOR HZ WELL 1', ' ', None, '100/01-02-003-04W5/00', 42, ''], dtype=object)
+    api_pool = np.array([None, None, None, '', '42-123-45678', 4212345678, np.nan], dtype=object)
+
+    df = pd.DataFrame({
+        'api_number': api_pool[rng.integers(0, len(api_pool), n_rows)],
+        'license_number': license_pool[rng.integers(0, len(license_pool), n_rows)],
+        'well_name': name_pool[rng.integers(0, len(name_pool), n_rows)],
+        'depth_in_m': rng.uniform(0, 5000, n_rows),
+    })
+    # Non-contiguous labels, as after filtering or sorting
+    df.index = rng.permutation(n_rows) * 3
+    return df
+
+
+def check_parity(df: pd.DataFrame) -> bool:
+    """Require identical ids across the full frame and the missing-column variants"""
+    variants = {
+        'all identifiers': df,
+        'no api_number': df.drop(columns=['api_number']),
+        'no identifier columns': df[['depth_in_m']],
+        'empty frame': df.iloc[:0],
+    }
+
+    ok = True
+    for variant, frame in variants.items():
+        expected = legacy_composite_well_ids(frame)
+        actual = build_composite_well_ids(frame).tolist()
+        if expected == actual:
+            print(f"   ✅ {variant}: {len(actual):,} ids match")
+        else:
+            ok = False
+            mismatches = [(e, a) for e, a in zip(expected, actual) if e != a][:5]
+            print(f"   ❌ {variant}: differs, e.g. {mismatches}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=500_000)
+    args = parser.parse_args()
+
+    print("🔍 Parity")
+    conformant = check_parity(make_identifier_frame(20_000))
+
+    print(f"\n🏁 Timing ({args.rows:,} rows)")
+    df = make_identifier_frame(args.rows)
+
+    start = time.perf_counter()
+    legacy_composite_well_ids(df)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    build_composite_well_ids(df)
+    vectorized_time = time.perf_counter() - start
+
+    print(f"   ⏱️  iterrows    {legacy_time:6.2f}s")
+    print(f"   ⏱️  vectorized  {vectorized_time:6.2f}s")
+    print(f"   🚀 speedup {legacy_time / vectorized_time:.0f}x")
+
+    if not conformant:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
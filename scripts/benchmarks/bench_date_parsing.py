@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Date Parsing Benchmark
+Times parse_dates against the legacy pd.to_datetime(errors='coerce') on Reed-like mixed date columns.
+
+Values mimic a Reed export: about 3,000 distinct days appearing as date cells
+(datetime objects), ISO text, text in a second layout and Excel serials,
+plus blanks and junk. Legacy inference keeps only text matching the layout
+of the first value; the script reports how many values each approach parses,
+checks they agree wherever legacy parses, and times an already-datetime column
+and text-only columns in three layouts.
+
+Usage:
+    python scripts/benchmarks/bench_date_parsing.py --rows 1000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+import synthetic_data  # noqa: F401  (puts core/ on sys.path)
+from date_parsing import EXCEL_SERIAL, EXCEL_EPOCH, parse_dates
+
+
+def make_mixed_dates(n_rows: int, seed: int = 3) -> pd.Series:
+    """Object column mixing date cells, two text layouts, Excel serials, blanks and junk"""
+    rng = np.random.default_rng(seed)
+    days = pd.Timestamp('2015-01-01') + pd.to_timedelta(rng.integers(0, 3_000, n_rows), unit='D')
+    kind = rng.integers(0, 20, n_rows)
+
+    values = np.empty(n_rows, dtype=object)
+    cells = kind < 8
+    values[cells] = days[cells].to_pydatetime()
+    iso = (kind >= 8) & (kind < 14)
+    values[iso] = days[iso].strftime('%Y-%m-%d')
+    other_layout = (kind >= 14) & (kind < 16)
+    values[other_layout] = days[other_layout].strftime('%d-%b-%Y')
+    serials = (kind >= 16) & (kind < 18)
+    values[serials] = ((days[serials] - EXCEL_EPOCH).days).astype(float)
+    values[kind == 18] = ''
+    values[kind == 19] = rng.choice(np.array(['TBD', 'n/a', None], dtype=object), (kind == 19).sum())
+    values[0] = '2016-05-04'  # legacy infers its format from the first value
+    return pd.Series(values)
+
+
+def best_time(func, repeats: int = 3):
+    """Best-of-repeats wall time and the last result"""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"📄 Building {args.rows:,} mixed date values...")
+    values = make_mixed_dates(args.rows)
+
+    legacy, legacy_time = best_time(lambda: pd.to_datetime(values, errors='coerce'))
+    (inferred, inferred_bad, inferred_format), inferred_time = best_time(lambda: parse_dates(values))
+    (serial, serial_bad, _), serial_time = best_time(lambda: parse_dates(values, EXCEL_SERIAL))
+    (cached, _, _), cached_time = best_time(lambda: parse_dates(values, inferred_format=inferred_format))
+
+    print("\n🔍 Parsed values")
+    print(f"   legacy to_datetime      {legacy.notna().sum():>9,} parsed")
+    print(f"   inferred ({inferred_format})  {inferred.notna().sum():>9,} parsed, {inferred_bad:,} unparseable")
+    print(f"   excel_serial declared   {serial.notna().sum():>9,} parsed, {serial_bad:,} unparseable")
+    parsed_by_legacy = legacy.notna()
+    conformant = legacy[parsed_by_legacy].equals(serial[parsed_by_legacy]) and cached.equals(inferred)
+    print(f"   {'✅' if conformant else '❌'} values {'agree' if conformant else 'DIFFER'} wherever legacy parses")
+
+    datetimes = serial.copy()
+    _, fast_time = best_time(lambda: parse_dates(datetimes))
+    _, legacy_fast_time = best_time(lambda: pd.to_datetime(datetimes, errors='coerce'))
+
+    print(f"\n🏁 Timing ({args.rows:,} rows)")
+    print(f"   ⏱️  legacy to_datetime      {legacy_time:6.3f}s")
+    print(f"   ⏱️  parse_dates (inferred)  {inferred_time:6.3f}s")
+    print(f"   ⏱️  parse_dates (cached)    {cached_time:6.3f}s")
+    print(f"   ⏱️  parse_dates (serials)   {serial_time:6.3f}s")
+    print(f"   ⏱️  datetime column: legacy {legacy_fast_time:6.4f}s, fast path {fast_time:6.4f}s")
+
+    days = pd.Series(serial.dropna().to_numpy())
+    print(f"\n🏁 Text-only columns ({len(days):,} dates)")
+    for layout in ['%Y-%m-%d', '%d/%m/%Y %H:%M', '%d-%b-%Y']:
+        text = days.dt.strftime(layout).astype(object)
+        legacy_text, legacy_text_time = best_time(lambda: pd.to_datetime(text, errors='coerce'), repeats=1)
+        (parsed_text, _, _), text_time = best_time(lambda: parse_dates(text), repeats=1)
+        parsed_by_legacy = legacy_text.notna()
+        agrees = legacy_text[parsed_by_legacy].equals(parsed_text[parsed_by_legacy])
+        conformant &= agrees
+        print(f"   {'✅' if agrees else '❌'} {layout:<16} legacy {legacy_text_time:6.3f}s "
+              f"({parsed_by_legacy.sum():>9,} parsed), parse_dates {text_time:6.3f}s "
+              f"({parsed_text.notna().sum():>9,} parsed)")
+
+    if not conformant:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
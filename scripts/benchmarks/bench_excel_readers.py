@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Excel Reader Engine Benchmark
+Checks that calamine and openpyxl produce identical frames, then times both.
+
+The workbook is a synthetic Ulterra "Bit Runs Export" (category header row,
+mapped columns plus unmapped filler) so the numbers reflect load_source_data.
+
+Usage:
+    python scripts/benchmarks/bench_excel_readers.py --rows 100000
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from synthetic_data import make_ulterra_frame, write_ulterra_workbook
+from data_mapping_config import DataMappingConfig
+from excel_readers import READER_ENGINES, engine_available, read_excel_sheet
+
+
+def check_conformance(path: Path, engines) -> bool:
+    """Read the workbook with every engine and require identical dtypes and values"""
+    config = DataMappingConfig().get_source_config('ulterra')
+    mapped = set(config.column_mappings.values())
+    read_variants = {
+        'full sheet': {},
+        'projected': {'usecols': lambda col: col in mapped},
+    }
+
+    ok = True
+    for variant, kwargs in read_variants.items():
+        frames = {
+            engine: read_excel_sheet(path, sheet_name=config.sheet_name, engine=engine,
+                                     skiprows=config.skip_rows, **kwargs)
+            for engine in engines
+        }
+        reference_engine, reference = next(iter(frames.items()))
+        for engine, df in list(frames.items())[1:]:
+            try:
+                pd.testing.assert_frame_equal(reference, df, check_exact=True)
+                print(f"   ✅ {variant}: {engine} matches {reference_engine} ({len(df.columns)} columns)")
+            except AssertionError as e:
+                ok = False
+                print(f"   ❌ {variant}: {engine} differs from {reference_engine}: {e}")
+    return ok
+
+
+def time_engines(path: Path, engines, repeats: int):
+    """Time a projected read of the mapped columns with each engine"""
+    config = DataMappingConfig().get_source_config('ulterra')
+    mapped = set(config.column_mappings.values())
+    results = {}
+
+    for engine in engines:
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            read_excel_sheet(path, sheet_name=config.sheet_name, engine=engine,
+                             skiprows=config.skip_rows, usecols=lambda col: col in mapped)
+            timings.append(time.perf_counter() - start)
+        results[engine] = min(timings)
+        print(f"   ⏱️  {engine:<10} best of {repeats}: {results[engine]:.2f}s")
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--workbook', type=Path, help="Reuse an existing Ulterra-shaped workbook")
+    args = parser.parse_args()
+
+    engines = [engine for engine in READER_ENGINES if engine_available(engine)]
+    print(f"🔧 Available reader engines: {engines}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.workbook
+        if path is None:
+            path = Path(tmp) / 'ulterra_synthetic.xlsx'
+            print(f"📄 Writing synthetic Ulterra workbook ({args.rows:,} rows)...")
+            write_ulterra_workbook(make_ulterra_frame(args.rows), path)
+
+        print("\n🔍 Conformance")
+        conformant = check_conformance(path, engines)
+
+        print("\n🏁 Timing")
+        results = time_engines(path, engines, args.repeats)
+        if 'calamine' in results and 'openpyxl' in results:
+            print(f"   🚀 calamine speedup: {results['openpyxl'] / results['calamine']:.1f}x")
+
+    if not conformant:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
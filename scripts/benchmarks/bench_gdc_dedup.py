@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+GDC Deduplication Benchmark
+Checks the vectorized UWI-priority deduplication against the code it replaced and times both.
+
+The legacy derivation (kept here as the reference) scored every row's UWI with
+a per-row apply and sorted the whole table by license, priority and UWI before
+drop_duplicates. The synthetic wells (bench_gdc_snapshot.make_gdc_wells) get
+UWIs of every priority class - 200/201/202, other 20x, old BC format, Alberta,
+short and missing - and licenses shared by up to four wells, including ties
+on priority and several missing UWIs for one license.
+
+Usage:
+    python scripts/benchmarks/bench_gdc_dedup.py --wells 1000000
+"""
+
+import argparse
+import logging
+
+import numpy as np
+import pandas as pd
+
+from bench_gdc_snapshot import make_gdc_wells, sorted_lookup, timed
+from gdc_enhancement import GDC_WELL_COLUMNS, GDCEnhancer, uwi_priority
+
+
+def legacy_uwi_priority(uwi):
+    """The per-row priority of the legacy derivation"""
+    if pd.isna(uwi):
+        return 9999
+    uwi_str = str(uwi)
+    if uwi_str.startswith('200'):
+        return 1
+    elif uwi_str.startswith('201'):
+        return 2
+    elif uwi_str.startswith('202'):
+        return 3
+    elif uwi_str.startswith('20') and len(uwi_str) == 16:
+        return 4
+    elif 'BC' in uwi_str:
+        return 5
+    elif uwi_str.startswith('1') and len(uwi_str) == 16:
+        return 6
+    else:
+        return 7
+
+
+class LegacyEnhancer(GDCEnhancer):
+    """GDCEnhancer with the apply + full sort deduplication"""
+
+    def derive_gdc_lookup(self, gdc_df: pd.DataFrame) -> pd.DataFrame:
+        lookup_columns = GDC_WELL_COLUMNS + ['WELL_NUM_TRIMMED']
+        gdc_df = self.trim_gdc_licenses(gdc_df).drop(
+            columns=[column for column in gdc_df.columns if column not in lookup_columns])
+        gdc_df = gdc_df[gdc_df['WELL_NUM_TRIMMED'].notna()].copy()
+        if gdc_df['WELL_NUM_TRIMMED'].duplicated().sum() > 0:
+            gdc_df['uwi_priority'] = gdc_df['UWI'].apply(legacy_uwi_priority)
+            gdc_df = gdc_df.sort_values(['WELL_NUM_TRIMMED', 'uwi_priority', 'UWI']).drop_duplicates(
+                subset=['WELL_NUM_TRIMMED'], keep='first')
+            gdc_df = gdc_df.drop(columns=['uwi_priority'])
+        return gdc_df
+
+
+def make_duplicated_wells(n_wells: int, seed: int = 29) -> pd.DataFrame:
+    """GDC wells with UWIs of every priority class and extra multi-well licenses"""
+    rng = np.random.default_rng(seed)
+    wells = make_gdc_wells(n_wells, seed=seed)
+    wells['PROVINCE_STATE'] = np.where(wells['PROVINCE_STATE'] == 'SK', 'AB', wells['PROVINCE_STATE'])
+
+    suffix = wells['UWI'].str[3:]
+    kind = rng.choice(np.arange(8), n_wells, p=[0.3, 0.1, 0.1, 0.05, 0.05, 0.35, 0.03, 0.02])
+    wells['UWI'] = np.select(
+        [kind == 1, kind == 2, kind == 3, kind == 4, kind == 5, kind == 6],
+        ['201' + suffix, '202' + suffix, '203' + suffix.str[:-1], '1BC' + suffix.str[:8],
+         '100' + suffix, suffix.str[:9]],
+        default=wells['UWI'])
+    wells.loc[kind == 7, 'UWI'] = None
+
+    # Mostly unique licenses (as in GDC), ~5% shared by an AB and a BC well, some by up to four wells
+    licenses = rng.permutation(n_wells) + 1
+    shared = rng.random(n_wells) < 0.05
+    licenses[shared] = licenses[np.roll(np.flatnonzero(shared), 1)]
+    wells['WELL_NUM'] = pd.Series(licenses).map('{:07d}'.format).where(wells['WELL_NUM'].notna())
+    extra = np.flatnonzero(rng.random(n_wells) < 0.01)
+    wells.loc[extra, 'WELL_NUM'] = wells['WELL_NUM'].to_numpy()[rng.choice(extra[: max(len(extra) // 3, 1)], len(extra))]
+    return wells
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--wells', type=int, default=1_000_000)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    print(f"📄 Building {args.wells:,} GDC wells...")
+    wells = make_duplicated_wells(args.wells)
+    checks = []
+
+    priorities = uwi_priority(wells['UWI'])
+    checks.append(('uwi_priority equals the per-row rules',
+                   np.array_equal(priorities, wells['UWI'].apply(legacy_uwi_priority).to_numpy())))
+
+    legacy_lookup, legacy_time = timed(lambda: LegacyEnhancer(use_snapshot=False).derive_gdc_lookup(wells))
+    enhancer = GDCEnhancer(use_snapshot=False)
+    lookup, vector_time = timed(lambda: enhancer.derive_gdc_lookup(wells))
+    checks.append(('lookup equals legacy deduplication', sorted_lookup(lookup).equals(sorted_lookup(legacy_lookup))))
+
+    # Audit rows are exactly the rows the legacy sort dropped, each naming its license's kept UWI
+    audit = enhancer.discarded_duplicates
+    valid = wells.index[enhancer.trim_gdc_licenses(wells)['WELL_NUM_TRIMMED'].notna()]
+    dropped = valid.difference(legacy_lookup.index)
+    kept_uwis = legacy_lookup.set_index('WELL_NUM_TRIMMED')['UWI']
+    checks.append(('audit table holds the discarded rows', audit.index.sort_values().equals(dropped.sort_values())))
+    checks.append(('audit rows name the kept UWI', audit['KEPT_UWI'].equals(audit['WELL_NUM_TRIMMED'].map(kept_uwis))))
+    checks.append(('audit priorities match', np.array_equal(audit['UWI_PRIORITY'].to_numpy(),
+                                                            priorities[wells.index.get_indexer(audit.index)])))
+
+    print("\n🔍 Checks")
+    for name, passed in checks:
+        print(f"   {'✅' if passed else '❌'} {name}")
+
+    duplicated = len(audit) + audit['WELL_NUM_TRIMMED'].nunique()
+    print(f"\n🏁 GDC lookup derivation ({args.wells:,} wells, {duplicated:,} rows on shared licenses, "
+          f"{len(audit):,} discarded)")
+    print(f"   ⏱️  legacy apply + full sort   {legacy_time:6.3f}s")
+    print(f"   ⏱️  vectorized duplicate subset {vector_time:6.3f}s  ({legacy_time / vector_time:4.1f}x)")
+
+    if not all(passed for _, passed in checks):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
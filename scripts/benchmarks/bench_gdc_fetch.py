@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+GDC Fetch Benchmark
+Times the full AB/BC GDC.WELL pull with pd.read_sql and with the batched fetch layer, and checks they agree.
+
+Uses the SQLite stand-in for GDC.WELL from bench_gdc_snapshot.py, which goes
+through the fetch layer's cursor path (arraysize + fetchmany); the Arrow path
+needs a python-oracledb connection. Peak memory is the tracemalloc peak of the
+fetch (Python objects and NumPy buffers), measured in a second, untimed run. A query whose column is missing
+for the first batches checks the batch dtype handling.
+
+Usage:
+    python scripts/benchmarks/bench_gdc_fetch.py --wells 300000
+"""
+
+import argparse
+import logging
+import time
+import tracemalloc
+
+import pandas as pd
+
+from bench_gdc_snapshot import make_database, make_gdc_wells
+from gdc_access import fetch_frame
+from gdc_enhancement import GDCEnhancer
+
+SPARSE_QUERY = """
+    SELECT UWI, CASE WHEN ROWID <= 2000 THEN NULL ELSE DRILL_TD END AS DRILL_TD,
+           CASE WHEN ROWID <= 2000 THEN NULL ELSE SPUD_DATE END AS SPUD_DATE
+    FROM GDC.WELL ORDER BY ROWID LIMIT 10000
+"""
+
+
+def measured(func):
+    """Run func untraced for the time, then under tracemalloc for the peak; returns (result, seconds, peak MB)"""
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    del result
+    tracemalloc.start()
+    result = func()
+    peak = tracemalloc.get_traced_memory()[1] / 1024 ** 2
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--wells', type=int, default=300_000)
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1_000, 10_000, 50_000])
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    print(f"📄 Building GDC.WELL with {args.wells:,} wells...")
+    database = make_database(make_gdc_wells(args.wells))
+    query = GDCEnhancer().well_query()
+    checks = []
+
+    expected, legacy_time, legacy_peak = measured(lambda: pd.read_sql(query, database))
+    results = []
+    for batch_size in args.batch_sizes:
+        actual, seconds, peak = measured(lambda: fetch_frame(database, query, batch_size=batch_size))
+        checks.append((f"batch size {batch_size:,} equals pd.read_sql", actual.equals(expected)))
+        results.append((batch_size, seconds, peak))
+
+    sparse = fetch_frame(database, SPARSE_QUERY, batch_size=500)
+    checks.append(("column missing in early batches gets read_sql's dtypes",
+                   sparse.equals(pd.read_sql(SPARSE_QUERY, database))))
+    empty = fetch_frame(database, query + " AND 1 = 0")
+    checks.append(('empty result keeps the columns', empty.empty and list(empty.columns) == list(expected.columns)))
+
+    print("\n🔍 Checks")
+    for name, passed in checks:
+        print(f"   {'✅' if passed else '❌'} {name}")
+
+    print(f"\n🏁 Full AB/BC pull ({len(expected):,} rows x {len(expected.columns)} columns; SQLite stand-in, no network)")
+    print(f"   ⏱️  pd.read_sql            {legacy_time:6.3f}s  peak {legacy_peak:7.1f} MB")
+    for batch_size, seconds, peak in results:
+        print(f"   ⏱️  fetch_frame {batch_size:>7,}    {seconds:6.3f}s  peak {peak:7.1f} MB "
+              f"({legacy_peak / peak:.1f}x less)")
+
+    if not all(passed for _, passed in checks):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+GDC Targeted Fetch Benchmark
+Compares fetching all AB/BC wells with fetching only the wells of the bit data's licenses.
+
+Uses the SQLite stand-in for GDC.WELL from bench_gdc_snapshot.py. The bit
+data holds a sample of GDC licenses (zero-padded and not), licenses GDC does
+not know and repeated runs per well. Targeted fetches must give the same
+lookup rows for those licenses as the full fetch - including with more
+licenses than one bind batch - and the same enhanced data, and the targeted
+statement must be able to search a WELL_NUM index. Some wells store their
+license zero-padded to 9 digits instead of 7. With snapshots on, auto runs
+must never fetch targeted: the first run pulls everything and builds the
+snapshot (so an offline run works after it), and --gdc-refresh and a
+snapshot due for a full refresh pull everything and rewrite it.
+
+Usage:
+    python scripts/benchmarks/bench_gdc_targeted_fetch.py --wells 300000 --licenses 3000
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from bench_gdc_snapshot import SQLiteEnhancer, make_database, make_gdc_wells, match_stats, sorted_lookup, timed
+from gdc_enhancement import GDCEnhancer
+
+
+def make_bit_data(wells: pd.DataFrame, n_licenses: int, seed: int = 29) -> pd.DataFrame:
+    """Bit runs for n_licenses GDC licenses plus 5% unknown licenses, 1-4 runs per license"""
+    rng = np.random.default_rng(seed)
+    known = wells['WELL_NUM'].dropna().drop_duplicates().sample(n_licenses, random_state=seed)
+    licenses = pd.concat([known.where(rng.random(n_licenses) < 0.5, known.str.lstrip('0')),
+                          pd.Series([f"9{i:08d}" for i in range(max(1, n_licenses // 20))])], ignore_index=True)
+    licenses = licenses.repeat(rng.integers(1, 5, len(licenses))).reset_index(drop=True)
+    return pd.DataFrame({
+        'license_number': licenses,
+        'uwi_number': None,
+        'longitude': rng.uniform(-125, -110, len(licenses)).round(6),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--wells', type=int, default=300_000)
+    parser.add_argument('--licenses', type=int, default=3_000, help="Distinct GDC licenses in the bit data")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    print(f"📄 Building GDC.WELL with {args.wells:,} wells and bit data for {args.licenses:,} licenses...")
+    wells = make_gdc_wells(args.wells)
+    repadded = np.random.default_rng(31).random(len(wells)) < 0.05
+    wells.loc[repadded, 'WELL_NUM'] = '00' + wells.loc[repadded, 'WELL_NUM']
+    database = make_database(wells)
+    bit_data = make_bit_data(wells, args.licenses)
+    checks = []
+
+    full = SQLiteEnhancer(database, use_snapshot=False, fetch_mode='full')
+    targeted = SQLiteEnhancer(database, use_snapshot=False, fetch_mode='targeted')
+    keys = bit_data['license_number'].map(full.trim_leading_zeros).dropna().unique().tolist()
+
+    (full_lookup, _), full_time = timed(lambda: full.load_gdc_lookup(keys))
+    full_stats = full.fetch_stats
+    (targeted_lookup, _), targeted_time = timed(lambda: targeted.load_gdc_lookup(keys))
+    targeted_stats = targeted.fetch_stats
+    expected = full_lookup[full_lookup['WELL_NUM_TRIMMED'].isin(keys)]
+    actual = targeted_lookup[targeted_lookup['WELL_NUM_TRIMMED'].isin(keys)]
+    checks.append((f"targeted lookup equals full lookup for the bit data's licenses "
+                   f"({len(keys):,} keys, {-(-len(targeted.license_forms(keys, [7, 9])) // 1000)} batches)",
+                   sorted_lookup(actual).equals(sorted_lookup(expected))))
+
+    # The bound column is compared bare, so an index on WELL_NUM serves each batch (no full scan)
+    database.execute("CREATE INDEX GDC.well_num ON WELL (WELL_NUM)")
+    plan = database.execute(f"EXPLAIN QUERY PLAN {targeted.well_query(license_binds=3)}",
+                            {f"k{i}": key for i, key in enumerate(keys[:3])}).fetchall()
+    checks.append(('targeted query searches the WELL_NUM index', any('well_num' in str(row) for row in plan)))
+
+    few = keys[:7]
+    (few_lookup, _) = SQLiteEnhancer(database, use_snapshot=False, fetch_mode='targeted').load_gdc_lookup(few)
+    checks.append(('single padded batch matches',
+                   sorted_lookup(few_lookup[few_lookup['WELL_NUM_TRIMMED'].isin(few)]).equals(
+                       sorted_lookup(full_lookup[full_lookup['WELL_NUM_TRIMMED'].isin(few)]))))
+
+    full_df, full_enhance_stats = SQLiteEnhancer(database, use_snapshot=False, fetch_mode='full').enhance_data(bit_data)
+    auto = SQLiteEnhancer(database, use_snapshot=False)
+    auto_df, auto_enhance_stats = auto.enhance_data(bit_data)
+    checks.append(('auto mode without snapshots picks targeted fetch', auto_enhance_stats.get('gdc_fetch_mode') == 'targeted'))
+    checks.append(('targeted enhancement equals full', 'error' not in auto_enhance_stats
+                   and auto_df.equals(full_df) and match_stats(auto_enhance_stats) == match_stats(full_enhance_stats)))
+
+    # Snapshot lifecycle: bootstrap, offline, forced refresh, then a snapshot due for a full refresh
+    snapshot_dir = Path(tempfile.mkdtemp(prefix='gdc_snapshot_'))
+    bootstrap = SQLiteEnhancer(database, snapshot_dir=snapshot_dir)
+    bootstrap_df, bootstrap_stats = bootstrap.enhance_data(bit_data)
+    checks.append(('first auto run pulls all wells and builds the snapshot',
+                   bootstrap_stats.get('gdc_fetch_mode') == 'full' and bootstrap.snapshot.exists(bootstrap.query_signature())))
+    offline_df, offline_stats = GDCEnhancer(snapshot_dir=snapshot_dir, offline=True).enhance_data(bit_data)
+    checks.append(('offline run after the bootstrap equals full', 'error' not in offline_stats
+                   and offline_df.equals(full_df) and match_stats(offline_stats) == match_stats(full_enhance_stats)))
+    _, refresh_stats = SQLiteEnhancer(database, snapshot_dir=snapshot_dir, refresh=True).enhance_data(bit_data)
+    checks.append(('refresh pulls all wells', refresh_stats.get('gdc_fetch_mode') == 'full'))
+    due = SQLiteEnhancer(database, snapshot_dir=snapshot_dir, snapshot_ttl_hours=0)
+    due.snapshot.full_refresh_interval = timedelta(0)
+    full_refresh_before = due.snapshot.stamp.full_refresh_at
+    time.sleep(1)  # stamps have second resolution
+    due_df, due_stats = due.enhance_data(bit_data)
+    checks.append(('auto run due for a full refresh pulls all wells and rewrites the snapshot',
+                   due_stats.get('gdc_fetch_mode') == 'full' and due_df.equals(full_df)
+                   and due.snapshot.stamp.full_refresh_at > full_refresh_before))
+
+    print("\n🔍 Checks")
+    for name, passed in checks:
+        print(f"   {'✅' if passed else '❌'} {name}")
+
+    print(f"\n🏁 GDC fetch ({args.wells:,} wells, {len(keys):,} distinct bit-data licenses; SQLite stand-in, no network)")
+    for name, stats, seconds in (('full', full_stats, full_time), ('targeted', targeted_stats, targeted_time)):
+        print(f"   ⏱️  {name:<9} {seconds:6.3f}s  {stats['gdc_rows_fetched']:>9,} rows  "
+              f"{stats['gdc_bytes_transferred'] / 1024 ** 2:7.1f} MB"
+              f"{'' if stats['gdc_bytes_measured'] else ' (estimated)'}")
+    reduction = full_stats['gdc_bytes_transferred'] / max(targeted_stats['gdc_bytes_transferred'], 1)
+    print(f"   📉 targeted fetch transfers {reduction:.0f}x less data")
+
+    if not all(passed for _, passed in checks):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Identifier Normalization Benchmark
+Times the legacy object-string cleanup against normalize_identifiers on mixed identifier values.
+
+Values mimic license numbers as Excel delivers them: zero-padded strings,
+numeric cells read as floats (12345.0), padded whitespace and blanks.
+Besides time and peak traced allocations, the script reports how the legacy
+chain and the kernel differ on the value shapes the kernel is meant to fix,
+and times the same cleanup written with object-dtype string methods.
+
+Usage:
+    python scripts/benchmarks/bench_identifiers.py --rows 1000000
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+import synthetic_data  # noqa: F401  (puts core/ on sys.path)
+from vector_ops import NULL_IDENTIFIER_TOKENS, normalize_identifiers
+
+
+def legacy_identifier_cleanup(values: pd.Series) -> pd.Series:
+    """The previous cleanup chain (reference)"""
+    values = values.astype('object').fillna('').astype(str)
+    return values.replace('nan', pd.NA)
+
+
+def object_identifier_cleanup(values: pd.Series) -> pd.Series:
+    """normalize_identifiers' cleanup as object-dtype string methods (like-for-like timing)"""
+    text = values.astype(str).where(values.notna(), None).str.strip()
+    text = text.str.replace(r'^(-?\d+)\.0$', r'\1', regex=True)
+    return text.mask(text.str.lower().isin(NULL_IDENTIFIER_TOKENS))
+
+
+def make_identifiers(n_rows: int, seed: int = 11) -> pd.Series:
+    """License-number-like values in the mix of types and formatting real exports have"""
+    rng = np.random.default_rng(seed)
+    numbers = rng.integers(1, 999_999, n_rows)
+    shape = rng.integers(0, 10, n_rows)
+
+    values = np.empty(n_rows, dtype=object)
+    values[:] = [f"{n:07d}" for n in numbers]  # zero-padded string
+    floats = shape < 3
+    values[floats] = numbers[floats].astype(float)  # numeric cell read as float
+    padded = shape == 3
+    values[padded] = [f" {n:07d} " for n in numbers[padded]]
+    values[shape == 4] = None
+    values[shape == 5] = ''
+    return pd.Series(values)
+
+
+def measure(func, values: pd.Series, repeats: int = 3):
+    """Best-of-repeats wall time, then one run under tracemalloc for peak allocations"""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func(values)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    func(values)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, min(timings), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"📄 Building {args.rows:,} identifiers...")
+    values = make_identifiers(args.rows)
+
+    legacy, legacy_time, legacy_peak = measure(legacy_identifier_cleanup, values, args.repeats)
+    objects, objects_time, objects_peak = measure(object_identifier_cleanup, values, args.repeats)
+    kernel, kernel_time, kernel_peak = measure(normalize_identifiers, values, args.repeats)
+
+    print("\n🔍 Output differences (legacy → kernel)")
+    changed = legacy.astype(object).where(legacy.notna(), None) != kernel.astype(object).where(kernel.notna(), None)
+    examples = pd.DataFrame({'input': values, 'legacy': legacy, 'kernel': kernel})[changed]
+    print(f"   {changed.sum():,} of {len(values):,} values differ, e.g.:")
+    for _, row in examples.drop_duplicates(subset=['legacy']).head(4).iterrows():
+        print(f"      {row['input']!r:>14} : {row['legacy']!r} → {row['kernel']!r}")
+
+    matches_objects = objects.astype(object).where(objects.notna(), None).equals(
+        kernel.astype(object).where(kernel.notna(), None))
+    print(f"   {'✅' if matches_objects else '❌'} kernel {'matches' if matches_objects else 'differs from'} "
+          f"the object-dtype cleanup")
+
+    print("\n🏁 Timing")
+    print(f"   ⏱️  legacy   {legacy_time:6.2f}s   peak alloc {legacy_peak / 1024 ** 2:7.1f} MB   "
+          f"result {legacy.memory_usage(deep=True) / 1024 ** 2:6.1f} MB ({legacy.dtype})")
+    print(f"   ⏱️  object   {objects_time:6.2f}s   peak alloc {objects_peak / 1024 ** 2:7.1f} MB   "
+          f"result {objects.memory_usage(deep=True) / 1024 ** 2:6.1f} MB ({objects.dtype})")
+    print(f"   ⏱️  kernel   {kernel_time:6.2f}s   peak alloc {kernel_peak / 1024 ** 2:7.1f} MB   "
+          f"result {kernel.memory_usage(deep=True) / 1024 ** 2:6.1f} MB ({kernel.dtype})")
+
+    if not matches_objects:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
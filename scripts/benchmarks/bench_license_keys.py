@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+License Key Benchmark
+Checks trim_license_numbers and the int64 join keys against the per-value trimming and string join, and times them.
+
+The reference is trim_license_number (GDCEnhancer.trim_leading_zeros before
+the kernel, applied per row with .apply). Parity is checked on hand-written
+edge cases (blanks, null tokens, float text, signs, dots, non-ASCII digits,
+control characters) and on random strings over a license-like alphabet.
+Timings use GDC.WELL-like WELL_NUM values and bit-data licenses stored as
+ints, floats and zero-padded strings; the GDC enhancement output must be
+the same with string and integer join keys.
+
+Usage:
+    python scripts/benchmarks/bench_license_keys.py --wells 500000 --runs 300000
+"""
+
+import argparse
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+
+from bench_gdc_snapshot import SQLiteEnhancer, make_database, make_gdc_wells
+from vector_ops import integer_join_keys, trim_license_number, trim_license_numbers
+
+EDGE_CASES = [
+    None, np.nan, pd.NA, pd.NaT, '', ' ', 'nan', 'NaN', 'None', ' none ',
+    '0', '00', '000', '0.0', '0000.000', '-0.0', '.0', '-.0', '0.', '.', '-', '..', '1..0', '.-.',
+    '0012.0', '12.', '12.50', '12.5', '1.2.3', '1-2.0', '-5.0', '-5', '+123', '+12.0', '12 .0',
+    '123', '  0123 ', '\t0123\n', 'AB0123', '0A12', '00-12', 'W0123', '0x1A', '1_000', '1e5', '1e+20',
+    '123456789012345.0', '1234567890123456.0', '12345678901234567890.0', '000000000000000000000012.0',
+    '99999999999999999999', '０１２３', '²', 'é', '123\x1c', '12.0\x00',
+    12345.0, 0.0, 123, 0, -7, 1e20, 1.5, True,
+]
+
+
+def random_licenses(n_values: int, seed: int = 5) -> pd.Series:
+    """Random short strings over digits, dots, signs, letters and whitespace"""
+    rng = np.random.default_rng(seed)
+    alphabet = np.array(list('0000123456789..-- aA\t'))
+    lengths = rng.integers(0, 9, n_values)
+    return pd.Series([''.join(rng.choice(alphabet, length)) for length in lengths], dtype=object)
+
+
+def make_bit_licenses(wells: pd.DataFrame, n_runs: int, seed: int = 3) -> pd.Series:
+    """Bit-run licenses: GDC licenses as ints, floats (Excel numeric cells) and padded strings, some blank"""
+    rng = np.random.default_rng(seed)
+    licenses = wells['WELL_NUM'].dropna().sample(n_runs, replace=True, random_state=seed).to_numpy(dtype=object)
+    shape = rng.integers(0, 10, n_runs)
+    numbers = np.array([int(value) for value in licenses], dtype=np.int64)
+    values = licenses.copy()
+    values[shape < 3] = numbers[shape < 3]
+    values[(shape >= 3) & (shape < 5)] = numbers[(shape >= 3) & (shape < 5)].astype(float)
+    values[shape == 5] = None
+    return pd.Series(values, dtype=object)
+
+
+def same_keys(expected: pd.Series, actual: pd.Series) -> bool:
+    return expected.astype(object).where(expected.notna(), None).equals(actual)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--wells', type=int, default=500_000)
+    parser.add_argument('--runs', type=int, default=300_000)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+    checks = []
+
+    edge_cases = pd.Series(EDGE_CASES, dtype=object)
+    checks.append((f"edge cases ({len(edge_cases)})",
+                   same_keys(edge_cases.map(trim_license_number), trim_license_numbers(edge_cases))))
+    fuzz = random_licenses(200_000)
+    checks.append((f"random license-like strings ({len(fuzz):,})",
+                   same_keys(fuzz.map(trim_license_number), trim_license_numbers(fuzz))))
+    floats = pd.Series([12345.0, np.nan, 7.0, 0.0, 1e16, 2.5])
+    checks.append(('float64 column', same_keys(floats.map(trim_license_number), trim_license_numbers(floats))))
+
+    keys = trim_license_numbers(pd.concat([edge_cases, fuzz[:2_000]], ignore_index=True))
+    left, right = integer_join_keys(keys, keys[::-1].reset_index(drop=True))
+    equal_keys = keys.to_numpy(dtype=object)[:, None] == keys[::-1].to_numpy(dtype=object)[None, :]
+    both_missing = keys.isna().to_numpy()[:, None] & keys[::-1].isna().to_numpy()[None, :]
+    checks.append(('int64 keys equal exactly when trimmed keys are equal',
+                   np.array_equal(left[:, None] == right[None, :], equal_keys | both_missing)))
+
+    print(f"📄 Building {args.wells:,} GDC wells and {args.runs:,} bit-run licenses...")
+    wells = make_gdc_wells(args.wells)
+    bit_licenses = make_bit_licenses(wells, args.runs)
+
+    timings = []
+    for name, values in (('GDC WELL_NUM', wells['WELL_NUM']), ('bit data license_number', bit_licenses)):
+        expected, legacy_time = timed(lambda column: column.apply(trim_license_number), values)
+        actual, kernel_time = timed(trim_license_numbers, values)
+        checks.append((f"{name} trimmed the same", same_keys(expected, actual)))
+        timings.append((f"trim {name}", legacy_time, kernel_time))
+
+    bit_df = pd.DataFrame({'license_number_trimmed': trim_license_numbers(bit_licenses)})
+    lookup = pd.DataFrame({'WELL_NUM_TRIMMED': trim_license_numbers(wells['WELL_NUM'])}).dropna()
+    lookup = lookup.drop_duplicates().assign(match=1)
+    string_merged, string_time = timed(lambda: bit_df.merge(
+        lookup, left_on='license_number_trimmed', right_on='WELL_NUM_TRIMMED', how='left'))
+
+    def integer_merge():
+        left_keys, right_keys = integer_join_keys(bit_df['license_number_trimmed'], lookup['WELL_NUM_TRIMMED'])
+        return bit_df.assign(license_join_key=left_keys).merge(
+            lookup.assign(license_join_key=right_keys), on='license_join_key', how='left')
+    integer_merged, integer_time = timed(integer_merge)
+    checks.append(('integer join matches the string join',
+                   string_merged.equals(integer_merged.drop(columns='license_join_key'))))
+    timings.append(('merge (keys + join)', string_time, integer_time))
+
+    database = make_database(wells)
+    sample = pd.DataFrame({'license_number': bit_licenses[:20_000], 'uwi_number': None, 'longitude': -115.0})
+    string_df, string_stats = SQLiteEnhancer(database, use_snapshot=False, fetch_mode='full').enhance_data(sample)
+    integer_df, integer_stats = SQLiteEnhancer(database, use_snapshot=False, fetch_mode='full',
+                                               integer_keys=True).enhance_data(sample)
+    checks.append(('enhancement output equal with string and integer keys', 'error' not in integer_stats
+                   and integer_df.equals(string_df) and integer_stats == string_stats))
+
+    print("\n🔍 Checks")
+    for name, passed in checks:
+        print(f"   {'✅' if passed else '❌'} {name}")
+
+    print(f"\n🏁 License keys ({args.wells:,} wells, {args.runs:,} bit runs)")
+    print(f"   {'':<34} {'before':>8} {'after':>8}")
+    for name, legacy_time, kernel_time in timings:
+        print(f"   ⏱️  {name:<31} {legacy_time:7.3f}s {kernel_time:7.3f}s  ({legacy_time / kernel_time:4.1f}x)")
+
+    if not all(passed for _, passed in checks):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Manufacturer Normalizer Benchmark
+Checks each manufacturer rule set against the code it replaced and times both.
+
+The legacy implementations (kept here as references) are the integration
+step's Series.replace with a hard-coded dict plus value_counts bookkeeping,
+and the analysis scripts' per-record loops writing changes with df.at. The
+synthetic column mixes every legacy alias, case and whitespace variants,
+unmapped names, blanks and missing values.
+
+Usage:
+    python scripts/benchmarks/bench_manufacturer_normalizer.py --rows 1000000
+"""
+
+import argparse
+import time
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+import synthetic_data  # noqa: F401  (puts core/ on sys.path)
+from manufacturer_normalizer import ManufacturerNormalizer
+
+LEGACY_STANDARD = {
+    'BH': 'BAKER HUGHES', 'NOV': 'REED HYCALOG', 'ULT': 'ULTERRA', 'SLB': 'SCHLUMBERGER',
+    'HAL': 'HALLIBURTON', 'SHR': 'SHEAR BITS', 'DF': 'DRILFORMANCE', 'OTH': 'OTHER',
+    'TRX': 'TAUREX', 'VAR': 'VAREL INTERNATIONAL', 'KD': 'KING DREAM', 'HAC': 'BAKER HUGHES',
+    'DRM': 'DREAM', 'REEDHYCALOG': 'REED HYCALOG', 'NATIONAL OILWELL VARCO': 'REED HYCALOG',
+    'HUGHES CHRISTENSEN': 'BAKER HUGHES', 'SMITH BITS': 'SMITH',
+    'SECURITY DIAMANT BOART STRATABIT': 'HALLIBURTON', 'J AND L SUPPLY CO. LTD.': 'J&L SUPPLY',
+    'KITTERS BIT SUPPLY': 'KITTERS',
+}
+
+LEGACY_CLEANUP = {
+    'NOV': 'Reed', 'Reed Hycalog': 'Reed', 'Reed': 'Reed', 'REED': 'Reed', 'reed': 'Reed',
+    'NOV/Reed': 'Reed', 'Reed/NOV': 'Reed',
+    'Schlumberger': 'Smith', 'Smith': 'Smith', 'SMITH': 'Smith', 'smith': 'Smith', 'Smith Bits': 'Smith',
+    'Smith International': 'Smith', 'Schlumberger/Smith': 'Smith', 'Smith/Schlumberger': 'Smith',
+    'Halliburton': 'Security', 'Security': 'Security', 'SECURITY': 'Security', 'security': 'Security',
+    'Security DBS': 'Security', 'Halliburton/Security': 'Security', 'Security/Halliburton': 'Security',
+    'Baker Hughes': 'Baker Hughes', 'BAKER HUGHES': 'Baker Hughes', 'baker hughes': 'Baker Hughes',
+    'BHI': 'Baker Hughes', 'Hughes': 'Baker Hughes',
+    'Ulterra': 'Ulterra', 'ULTERRA': 'Ulterra', 'ulterra': 'Ulterra',
+    'Varel': 'Varel', 'VAREL': 'Varel', 'varel': 'Varel',
+    'Kingdream': 'Kingdream', 'KINGDREAM': 'Kingdream', 'kingdream': 'Kingdream',
+    'Bit Brokers': 'Bit Brokers', 'BIT BROKERS': 'Bit Brokers', 'bit brokers': 'Bit Brokers',
+    'National Oilwell': 'Reed', 'National': 'Reed',
+    'Unknown': 'Unknown', 'UNKNOWN': 'Unknown', '': 'Unknown',
+}
+
+LEGACY_CONSOLIDATION = {
+    'REEDHYCALOG': 'Reed', 'Reed': 'Reed', 'NOV': 'Reed', 'SMITH BITS': 'Smith', 'SLB': 'Smith',
+    'SECURITY DIAMANT BOART STRATABIT': 'Security', 'HAL': 'Security',
+    'HUGHES CHRISTENSEN': 'Baker Hughes', 'BH': 'Baker Hughes', 'Ulterra': 'Ulterra', 'ULT': 'Ulterra',
+    'VAREL INTERNATIONAL': 'Varel', 'VAR': 'Varel', 'KING DREAM': 'Kingdream', 'KD': 'Kingdream',
+    'DRILFORMANCE': 'Drilformance', 'DF': 'Drilformance', 'SHEAR BITS': 'Shear Bits', 'SHR': 'Shear Bits',
+    'J AND L SUPPLY CO. LTD.': 'J&L Supply', 'TAUREX': 'Taurex', 'TRX': 'Taurex', 'TRENDON': 'Trendon',
+    'SANDVIK': 'Sandvik', 'KITTERS BIT SUPPLY': 'Kitters Bit Supply', 'HAC': 'HAC', 'DRM': 'DRM',
+    'OTHER': 'Other', 'OTH': 'Other', 'Unknown': 'Unknown', 'UNKNOWN': 'Unknown',
+}
+
+
+def make_manufacturer_column(n_rows: int, seed: int = 11) -> pd.Series:
+    """Every legacy alias plus padded variants, unmapped names, blanks and missing values"""
+    rng = np.random.default_rng(seed)
+    vocabulary = sorted(set(LEGACY_STANDARD) | set(LEGACY_CLEANUP) | set(LEGACY_CONSOLIDATION))
+    vocabulary += [f" {name} " for name in vocabulary[:10]] + ['TRENDON', 'Sandvik', 'Acme Bits', '  ']
+    values = rng.choice(np.array(vocabulary + [None], dtype=object), n_rows)
+    values[rng.random(n_rows) < 0.02] = np.nan
+    return pd.Series(values)
+
+
+def legacy_standard(values: pd.Series) -> Tuple[pd.Series, int]:
+    """The integration step before the rule file: replace + value_counts bookkeeping"""
+    original_values = values.value_counts()
+    result = values.replace(LEGACY_STANDARD)
+    conversions = sum(original_values[name] for name, mapped in LEGACY_STANDARD.items()
+                      if name in original_values and name != mapped)
+    return result, conversions
+
+
+def legacy_cleanup(values: pd.Series) -> Tuple[pd.Series, int]:
+    """cleanup_bit_manufacturers.py: stripped per-record lookup, written back with df.at"""
+    df = pd.DataFrame({'bit_manufacturer': values})
+    changes = 0
+    for idx, original_value in enumerate(df['bit_manufacturer']):
+        if pd.isna(original_value):
+            standardized = 'Unknown'
+        else:
+            original_str = str(original_value).strip()
+            standardized = LEGACY_CLEANUP.get(original_str, original_str)
+        if str(standardized) != str(original_value):
+            df.at[idx, 'bit_manufacturer'] = standardized
+            changes += 1
+    return df['bit_manufacturer'], changes
+
+
+def legacy_consolidation(values: pd.Series) -> Tuple[pd.Series, int]:
+    """enhanced_manufacturer_cleanup.py: exact per-record lookup, written back with df.at"""
+    df = pd.DataFrame({'bit_manufacturer': values})
+    changes = 0
+    for idx, current_value in enumerate(df['bit_manufacturer']):
+        if current_value in LEGACY_CONSOLIDATION:
+            new_value = LEGACY_CONSOLIDATION[current_value]
+            if new_value != current_value:
+                df.at[idx, 'bit_manufacturer'] = new_value
+                changes += 1
+    return df['bit_manufacturer'], changes
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"📄 Building {args.rows:,} manufacturer names...")
+    values = make_manufacturer_column(args.rows)
+
+    cases = [
+        ('standard', legacy_standard),
+        ('cleanup', legacy_cleanup),
+        ('consolidation', legacy_consolidation),
+    ]
+
+    conformant = True
+    print(f"\n🏁 Rule sets ({args.rows:,} rows, {values.nunique(dropna=False)} distinct values)")
+    for rule_set, legacy in cases:
+        (expected, expected_changes), legacy_time = timed(legacy, values.copy())
+        normalizer = ManufacturerNormalizer(rule_set)
+        (actual, change_log), engine_time = timed(normalizer.normalize, values)
+
+        # Missing values compare equal whatever their sentinel (None / NaN)
+        same_values = expected.fillna('<missing>').astype(object).equals(actual.fillna('<missing>').astype(object))
+        same_changes = expected_changes == change_log['rows'].sum()
+        conformant &= same_values and same_changes
+        status = '✅' if same_values and same_changes else '❌'
+        print(f"   {status} {rule_set:<14} legacy {legacy_time:7.3f}s, normalizer {engine_time:6.3f}s "
+              f"({legacy_time / engine_time:5.0f}x), {expected_changes:,} rows changed "
+              f"({len(change_log)} change log entries)")
+
+    if not conformant:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
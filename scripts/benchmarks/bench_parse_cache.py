@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Parse Cache Round-Trip Benchmark
+Checks that a parse cache hit and an incremental partition return the frame a
+cold parse produces, and that integrating from a warm cache gives the same
+output as integrating without it, then times the cold parse against the cache hit.
+
+The workbook is a synthetic Ulterra "Bit Runs Export", whose license numbers
+are a mix of ints and zero-padded strings. A second frame holds the other
+mixed object columns Excel produces (ints with floats, dates with text,
+booleans with blanks, Decimals). Equality covers values, the missing mask and
+the Python type of every value, so a NaN blank read back as None is a mismatch.
+
+Usage:
+    python scripts/benchmarks/bench_parse_cache.py --rows 100000
+"""
+
+import argparse
+import datetime as dt
+import tempfile
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from bench_gdc_snapshot import timed
+from synthetic_data import make_ulterra_frame, write_ulterra_workbook
+from parse_cache import file_fingerprint, read_parquet_frame, write_parquet_frame
+from run_manifest import RunManifest
+from universal_data_integration import DataIntegrationEngine
+
+
+def frames_identical(expected: pd.DataFrame, actual: pd.DataFrame) -> bool:
+    """Equal values and dtypes, the same missing cells and the same Python type for every value (blanks included)"""
+    try:
+        pd.testing.assert_frame_equal(expected, actual, check_exact=True)
+    except AssertionError as e:
+        print(f"   {e}")
+        return False
+
+    for col in expected.columns:
+        if expected[col].dtype != object:
+            continue
+        present = expected[col].notna().to_numpy()
+        if not np.array_equal(present, actual[col].notna().to_numpy()):
+            return False
+        expected_types = [type(value) for value in expected[col].to_numpy()]
+        actual_types = [type(value) for value in actual[col].to_numpy()]
+        if expected_types != actual_types:
+            print(f"   {col}: Python types differ")
+            return False
+    return True
+
+
+def make_mixed_frame(n_rows: int, seed: int = 11) -> pd.DataFrame:
+    """Object columns whose values Parquet cannot store as one Arrow type"""
+    rng = np.random.default_rng(seed)
+    pick = rng.random(n_rows)
+    ints = rng.integers(0, 10_000, n_rows)
+    dates = pd.Timestamp('2020-01-01') + pd.to_timedelta(rng.integers(0, 1500, n_rows), unit='D')
+
+    def mixed(*choices):
+        values = pd.Series([None] * n_rows, dtype=object)
+        for (low, high), make in choices:
+            rows = np.flatnonzero((pick >= low) & (pick < high))
+            values[rows] = [make(i) for i in rows]
+        return values
+
+    return pd.DataFrame({
+        'license': mixed(((0, 0.5), lambda i: int(ints[i])), ((0.5, 0.95), lambda i: f"{ints[i]:07d}")),
+        'depth': mixed(((0, 0.6), lambda i: int(ints[i])), ((0.6, 0.97), lambda i: ints[i] / 7)),
+        'run_date': mixed(((0, 0.7), lambda i: dates[i].to_pydatetime()), ((0.7, 0.9), lambda i: 'TBD')),
+        'rig_start': mixed(((0, 0.8), lambda i: dt.time(int(ints[i]) % 24, 30))),
+        'flag': mixed(((0, 0.45), lambda i: True), ((0.45, 0.9), lambda i: False)),
+        'tfa': mixed(((0, 0.9), lambda i: Decimal(int(ints[i])) / 100), ((0.9, 0.95), lambda i: 'n/a')),
+        'operator': mixed(((0, 0.9), lambda i: f"OPERATOR {ints[i] % 40}")),
+        'blank': mixed(),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100_000)
+    args = parser.parse_args()
+    checks = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        path = tmp / 'ulterra_synthetic.xlsx'
+        print(f"📄 Writing synthetic Ulterra workbook ({args.rows:,} rows)...")
+        write_ulterra_workbook(make_ulterra_frame(args.rows), path)
+
+        engine = DataIntegrationEngine(base_path=tmp, parallel_load=False, cache_dir=tmp / 'cache')
+        cold, cold_time = timed(lambda: engine.load_source_data('ulterra', [path]))
+        cached, hit_time = timed(lambda: engine.load_source_data('ulterra', [path]))
+        checks.append(('cache hit equals cold parse (Ulterra workbook)', frames_identical(cold, cached)))
+
+        standardized = engine.standardize_data('ulterra', cold)
+        manifest = RunManifest(tmp / 'manifest')
+        manifest.write_partition('ulterra', path, file_fingerprint(path), 'signature', standardized, 0)
+        checks.append(('partition equals standardized frame',
+                       frames_identical(standardized, manifest.read_partition(path))))
+
+        # Integrate the same input without the cache and from a warm cache
+        input_dir = tmp / 'Input' / 'Ulterra'
+        input_dir.mkdir(parents=True)
+        (tmp / 'core').mkdir()
+        path.rename(input_dir / path.name)
+        uncached = DataIntegrationEngine(base_path=tmp / 'core', parallel_load=False, use_cache=False)
+        expected = uncached.integrate_all_sources(['ulterra'])
+        for _ in range(2):
+            warm = DataIntegrationEngine(base_path=tmp / 'core', parallel_load=False, cache_dir=tmp / 'integration_cache')
+            actual = warm.integrate_all_sources(['ulterra'])
+        checks.append(('warm-cache integration equals uncached integration',
+                       not expected.empty and frames_identical(expected, actual)))
+
+        mixed = make_mixed_frame(args.rows)
+        write_parquet_frame(mixed, tmp / 'mixed.parquet')
+        checks.append(('mixed object columns round-trip', frames_identical(mixed, read_parquet_frame(tmp / 'mixed.parquet'))))
+
+    print("\n🔍 Checks")
+    for name, passed in checks:
+        print(f"   {'✅' if passed else '❌'} {name}")
+
+    print(f"\n🏁 Ulterra sheet ({args.rows:,} rows)")
+    print(f"   ⏱️  cold parse  {cold_time:6.2f}s")
+    print(f"   ⏱️  cache hit   {hit_time:6.2f}s  ({cold_time / hit_time:4.1f}x)")
+
+    if not all(passed for _, passed in checks):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Pipeline Memory Benchmark
+Compares peak RSS of standardization + derived fields with in-place stages against per-stage copies.
+
+The copying variant reproduces the previous engine, where every stage began
+with df.copy(). Each variant runs in its own subprocess; after the input is
+built the peak resident set size is reset (Linux /proc/self/clear_refs) and
+its growth over the current RSS is reported. The run also checks that the caller's
+input frame is left unmodified and that both variants produce the same frame.
+
+Usage:
+    python scripts/benchmarks/bench_pipeline_memory.py --rows 500000
+"""
+
+import argparse
+import gc
+import json
+import subprocess
+import sys
+import time
+import warnings
+from pathlib import Path
+
+import pandas as pd
+
+from synthetic_data import make_ulterra_frame
+from universal_data_integration import DataIntegrationEngine, pack_record_ids
+
+# Steps that did not copy before either: the column plan builds a new frame, storage types cast in place
+NON_COPYING_STEPS = {'column_plan', 'storage_types'}
+
+
+class CopyingEngine(DataIntegrationEngine):
+    """The previous stage behaviour: each stage starts from its own copy (reference)"""
+
+    def _run_step(self, step_name, source_name, func, df, *args):
+        if step_name not in NON_COPYING_STEPS:
+            df = df.copy()
+        return super()._run_step(step_name, source_name, func, df, *args)
+
+    def _create_improved_bit_size_categories(self, df):
+        return super()._create_improved_bit_size_categories(df.copy())
+
+
+def rss_mb(field: str) -> float:
+    """VmRSS (current) or VmHWM (peak) of this process from /proc/self/status, in MB"""
+    with open('/proc/self/status') as status:
+        for line in status:
+            if line.startswith(field + ':'):
+                return int(line.split()[1]) / 1024
+    raise RuntimeError(f"{field} not available")
+
+
+def reset_peak_rss():
+    """Reset VmHWM to the current RSS so the next peak excludes building the input"""
+    gc.collect()
+    with open('/proc/self/clear_refs', 'w') as clear_refs:
+        clear_refs.write('5')
+
+
+def run_variant(variant: str, n_rows: int, output: Path):
+    """Run one variant in this process and report its timing and memory as JSON"""
+    raw = make_ulterra_frame(n_rows)
+    raw['_data_source'] = 'ulterra'
+    raw['_record_id'] = pack_record_ids(0, len(raw))
+    snapshot = raw.copy(deep=True) if output else None
+    reset_peak_rss()
+    input_rss = rss_mb('VmRSS')
+
+    engine = (CopyingEngine if variant == 'copying' else DataIntegrationEngine)(use_cache=False)
+    with warnings.catch_warnings():
+        # Writes to a view of the caller's frame would surface as SettingWithCopyWarning
+        warnings.simplefilter('error', pd.errors.SettingWithCopyWarning)
+        start = time.perf_counter()
+        result = engine._add_derived_fields(engine.standardize_data('ulterra', raw))
+        elapsed = time.perf_counter() - start
+
+    report = {'seconds': elapsed, 'input_rss_mb': input_rss, 'peak_rss_mb': rss_mb('VmHWM')}
+    if output:
+        report['input_unchanged'] = raw.equals(snapshot)
+        result.to_pickle(output)
+    print(json.dumps(report))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=500_000)
+    parser.add_argument('--variant', choices=['copying', 'in-place'], help=argparse.SUPPRESS)
+    parser.add_argument('--output', type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.variant:
+        run_variant(args.variant, args.rows, args.output)
+        return
+
+    reports = {}
+    for variant in ['copying', 'in-place']:
+        print(f"📄 {variant}: standardizing {args.rows:,} synthetic rows in a subprocess...")
+        completed = subprocess.run(
+            [sys.executable, __file__, '--rows', str(args.rows), '--variant', variant],
+            capture_output=True, text=True, check=True
+        )
+        reports[variant] = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    print("\n🔍 Parity (20,000 rows)")
+    outputs = {}
+    for variant in ['copying', 'in-place']:
+        output = Path(f"/tmp/bench_pipeline_memory_{variant}.pkl")
+        completed = subprocess.run(
+            [sys.executable, __file__, '--rows', '20000', '--variant', variant, '--output', str(output)],
+            capture_output=True, text=True, check=True
+        )
+        outputs[variant] = (pd.read_pickle(output), json.loads(completed.stdout.strip().splitlines()[-1]))
+        output.unlink()
+
+    conformant = outputs['copying'][0].equals(outputs['in-place'][0])
+    print(f"   {'✅' if conformant else '❌'} in-place stages {'match' if conformant else 'differ from'} the copying stages")
+    for variant, (_, report) in outputs.items():
+        unchanged = report['input_unchanged']
+        conformant &= unchanged
+        print(f"   {'✅' if unchanged else '❌'} {variant}: caller's input frame {'unchanged' if unchanged else 'MODIFIED'}")
+
+    print("\n🏁 Peak RSS")
+    for variant, report in reports.items():
+        growth = report['peak_rss_mb'] - report['input_rss_mb']
+        print(f"   {variant:<9} {report['seconds']:6.2f}s   input {report['input_rss_mb']:7.0f} MB   "
+              f"peak {report['peak_rss_mb']:7.0f} MB   growth {growth:7.0f} MB")
+    copying_growth = reports['copying']['peak_rss_mb'] - reports['copying']['input_rss_mb']
+    in_place_growth = reports['in-place']['peak_rss_mb'] - reports['in-place']['input_rss_mb']
+    print(f"   📉 {(1 - in_place_growth / copying_growth) * 100:.0f}% less peak growth")
+
+    if not conformant:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Standardization Benchmark
+Compares the compiled column plan against the legacy column-by-column build.
+
+The legacy path grew an empty DataFrame one column at a time and copied the
+result again before type conversion; the compiled plan selects, renames and
+reindexes in one step and converts in place. Both paths must produce identical
+frames; time and peak traced allocations are reported for each.
+
+Usage:
+    python scripts/benchmarks/bench_standardize.py --rows 500000
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from synthetic_data import make_ulterra_frame
+from universal_data_integration import METADATA_COLUMNS, DataIntegrationEngine, pack_record_ids
+from vector_ops import normalize_identifiers
+
+LEGACY_DATE_FIELDS = ['run_date', 'spud_date', 'td_date', 'file_modified_date']
+LEGACY_NUMERIC_FIELDS = [
+    'bit_size_mm', 'run_number', 'depth_in_m', 'depth_out_m',
+    'distance_drilled_m', 'total_depth_m', 'drilling_hours',
+    'on_bottom_hours', 'rop_mhr', 'latitude', 'longitude'
+]
+LEGACY_STRING_FIELDS = ['license_number', 'bit_serial_number', 'uwi_number', 'uwi_formatted', 'well_name']
+
+
+def legacy_standardize(engine: DataIntegrationEngine, df: pd.DataFrame, source_name: str) -> pd.DataFrame:
+    """The pre-plan column-by-column build and copy (reference); conversions match the engine's"""
+    source_config = engine.config.get_source_config(source_name)
+    standardized_df = pd.DataFrame()
+
+    for standard_field, source_column in source_config.column_mappings.items():
+        if source_column in df.columns:
+            standardized_df[standard_field] = df[source_column].copy()
+        else:
+            standardized_df[standard_field] = np.nan
+
+    for source_column, standard_field in METADATA_COLUMNS.items():
+        standardized_df[standard_field] = df[source_column]
+
+    df = standardized_df.copy()
+    for field in LEGACY_DATE_FIELDS:
+        if field in df.columns:
+            df[field] = pd.to_datetime(df[field], errors='coerce')
+    for field in LEGACY_NUMERIC_FIELDS:
+        if field in df.columns:
+            df[field] = pd.to_numeric(df[field], errors='coerce')
+    for field in LEGACY_STRING_FIELDS:
+        if field in df.columns:
+            df[field] = normalize_identifiers(df[field])
+    return df
+
+
+def planned_standardize(engine: DataIntegrationEngine, df: pd.DataFrame, source_name: str) -> pd.DataFrame:
+    """The engine's compiled-plan path (without vendor-specific normalization)"""
+    return engine._apply_dtype_targets(engine._apply_column_plan(df, source_name), source_name)
+
+
+def measure(func, *args, repeats: int = 3):
+    """Best-of-repeats wall time, then one run under tracemalloc for peak allocations"""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func(*args)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, min(timings), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=500_000)
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"📄 Building synthetic Ulterra frame ({args.rows:,} rows)...")
+    raw = make_ulterra_frame(args.rows)
+    raw['_data_source'] = 'ulterra'
+    raw['_record_id'] = pack_record_ids(0, len(raw))
+
+    engine = DataIntegrationEngine(use_cache=False)
+    engine.compile_column_plan('ulterra')
+
+    legacy, legacy_time, legacy_peak = measure(legacy_standardize, engine, raw, 'ulterra', repeats=args.repeats)
+    planned, planned_time, planned_peak = measure(planned_standardize, engine, raw, 'ulterra', repeats=args.repeats)
+
+    print("\n🔍 Parity")
+    try:
+        pd.testing.assert_frame_equal(legacy, planned)
+        print(f"   ✅ Compiled plan matches legacy build ({len(planned.columns)} columns)")
+        conformant = True
+    except AssertionError as e:
+        print(f"   ❌ Compiled plan differs from legacy build: {e}")
+        conformant = False
+
+    print("\n🏁 Timing")
+    print(f"   ⏱️  legacy   {legacy_time:6.2f}s   peak alloc {legacy_peak / 1024 ** 2:8.1f} MB")
+    print(f"   ⏱️  planned  {planned_time:6.2f}s   peak alloc {planned_peak / 1024 ** 2:8.1f} MB")
+    print(f"   🚀 speedup {legacy_time / planned_time:.1f}x, "
+          f"{(1 - planned_peak / legacy_peak) * 100:.0f}% less peak allocation")
+
+    if not conformant:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Storage Type Benchmark
+Reports memory and groupby/value_counts timings of an integrated frame before and after storage types.
+
+The frame is a synthetic Ulterra export run through standardization and
+derived fields, i.e. what integrate_all_sources() holds before the storage
+dtypes declared in DataMappingConfig (categorical for low-cardinality
+fields) are applied.
+
+Usage:
+    python scripts/benchmarks/bench_storage_types.py --rows 500000
+"""
+
+import argparse
+import time
+
+import pandas as pd
+
+from synthetic_data import make_ulterra_frame
+from universal_data_integration import DataIntegrationEngine, pack_record_ids
+
+
+def time_queries(df: pd.DataFrame, repeats: int = 3) -> dict:
+    """Best-of-repeats timings of the aggregations the summaries and reports run"""
+    queries = {
+        'source summary groupby': lambda: df.groupby('data_source', observed=True).agg(
+            unique_operators=('operator', 'nunique'), avg_rop=('rop_mhr', 'mean')),
+        'manufacturer value_counts': lambda: df['bit_manufacturer'].value_counts(),
+        'contractor x bit_class groupby': lambda: df.groupby(['contractor', 'bit_class'], observed=True).size(),
+    }
+    timings = {}
+    for name, query in queries.items():
+        best = float('inf')
+        for _ in range(repeats):
+            start = time.perf_counter()
+            query()
+            best = min(best, time.perf_counter() - start)
+        timings[name] = best
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=500_000)
+    args = parser.parse_args()
+
+    print(f"📄 Building synthetic integrated frame ({args.rows:,} rows)...")
+    raw = make_ulterra_frame(args.rows)
+    raw['_data_source'] = 'ulterra'
+    raw['_record_id'] = pack_record_ids(0, len(raw))
+
+    engine = DataIntegrationEngine(use_cache=False)
+    integrated = engine._add_derived_fields(engine.standardize_data('ulterra', raw))
+
+    before_memory = integrated.memory_usage(deep=True)
+    before_timings = time_queries(integrated)
+
+    typed = engine.apply_storage_types(integrated.copy(), report=False)
+    after_memory = typed.memory_usage(deep=True)
+    after_timings = time_queries(typed)
+
+    print("\n🗜️  Memory by storage-typed field")
+    for field in engine.config.get_storage_types():
+        if field in typed.columns:
+            print(f"   {field:<22} {before_memory[field] / 1024 ** 2:8.1f} MB → {after_memory[field] / 1024 ** 2:7.1f} MB")
+    print(f"   {'TOTAL (frame)':<22} {before_memory.sum() / 1024 ** 2:8.1f} MB → {after_memory.sum() / 1024 ** 2:7.1f} MB")
+
+    print("\n🏁 Query timings")
+    for name in before_timings:
+        print(f"   {name:<32} {before_timings[name]:6.3f}s → {after_timings[name]:6.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Unit Conversion Benchmark
+Checks the vectorized unit conversion against a per-row reference and times both.
+
+The synthetic source delivers depths in feet, ROP in ft/hr, weight on bit in
+klbf and flow in lpm, and mixes inch and millimetre bit sizes in one column
+(sizes below 30 are inches), with missing values throughout.
+
+Usage:
+    python scripts/benchmarks/bench_unit_conversion.py --rows 1000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+import synthetic_data  # noqa: F401  (puts core/ on sys.path)
+from data_mapping_config import DataMappingConfig, UnitRule
+from unit_conversion import conversion_factor, convert_units
+
+FIELD_UNITS = {
+    'depth_in_m': 'ft',
+    'depth_out_m': 'ft',
+    'rop_mhr': 'ft/hr',
+    'wob_high_dan': 'klbf',
+    'flow_high_gpm': 'lpm',
+    'bit_size_mm': 'mm',
+}
+UNIT_RULES = [UnitRule('bit_size_mm', 'in', below=30)]
+STANDARD_UNITS = DataMappingConfig().get_field_units()
+
+
+def make_imperial_frame(n_rows: int, seed: int = 5) -> pd.DataFrame:
+    """Measurements in the declared source units, ~2% missing per column"""
+    rng = np.random.default_rng(seed)
+    inch_sizes = np.array([6.125, 6.75, 8.75, 9.875, 12.25])
+    mm_sizes = np.array([155.6, 171.5, 222.3, 250.8, 311.2])
+    df = pd.DataFrame({
+        'depth_in_m': rng.uniform(0, 15_000, n_rows).round(1),
+        'depth_out_m': rng.uniform(100, 20_000, n_rows).round(1),
+        'rop_mhr': rng.uniform(5, 300, n_rows).round(2),
+        'wob_high_dan': rng.uniform(5, 60, n_rows).round(1),
+        'flow_high_gpm': rng.uniform(1_000, 4_000, n_rows).round(0),
+        'bit_size_mm': np.where(rng.random(n_rows) < 0.3, rng.choice(inch_sizes, n_rows), rng.choice(mm_sizes, n_rows)),
+    })
+    for column in df.columns:
+        df.loc[rng.random(n_rows) < 0.02, column] = np.nan
+    return df
+
+
+def per_row_convert(df: pd.DataFrame) -> pd.DataFrame:
+    """Reference: decide the unit and convert value by value"""
+    standard_units = STANDARD_UNITS
+    result = df.copy()
+    for field, unit in FIELD_UNITS.items():
+        def convert(value):
+            if pd.isna(value):
+                return np.nan
+            source_unit = unit
+            for rule in UNIT_RULES:
+                if rule.field == field and (rule.below is None or value < rule.below) \
+                        and (rule.above is None or value > rule.above):
+                    source_unit = rule.unit
+                    break
+            return value * conversion_factor(source_unit, standard_units[field])
+        result[field] = [convert(value) for value in df[field]]
+    return result
+
+
+def vectorized_convert(df: pd.DataFrame) -> pd.DataFrame:
+    result = df.copy()
+    convert_units(result, STANDARD_UNITS, FIELD_UNITS, UNIT_RULES)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"📄 Building {args.rows:,} rows in imperial / mixed units...")
+    df = make_imperial_frame(args.rows)
+
+    start = time.perf_counter()
+    expected = per_row_convert(df)
+    per_row_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = vectorized_convert(df)
+    vectorized_time = time.perf_counter() - start
+
+    print("\n🔍 Parity")
+    try:
+        pd.testing.assert_frame_equal(expected, actual, check_exact=False, rtol=1e-12)
+        print(f"   ✅ vectorized conversion matches per-row reference ({len(FIELD_UNITS)} fields)")
+        conformant = True
+    except AssertionError as e:
+        print(f"   ❌ vectorized conversion differs: {e}")
+        conformant = False
+    inch_rows = (df['bit_size_mm'] < 30).sum()
+    print(f"   📏 {inch_rows:,} bit sizes detected as inches")
+
+    print(f"\n🏁 Timing ({args.rows:,} rows, {len(FIELD_UNITS)} fields)")
+    print(f"   ⏱️  per-row     {per_row_time:6.2f}s")
+    print(f"   ⏱️  vectorized  {vectorized_time:6.3f}s")
+    print(f"   🚀 speedup {per_row_time / vectorized_time:.0f}x")
+
+    if not conformant:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Synthetic Vendor Data for Benchmarks
+Builds frames and workbooks shaped like the Ulterra "Bit Runs Export" sheet.
+
+Columns follow the Ulterra SourceConfig.column_mappings, plus unmapped filler
+columns so projection has something to skip. Values mimic the real exports:
+license numbers stored as a mix of ints and zero-padded strings, blank cells,
+Excel dates and vendor abbreviations for manufacturers/contractors.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+CORE_DIR = Path(__file__).resolve().parents[2] / 'core'
+if str(CORE_DIR) not in sys.path:
+    sys.path.insert(0, str(CORE_DIR))
+
+from data_mapping_config import DataMappingConfig
+
+MANUFACTURERS = ['BH', 'NOV', 'ULT', 'SLB', 'HAL', 'SHR', 'DF', 'OTH', 'VAR', 'HAC', 'SMITH BITS']
+CONTRACTORS = ['ENSIGN', 'PRECISION DRILLING', 'Akita Drilling', 'savanna', 'FOX DRILLING INC.', None]
+DULL_CODES = ['0', '1', '2', '3', 'I', 'IN', 'WT', 'BT', 'CT', None]
+
+
+def make_ulterra_frame(n_rows: int, seed: int = 42, filler_columns: int = 40) -> pd.DataFrame:
+    """Build a raw Ulterra-shaped frame (source column names, pre-standardization)"""
+    rng = np.random.default_rng(seed)
+    mappings = DataMappingConfig().get_source_config('ulterra').column_mappings
+
+    def with_blanks(values, fraction=0.05):
+        values = pd.Series(values, dtype=object)
+        values[rng.random(n_rows) < fraction] = None
+        return values
+
+    licenses = rng.integers(1, 600000, n_rows)
+    padded = rng.random(n_rows) < 0.5
+    license_values = [f"{lic:07d}" if pad else int(lic) for lic, pad in zip(licenses, padded)]
+
+    columns = {
+        'WellName': with_blanks([f"WHITECAP HZ {i % 5000} {i % 37}-{i % 29}-{i % 70}-{i % 26}W5" for i in range(n_rows)]),
+        'WellNumber': with_blanks([f"1{i % 100:02d}{(i * 7) % 10000:04d}{i % 1000:03d}W{i % 6}00" for i in range(n_rows)]),
+        'APINumber': with_blanks(license_values),
+        'OperatorName': rng.choice(['WHITECAP RESOURCES', 'ARC', 'TOURMALINE', 'OVV'], n_rows),
+        'ContractorName': with_blanks(rng.choice(CONTRACTORS, n_rows)),
+        'RigNumber': with_blanks(rng.integers(1, 900, n_rows)),
+        'Field': rng.choice(['MONTNEY', 'DUVERNAY', 'CARDIUM', 'VIKING'], n_rows),
+        'Latitude': rng.uniform(49.0, 60.0, n_rows),
+        'Longitude': rng.uniform(-125.0, -110.0, n_rows),
+        'SEC': rng.integers(1, 37, n_rows),
+        'TWP': rng.integers(1, 127, n_rows),
+        'Rge': rng.integers(1, 30, n_rows),
+        'LSD': rng.integers(1, 17, n_rows),
+        'BitMfgr': with_blanks(rng.choice(MANUFACTURERS, n_rows)),
+        'SerialNo': with_blanks([f"{s:08d}" if s % 3 else f"A{s}" for s in rng.integers(1, 10**8, n_rows)]),
+        'BitSize (mm)': np.round(rng.choice([155.6, 171.5, 200.0, 222.3, 251.0, 311.2, 349.3, 120.0, 400.0], n_rows), 1),
+        'BitType': rng.choice(['PDC', 'TCI', 'HYBRID'], n_rows),
+        'IADC': rng.choice(['M223', 'S323', '517'], n_rows),
+        'BitStyle': rng.choice(['U613M', 'SDi513', 'TD506X'], n_rows),
+        'BladeCount': rng.integers(3, 10, n_rows),
+        'CutterSize': rng.choice(['13', '16', '19'], n_rows),
+        'TFA (mm²)': rng.uniform(300, 900, n_rows),
+        'RunDate': pd.Timestamp('2018-01-01') + pd.to_timedelta(rng.integers(0, 2500, n_rows), unit='D'),
+        'SpudDate': pd.Timestamp('2018-01-01') + pd.to_timedelta(rng.integers(0, 2500, n_rows), unit='D'),
+        'Depth In (m)': rng.uniform(0, 3000, n_rows).round(1),
+        'Depth Out (m)': rng.uniform(3000, 6500, n_rows).round(1),
+        'Depth Drilled (m)': rng.uniform(10, 3500, n_rows).round(1),
+        'Drilling Hours': rng.uniform(1, 150, n_rows).round(2),
+        'ROP (m/hr)': rng.uniform(5, 120, n_rows).round(2),
+        'WOB_Low (daN)': rng.uniform(2000, 8000, n_rows).round(0),
+        'WOB_High (daN)': rng.uniform(8000, 20000, n_rows).round(0),
+        'SurfaceRPM_Low': rng.integers(40, 80, n_rows),
+        'SurfaceRPM_High': rng.integers(80, 200, n_rows),
+        'Flow_Low (gpm)': rng.uniform(300, 500, n_rows).round(0),
+        'Flow_High (gpm)': rng.uniform(500, 900, n_rows).round(0),
+        'Inner': with_blanks(rng.choice(DULL_CODES, n_rows)),
+        'Outer': with_blanks(rng.choice(DULL_CODES, n_rows)),
+        'Location': with_blanks(rng.choice(['A', 'N', 'S', 'C'], n_rows)),
+        'Gauge': with_blanks(rng.choice(['I', 'IN', '1', '2'], n_rows)),
+        'Reason Pulled': with_blanks(rng.choice(['TD', 'PR', 'HR', 'BHA'], n_rows)),
+        'Dull': with_blanks(rng.choice(DULL_CODES, n_rows)),
+        'TDFormation': rng.choice(['MONTNEY', 'DUVERNAY', 'BELLOY'], n_rows),
+    }
+    missing = set(mappings.values()) - set(columns)
+    assert not missing, f"synthetic frame is missing mapped columns: {missing}"
+
+    for i in range(filler_columns):
+        columns[f"Unmapped_{i:02d}"] = rng.uniform(0, 1, n_rows) if i % 2 else rng.choice(['x', 'y', 'z'], n_rows)
+
+    return pd.DataFrame(columns)
+
+
+def write_ulterra_workbook(df: pd.DataFrame, path: Path) -> Path:
+    """Write a frame as an Ulterra export: a category header row above the real header"""
+    config = DataMappingConfig().get_source_config('ulterra')
+    engine = 'xlsxwriter' if _has_module('xlsxwriter') else 'openpyxl'
+
+    with pd.ExcelWriter(path, engine=engine) as writer:
+        categories = pd.DataFrame([['Category'] * len(df.columns)])
+        categories.to_excel(writer, sheet_name=config.sheet_name, index=False, header=False)
+        df.to_excel(writer, sheet_name=config.sheet_name, index=False, startrow=config.skip_rows)
+
+    return path
+
+
+def _has_module(name: str) -> bool:
+    import importlib.util
+    return importlib.util.find_spec(name) is not None
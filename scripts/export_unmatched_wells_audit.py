@@ -8,6 +8,11 @@ import pandas as pd
 from pathlib import Path
 import logging
 from datetime import datetime
+import sys
+
+# Add core directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'core'))
+from excel_readers import read_excel_sheet
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -28,7 +33,7 @@ def load_missing_license_records():
     logger.info(f"Loading data from: {latest_file.name}")
     
     # Load the data
-    df = pd.read_excel(latest_file)
+    df = read_excel_sheet(latest_file)
     
     # Filter to records missing license numbers
     missing_licenses = df[
@@ -54,8 +59,8 @@ def load_lookup_results():
     
     # Load both sheets
     try:
-        recommendations = pd.read_excel(latest_file, sheet_name='Recommendations')
-        well_matches = pd.read_excel(latest_file, sheet_name='Well_Name_Matches')
+        recommendations = read_excel_sheet(latest_file, sheet_name='Recommendations')
+        well_matches = read_excel_sheet(latest_file, sheet_name='Well_Name_Matches')
         return recommendations, well_matches
     except Exception as e:
         logger.error(f"Error loading lookup results: {e}")
@@ -7,6 +7,7 @@ Checks the actual column names in the new Ulterra file against our configured ma
 import pandas as pd
 from pathlib import Path
 from data_mapping_config import DataMappingConfig
+from excel_readers import list_sheet_names, read_excel_sheet
 import glob
 
 def analyze_ulterra_file():
@@ -26,6 +27,7 @@ def analyze_ulterra_file():
     print(f"📄 File pattern: {ulterra_config.file_pattern}")
     print(f"📋 Sheet name: {ulterra_config.sheet_name}")
     print(f"⏭️  Skip rows: {ulterra_config.skip_rows}")
+    reader_engine = ulterra_config.reader_engine or config.default_reader_engine
     
     # Find Ulterra files
     ulterra_path = Path(ulterra_config.folder_path)
@@ -48,33 +50,34 @@ def analyze_ulterra_file():
     
     try:
         # First, let's see what sheets are available
-        excel_file = pd.ExcelFile(file_path)
+        sheet_names = list_sheet_names(file_path, engine=reader_engine)
         print(f"\n📋 Available sheets:")
-        for i, sheet in enumerate(excel_file.sheet_names):
+        for i, sheet in enumerate(sheet_names):
             print(f"  {i+1}. {sheet}")
         
         # Try to read the configured sheet
         target_sheet = ulterra_config.sheet_name
-        if target_sheet not in excel_file.sheet_names:
+        if target_sheet not in sheet_names:
             print(f"\n❌ Target sheet '{target_sheet}' not found!")
-            print("Available sheets:", excel_file.sheet_names)
+            print("Available sheets:", sheet_names)
             return
         
         print(f"\n📖 Reading sheet: '{target_sheet}'")
         
         # Read with no skip rows first to see raw structure
         print("\n🔍 RAW FILE STRUCTURE (first 5 rows):")
-        raw_df = pd.read_excel(file_path, sheet_name=target_sheet, nrows=5)
+        raw_df = read_excel_sheet(file_path, sheet_name=target_sheet, engine=reader_engine, nrows=5)
         print("Columns:", list(raw_df.columns))
         print("\nFirst few rows:")
         print(raw_df.to_string(index=False))
         
         # Now read with configured skip_rows
         print(f"\n📊 READING WITH skip_rows={ulterra_config.skip_rows}:")
-        df = pd.read_excel(file_path, 
-                          sheet_name=target_sheet, 
-                          skiprows=ulterra_config.skip_rows,
-                          nrows=3)  # Just get a few rows for verification
+        df = read_excel_sheet(file_path,
+                              sheet_name=target_sheet,
+                              engine=reader_engine,
+                              skiprows=ulterra_config.skip_rows,
+                              nrows=3)  # Just get a few rows for verification
         
         actual_columns = list(df.columns)
         print(f"\n✅ Found {len(actual_columns)} columns after skipping {ulterra_config.skip_rows} rows")
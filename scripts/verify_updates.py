@@ -1,8 +1,14 @@
 import pandas as pd
+import sys
+from pathlib import Path
+
+# Add core directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'core'))
+from excel_readers import read_excel_sheet
 
 # Load both datasets
-original = pd.read_excel('Output/Integrated_BitData_20250702_102059.xlsx')
-updated = pd.read_excel('Output/Integrated_BitData_SafeUpdated_20250702_112148.xlsx')
+original = read_excel_sheet('Output/Integrated_BitData_20250702_102059.xlsx')
+updated = read_excel_sheet('Output/Integrated_BitData_SafeUpdated_20250702_112148.xlsx')
 
 print('VERIFICATION OF SAFE UPDATES:')
 print('=' * 32)